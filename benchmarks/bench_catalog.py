@@ -0,0 +1,51 @@
+"""Compare local catalog lookups against the Exa path (stubbed client, fixed latency).
+
+Run with:
+
+    python benchmarks/bench_catalog.py --movies 200000 --exa-latency 0.25
+"""
+
+import argparse
+import random
+import time
+
+from common import StubExa, synthetic_movies, timed
+
+from movie_recommender_agent.cache import ResultCache
+from movie_recommender_agent.catalog import MovieCatalog
+from movie_recommender_agent.exa_tools import CachedExaTools
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--movies", type=int, default=200_000, help="Synthetic catalog size")
+    parser.add_argument("--queries", type=int, default=1_000, help="Catalog lookups to time")
+    parser.add_argument("--exa-queries", type=int, default=10, help="Stubbed Exa searches to time")
+    parser.add_argument("--exa-latency", type=float, default=0.25, help="Simulated Exa round trip (seconds)")
+    args = parser.parse_args()
+
+    records = list(synthetic_movies(args.movies))
+    start = time.perf_counter()
+    catalog = MovieCatalog.from_records(records)
+    print(f"ingest: {args.movies:,} movies in {time.perf_counter() - start:.2f}s")
+
+    rng = random.Random(1)
+    titles = [record["primaryTitle"] for record in rng.sample(records, args.queries)]
+
+    lookup_time, _ = timed(lambda: [catalog.lookup(title) for title in titles])
+    search_time, _ = timed(catalog.search, genres=["Thriller", "Drama"], year_from=2010, director=None, repeat=100)
+
+    exa = CachedExaTools(cache=ResultCache(), api_key="benchmark")
+    exa.exa = StubExa(args.exa_latency)
+    exa_time, _ = timed(lambda: [exa.search_exa(f"{title} movie details") for title in titles[: args.exa_queries]])
+
+    per_lookup = lookup_time / len(titles)
+    per_exa = exa_time / args.exa_queries
+    print(f"catalog lookup:          {per_lookup * 1e6:10.1f} µs/query")
+    print(f"catalog genre+year scan: {search_time * 1e6:10.1f} µs/query")
+    print(f"exa search (stubbed):    {per_exa * 1e6:10.1f} µs/query")
+    print(f"speedup:                 {per_exa / per_lookup:10.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Training time, scoring latency and fold-in cost of the collaborative-filtering model.
+
+Runs on synthetic ratings where users mostly rate movies of their own taste group; the
+hit rate checks that a held-out liked movie comes back in the top-k. Run with:
+
+    python benchmarks/bench_collaborative.py --ratings 1000000 --users 100000 --movies 20000
+"""
+
+import argparse
+import time
+
+import numpy as np
+from common import synthetic_ratings, timed
+
+from movie_recommender_agent.collaborative import CollaborativeModel
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ratings", type=int, default=1_000_000, help="Synthetic ratings")
+    parser.add_argument("--users", type=int, default=100_000, help="Distinct users")
+    parser.add_argument("--movies", type=int, default=20_000, help="Distinct movies")
+    parser.add_argument("--factors", type=int, default=64, help="Latent factors")
+    parser.add_argument("--iterations", type=int, default=10, help="ALS iterations")
+    parser.add_argument("--queries", type=int, default=500, help="Users scored one at a time")
+    parser.add_argument("--k", type=int, default=10, help="Recommendations per user")
+    args = parser.parse_args()
+
+    ratings = synthetic_ratings(args.ratings, args.users, args.movies)
+    # Hold out one liked movie of some users to measure the hit rate
+    rng = np.random.default_rng(5)
+    held_out: dict[str, str] = {}
+    for position in rng.choice(len(ratings), args.queries, replace=False):
+        user, movie, stars = ratings[position]
+        if stars >= 4 and user not in held_out:
+            held_out[user] = movie
+    train = [rating for rating in ratings if held_out.get(rating[0]) != rating[1]]
+
+    start = time.perf_counter()
+    model = CollaborativeModel.fit(train, factors=args.factors, iterations=args.iterations)
+    print(
+        f"training: {model.n_users:,} users x {model.n_movies:,} movies, {len(train):,} ratings, "
+        f"{args.iterations} iterations in {time.perf_counter() - start:.1f}s"
+    )
+
+    users = list(held_out)
+    latencies = []
+    hits = 0
+    for user in users:
+        elapsed, (movies, _) = timed(model.recommend, user, k=args.k)
+        latencies.append(elapsed * 1e3)
+        hits += model.movie_index[held_out[user]] in movies.tolist()
+    p50, p95 = np.percentile(latencies, [50, 95])
+    print(f"per user     p50 {p50:6.2f} ms  p95 {p95:6.2f} ms  hit rate@{args.k} {hits / len(users):.2f}")
+
+    rows = [model.user_index[user] for user in users]
+    batch_time, _ = timed(model.recommend_batch, rows, k=args.k)
+    print(f"batched      {batch_time * 1e3 / len(rows):6.3f} ms/user")
+
+    fold_latencies = []
+    for i, user in enumerate(users):
+        elapsed, _ = timed(model.add_ratings, user, {model.movie_ids[i % model.n_movies]: 4.5})
+        fold_latencies.append(elapsed * 1e3)
+    p50, p95 = np.percentile(fold_latencies, [50, 95])
+    print(f"fold-in      p50 {p50:6.2f} ms  p95 {p95:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Latency and memory of hard-constraint filtering on a large synthetic catalog.
+
+Run with:
+
+    python benchmarks/bench_constraints.py --movies 1000000
+    python benchmarks/bench_constraints.py --catalog catalog.npz   # reuse a saved store
+"""
+
+import argparse
+import time
+
+import numpy as np
+from common import synthetic_movies, timed
+
+from movie_recommender_agent.catalog import MovieCatalog
+from movie_recommender_agent.constraints import ConstraintIndex, count
+
+QUERIES = {
+    "90s thrillers": {"genres": ["Thriller"], "year_from": 1990, "year_to": 1999},
+    "under 100 min, no horror": {"runtime_max": 100, "exclude_genres": ["Horror"]},
+    "french or italian, 7.5+": {"languages": ["French", "Italian"], "min_rating": 7.5},
+    "family comedy 2000s": {"genres": ["Comedy"], "content_ratings": ["G", "PG"], "year_from": 2000, "year_to": 2009},
+    "korean 1994 drama": {"genres": ["Drama"], "languages": ["Korean"], "year_from": 1994, "year_to": 1994},
+}
+
+
+def _scan(catalog: MovieCatalog, genres: list[str], year_from: int, year_to: int) -> np.ndarray:
+    """The same filter as one pass over the columns, for comparison."""
+    genre = catalog.lists["genres"]
+    codes = {genre.vocab[code]: code for code in range(len(genre.vocab))}
+    rows = np.repeat(np.arange(len(catalog)), np.diff(genre.offsets))
+    mask = np.zeros(len(catalog), dtype=bool)
+    mask[rows[genre.codes == codes[genres[0]]]] = True
+    return np.flatnonzero(mask & (catalog.year >= year_from) & (catalog.year <= year_to))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--movies", type=int, default=1_000_000, help="Synthetic catalog size")
+    parser.add_argument("--catalog", type=str, default=None, help="Load this catalog instead of generating one")
+    parser.add_argument("--repeat", type=int, default=200, help="Runs per query")
+    args = parser.parse_args()
+
+    if args.catalog:
+        catalog = MovieCatalog.load(args.catalog)
+    else:
+        catalog = MovieCatalog.from_records(synthetic_movies(args.movies))
+
+    start = time.perf_counter()
+    index = ConstraintIndex(catalog)
+    print(
+        f"index build: {len(catalog):,} movies in {time.perf_counter() - start:.2f}s, "
+        f"{index.nbytes / 2**20:.1f} MiB ({index.nbytes / len(catalog):.1f} bytes/movie)"
+    )
+
+    print(f"{'query':<28} {'matches':>9} {'filter':>10} {'+ top 20':>10}")
+    for name, query in QUERIES.items():
+        filter_time, (rows, _) = timed(index.filter, **query, repeat=args.repeat)
+        total_time, _ = timed(lambda query=query: index.best(index.filter(**query)[0], 20), repeat=args.repeat)
+        print(f"{name:<28} {count(rows):>9,} {filter_time * 1e6:8.1f}µs {total_time * 1e6:8.1f}µs")
+
+    query = QUERIES["90s thrillers"]
+    seconds, rows = timed(_scan, catalog, query["genres"], query["year_from"], query["year_to"], repeat=20)
+    print(f"{'90s thrillers, column scan':<28} {len(rows):>9,} {seconds * 1e6:8.1f}µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Serial per-film Exa lookups vs one concurrent search_movies batch (stubbed client, fixed latency).
+
+Run with:
+
+    python benchmarks/bench_exa_batch.py --films 8 --exa-latency 0.25
+"""
+
+import argparse
+
+from common import StubExa, timed
+
+from movie_recommender_agent.cache import ResultCache
+from movie_recommender_agent.exa_tools import CachedExaTools
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--films", type=int, default=8, help="Films researched per recommendation")
+    parser.add_argument("--exa-latency", type=float, default=0.25, help="Simulated Exa round trip (seconds)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent lookups in the batch tool")
+    args = parser.parse_args()
+
+    titles = [f"Film {i}" for i in range(args.films)]
+
+    # Fresh caches so both paths pay every network round trip
+    serial = CachedExaTools(cache=ResultCache(), api_key="benchmark")
+    serial.exa = StubExa(args.exa_latency)
+    serial_time, _ = timed(lambda: [serial.search_exa(f"{title} movie details") for title in titles])
+
+    batch = CachedExaTools(cache=ResultCache(), api_key="benchmark", max_concurrency=args.concurrency)
+    batch.exa = StubExa(args.exa_latency)
+    batch_time, _ = timed(batch.search_movies, titles)
+    batch.close()
+
+    print(f"serial lookups: {serial_time:6.2f}s for {args.films} films")
+    print(f"batched lookup: {batch_time:6.2f}s ({serial_time / batch_time:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Connection reuse: stock exa_py (a new connection per call) vs PooledExa over ClientManager.
+
+Runs against a local keep-alive stub server that sleeps --handshake seconds on every new
+connection, standing in for the DNS + TCP + TLS setup a real Exa or OpenRouter call pays.
+
+Run with:
+
+    python benchmarks/bench_http.py --requests 50 --handshake 0.03
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from common import timed
+from exa_py import Exa
+
+from movie_recommender_agent.clients import ClientManager, PooledExa
+
+
+class StubExaHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self) -> None:
+        self.server.connections += 1
+        time.sleep(self.server.handshake)
+        super().setup()
+
+    def do_POST(self) -> None:
+        query = json.loads(self.rfile.read(int(self.headers["content-length"] or 0)))
+        body = json.dumps({"requestId": "stub", "results": [{"url": "https://imdb.com", "title": query["query"]}]})
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=50, help="Sequential Exa calls per client")
+    parser.add_argument("--handshake", type=float, default=0.03, help="Simulated connection setup (seconds)")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubExaHandler)
+    server.handshake = args.handshake
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    def run(exa: Exa) -> None:
+        for i in range(args.requests):
+            exa.request("/search", {"query": f"film {i}"})
+
+    print(f"{'client':<10} {'connections':>12} {'total':>9} {'per call':>10}")
+    http = ClientManager()
+    for name, exa in (
+        ("exa_py", Exa("stub", base_url=base_url)),
+        ("pooled", PooledExa("stub", http.client, base_url=base_url)),
+    ):
+        server.connections = 0
+        seconds, _ = timed(run, exa)
+        print(f"{name:<10} {server.connections:>12} {seconds:>8.2f}s {seconds / args.requests * 1e3:>8.1f}ms")
+    print(f"pooled client: {http.stats.reuse_ratio:.0%} of requests reused a connection")
+    http.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
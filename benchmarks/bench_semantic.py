@@ -0,0 +1,54 @@
+"""Recall@k vs latency of the IVF semantic index, using the deterministic hashing embedder.
+
+Runs fully offline. Run with:
+
+    python benchmarks/bench_semantic.py --movies 100000 --k 10
+"""
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+from common import synthetic_movies, timed
+
+from movie_recommender_agent.catalog import MovieCatalog
+from movie_recommender_agent.semantic import HashingEmbedder, IVFIndex, build_catalog_index
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--movies", type=int, default=100_000, help="Synthetic catalog size")
+    parser.add_argument("--queries", type=int, default=200, help="Free-text queries to run")
+    parser.add_argument("--k", type=int, default=10, help="Recall@k cut-off")
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32], help="Lists probed per query")
+    args = parser.parse_args()
+
+    catalog = MovieCatalog.from_records(synthetic_movies(args.movies))
+    embedder = HashingEmbedder()
+
+    start = time.perf_counter()
+    built = build_catalog_index(catalog, embedder)
+    print(f"build: {len(built):,} vectors, {len(built.centroids)} lists in {time.perf_counter() - start:.1f}s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        built.save(directory)
+        load_time, index = timed(IVFIndex.load, directory)
+        print(f"mmap load: {load_time * 1e3:.2f} ms")
+
+        # Queries are short descriptions taken from synopses, like a user describing a mood
+        rng = np.random.default_rng(11)
+        rows = rng.choice(len(catalog), args.queries, replace=False)
+        queries = [embedder.embed(" ".join(catalog.text["synopsis"][row].split()[:8])) for row in rows]
+        truth = [set(index.search_exact(query, args.k)[0].tolist()) for query in queries]
+
+        exact_time, _ = timed(lambda: [index.search_exact(query, args.k) for query in queries])
+        print(f"exact scan:  recall 1.000  {exact_time * 1e3 / len(queries):7.3f} ms/query")
+        for nprobe in args.nprobe:
+            latency, results = timed(lambda n=nprobe: [index.search(query, args.k, nprobe=n)[0] for query in queries])
+            recall = np.mean([len(truth[i] & set(ids.tolist())) / args.k for i, ids in enumerate(results)])
+            print(f"nprobe {nprobe:3d}: recall {recall:.3f}  {latency * 1e3 / len(queries):7.3f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Latency of "similar to X" queries on a large synthetic catalog.
+
+Run with:
+
+    python benchmarks/bench_similarity.py --movies 1000000
+    python benchmarks/bench_similarity.py --catalog catalog.npz   # reuse a saved store
+"""
+
+import argparse
+import time
+
+import numpy as np
+from common import synthetic_movies, timed
+
+from movie_recommender_agent.catalog import MovieCatalog
+from movie_recommender_agent.similarity import SimilarityEngine
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--movies", type=int, default=1_000_000, help="Synthetic catalog size")
+    parser.add_argument("--catalog", type=str, default=None, help="Load this catalog instead of generating one")
+    parser.add_argument("--queries", type=int, default=200, help="Queries per scenario")
+    parser.add_argument("--k", type=int, default=10, help="Results per query")
+    args = parser.parse_args()
+
+    if args.catalog:
+        catalog = MovieCatalog.load(args.catalog)
+    else:
+        catalog = MovieCatalog.from_records(synthetic_movies(args.movies))
+
+    start = time.perf_counter()
+    engine = SimilarityEngine.from_catalog(catalog)
+    print(
+        f"engine build: {len(catalog):,} movies, {len(engine.indices):,} non-zeros in {time.perf_counter() - start:.2f}s"
+    )
+
+    rng = np.random.default_rng(3)
+    single = [[int(seed)] for seed in rng.integers(0, len(catalog), args.queries)]
+    multi = [[int(seed) for seed in rng.integers(0, len(catalog), 2)] for _ in range(args.queries)]
+
+    for name, groups in (("single seed", single), ("two seeds", multi)):
+        latencies = []
+        for seeds in groups:
+            elapsed, _ = timed(engine.similar, seeds, k=args.k)
+            latencies.append(elapsed * 1e3)
+        p50, p95 = np.percentile(latencies, [50, 95])
+        print(f"{name:12s} p50 {p50:6.2f} ms  p95 {p95:6.2f} ms")
+
+    batch_time, _ = timed(engine.similar_batch, single + multi, k=args.k)
+    print(f"batched      {batch_time * 1e3 / (2 * args.queries):6.2f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Output tokens and wall time: LLM-written markdown vs structured JSON rendered locally.
+
+Uses a recorded pair of responses to the same request (fixtures/*.md and *.json). Output
+tokens are counted with tiktoken when it is installed (otherwise estimated), and the
+generation time is modelled at a fixed decode speed, since it dominates a real run.
+
+Run with:
+
+    python benchmarks/bench_structured.py --tokens-per-second 60
+"""
+
+import argparse
+import json
+import re
+from pathlib import Path
+
+from common import timed
+
+from movie_recommender_agent.rendering import RecommendationSet, render_markdown
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def count_tokens(text: str) -> int:
+    """BPE token count (cl100k) when tiktoken is available, else a word/punctuation estimate."""
+    try:
+        import tiktoken
+    except ImportError:
+        # Words and single symbols; emojis and non-ASCII characters usually cost a token each
+        return len(re.findall(r"\w+|[^\w\s]", text))
+    return len(tiktoken.get_encoding("cl100k_base").encode(text))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens-per-second", type=float, default=60.0, help="Model decode speed")
+    parser.add_argument("--repeat", type=int, default=1_000, help="Local render repetitions")
+    args = parser.parse_args()
+
+    print(f"{'fixture':<24} {'markdown':>10} {'structured':>11} {'saved':>7} {'md time':>9} {'json time':>10}")
+    for markdown_path in sorted(FIXTURES.glob("*.md")):
+        markdown = markdown_path.read_text()
+        # The model emits compact JSON; indentation in the fixture is for readers only
+        structured = json.dumps(json.loads(markdown_path.with_suffix(".json").read_text()), separators=(",", ":"))
+
+        render_time, _ = timed(
+            lambda s=structured: render_markdown(RecommendationSet.model_validate_json(s)), repeat=args.repeat
+        )
+        markdown_tokens = count_tokens(markdown)
+        structured_tokens = count_tokens(structured)
+        markdown_time = markdown_tokens / args.tokens_per_second
+        structured_time = structured_tokens / args.tokens_per_second + render_time
+
+        print(
+            f"{markdown_path.stem:<24} {markdown_tokens:>10,} {structured_tokens:>11,} "
+            f"{1 - structured_tokens / markdown_tokens:>7.0%} {markdown_time:>8.2f}s {structured_time:>9.2f}s"
+        )
+        print(f"{'':<24} local parse + render: {render_time * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Shared fixtures for the offline benchmarks: synthetic catalogs and stubbed Exa clients."""
+
+import random
+import time
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+
+GENRES = [
+    "Action", "Adventure", "Animation", "Comedy", "Crime", "Documentary", "Drama", "Family",
+    "Fantasy", "History", "Horror", "Music", "Mystery", "Romance", "Sci-Fi", "Thriller", "War", "Western",
+]  # fmt: skip
+LANGUAGES = ["English", "Korean", "French", "Japanese", "Spanish", "Hindi", "German", "Italian"]
+CONTENT_RATINGS = ["G", "PG", "PG-13", "R", "NC-17"]
+WORDS = [
+    "night", "city", "last", "dark", "love", "road", "blood", "dream", "house", "star", "king", "river",
+    "shadow", "winter", "ghost", "fire", "secret", "storm", "silent", "lost", "golden", "iron", "wild", "moon",
+]  # fmt: skip
+
+
+def synthetic_movies(count: int, seed: int = 7) -> Iterator[dict[str, Any]]:
+    """Yield deterministic IMDb-style movie records."""
+    rng = random.Random(seed)
+    people = [f"Person {i}" for i in range(max(count // 4, 50))]
+    keywords = [f"kw{i}" for i in range(2_000)]
+    vocabulary = [f"{rng.choice(WORDS)}{i}" for i in range(3_000)]
+    # Synopses are drawn mostly from one of a few themes, giving embeddings real cluster structure
+    themes = [rng.sample(vocabulary, 40) for _ in range(64)]
+    for i in range(count):
+        theme = rng.choice(themes)
+        yield {
+            "tconst": f"tt{i:08d}",
+            "primaryTitle": " ".join(rng.sample(WORDS, rng.randint(1, 3))).title() + f" {i}",
+            "startYear": rng.randint(1950, 2025),
+            "runtimeMinutes": rng.randint(75, 190),
+            "genres": rng.sample(GENRES, rng.randint(1, 3)),
+            "averageRating": round(rng.uniform(3.0, 9.5), 1),
+            "numVotes": int(rng.paretovariate(1.2) * 100),
+            "directors": [rng.choice(people)],
+            "cast": rng.sample(people, 4),
+            "keywords": rng.sample(keywords, 5),
+            "language": rng.choice(LANGUAGES),
+            "content_rating": rng.choice(CONTENT_RATINGS),
+            "synopsis": " ".join(
+                rng.choice(theme) if rng.random() < 0.8 else rng.choice(vocabulary) for _ in range(30)
+            ),
+        }
+
+
+def synthetic_ratings(
+    count: int, users: int, movies: int, tastes: int = 50, seed: int = 7
+) -> list[tuple[str, str, float]]:
+    """Deterministic (user, movie, stars) triples: each user rates mostly movies of their taste group."""
+    rng = np.random.default_rng(seed)
+    taste_of_user = rng.integers(0, tastes, users)
+    taste_of_movie = rng.integers(0, tastes, movies)
+    by_taste = [np.flatnonzero(taste_of_movie == taste) for taste in range(tastes)]
+    user = rng.integers(0, users, count)
+    in_taste = rng.random(count) < 0.8
+    movie = rng.integers(0, movies, count)
+    for taste, candidates in enumerate(by_taste):
+        chosen = in_taste & (taste_of_user[user] == taste)
+        # Popular movies of a taste group are rated far more often (Zipf-like)
+        ranks = np.minimum(rng.zipf(1.3, chosen.sum()) - 1, len(candidates) - 1)
+        movie[chosen] = candidates[ranks]
+    stars = np.where(
+        taste_of_movie[movie] == taste_of_user[user], rng.uniform(3.5, 5, count), rng.uniform(0.5, 3, count)
+    )
+    stars = np.round(stars * 2) / 2
+    return [(f"u{u}", f"tt{m:08d}", float(r)) for u, m, r in zip(user, movie, stars, strict=True)]
+
+
+class StubExa:
+    """exa_py client stand-in that sleeps for a fixed network latency per call."""
+
+    def __init__(self, latency_seconds: float = 0.25) -> None:
+        self.latency_seconds = latency_seconds
+        self.calls = 0
+
+    def _response(self, query: str) -> SimpleNamespace:
+        self.calls += 1
+        time.sleep(self.latency_seconds)
+        result = SimpleNamespace(
+            url=f"https://www.imdb.com/find?q={query}",
+            title=query,
+            author=None,
+            published_date=None,
+            text=f"{query} - rating, runtime, director and cast",
+        )
+        return SimpleNamespace(results=[result])
+
+    def search_and_contents(self, query: str, **kwargs: Any) -> SimpleNamespace:
+        return self._response(query)
+
+
+def timed(func, *args: Any, repeat: int = 1, **kwargs: Any) -> tuple[float, Any]:
+    """Return (mean seconds per call, last result) over repeat calls."""
+    result = None
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(*args, **kwargs)
+    return (time.perf_counter() - start) / repeat, result
@@ -9,18 +9,29 @@
 
 """movie-recommender-agent - An Bindu Agent."""
 
+from typing import TYPE_CHECKING, Any
+
 from movie_recommender_agent.__version__ import __version__
-from movie_recommender_agent.main import (
-    cleanup,
-    handler,
-    initialize_agent,
-    main,
-)
+
+if TYPE_CHECKING:
+    from movie_recommender_agent.main import cleanup, ensure_initialized, handler, initialize_agent, is_ready, main
 
 __all__ = [
     "__version__",
     "cleanup",
+    "ensure_initialized",
     "handler",
     "initialize_agent",
+    "is_ready",
     "main",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the entry points on first use, so submodules and tools load without the agent stack."""
+    if name in __all__ and name != "__version__":
+        import importlib
+
+        return getattr(importlib.import_module("movie_recommender_agent.main"), name)
+    error_msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(error_msg)
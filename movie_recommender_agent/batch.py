@@ -0,0 +1,272 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Offline bulk recommendations: a JSONL file of requests in, a JSONL file of answers out.
+
+Each input line is one request:
+
+    {"id": "u42-2024w18", "user_id": "u42", "query": "Slow-burn thrillers", "profile": {"likes": ["Heat"]}}
+
+``query`` may be replaced by ``messages`` (a chat transcript); ``profile`` (a string or
+a dict of lists) is given to the agent as an "About me" turn before the query, and
+``id`` defaults to the line number. Requests go through the same handler as the
+server, so shared sub-queries are deduplicated across users by the response cache,
+the in-flight coalescing of identical requests and the Exa lookup cache, and
+--llm-rps/--exa-rps cap the request rate to OpenRouter and Exa for the whole run.
+
+Input is streamed through a bounded queue to --concurrency workers, and every answer
+is appended to the output file as soon as it is ready. The output file is the
+checkpoint: rerunning the same command skips every id already answered (a line cut
+off by a crash is discarded) and retries the ones that failed.
+
+Run with:
+
+    python -m movie_recommender_agent batch picks.jsonl --output answers.jsonl --concurrency 16
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, TextIO
+
+from movie_recommender_agent.response_cache import response_text
+
+Record = dict[str, Any]
+
+
+@dataclass
+class BatchStats:
+    """Counters for one batch run."""
+
+    answered: int = 0
+    failed: int = 0
+    skipped: int = 0  # already answered by an earlier run
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def rate(self) -> float:
+        """Requests finished per second since the run started."""
+        elapsed = time.monotonic() - self.started
+        return (self.answered + self.failed) / elapsed if elapsed else 0.0
+
+
+def read_records(path: str | Path) -> Iterator[tuple[str, Record]]:
+    """Stream (id, record) pairs from a JSONL file; malformed lines are yielded as {"error": ...}."""
+    with open(path, encoding="utf-8") as lines:
+        for number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield str(number), {"error": f"Invalid JSON: {e}"}
+                continue
+            if not isinstance(record, dict) or not (record.get("query") or record.get("messages")):
+                yield str(number), {"error": "A record needs a query or messages"}
+                continue
+            yield str(record.get("id", number)), record
+
+
+def build_messages(record: Record) -> list[dict[str, Any]]:
+    """Chat messages for a record: its profile as an "About me" turn, then the query (or its messages)."""
+    messages = [dict(message) for message in record.get("messages") or []]
+    if not messages:
+        messages = [{"role": "user", "content": record["query"]}]
+    profile = record.get("profile")
+    if profile:
+        messages.insert(0, {"role": "user", "content": f"About me: {_profile_text(profile)}"})
+    if record.get("user_id") is not None:
+        for message in messages:
+            if message.get("role") == "user":
+                message.setdefault("user_id", str(record["user_id"]))
+    return messages
+
+
+def _profile_text(profile: Any) -> str:
+    if not isinstance(profile, dict):
+        return str(profile)
+    parts = []
+    for key, value in profile.items():
+        values = ", ".join(map(str, value)) if isinstance(value, list) else str(value)
+        parts.append(f"{key.replace('_', ' ')}: {values}")
+    return "; ".join(parts)
+
+
+def completed_ids(path: str | Path) -> set[str]:
+    """Ids already answered in an output file, after cutting off a last line left partial by a crash."""
+    path = Path(path)
+    if not path.exists():
+        return set()
+    done = set()
+    with open(path, "rb+") as output:
+        _drop_partial_line(output)
+        output.seek(0)
+        for line in output:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict) and "response" in entry:
+                done.add(str(entry.get("id")))
+    return done
+
+
+def _drop_partial_line(output: BinaryIO, block_size: int = 1 << 16) -> None:
+    """Truncate the file after its last newline, reading backwards from the end one block at a time."""
+    size = output.seek(0, os.SEEK_END)
+    end = size
+    while end > 0:
+        start = max(end - block_size, 0)
+        output.seek(start)
+        newline = output.read(end - start).rfind(b"\n")
+        if newline >= 0:
+            end = start + newline + 1
+            break
+        end = start
+    if end < size:
+        output.truncate(end)
+
+
+class OutputWriter:
+    """Appends one JSON line per answer, flushed at once and fsynced every sync_every lines."""
+
+    def __init__(self, output: TextIO, sync_every: int = 100) -> None:
+        self.output = output
+        self.sync_every = sync_every
+        self._unsynced = 0
+
+    def write(self, entry: Record) -> None:
+        self.output.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self.output.flush()
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every:
+            self.sync()
+
+    def sync(self) -> None:
+        if self._unsynced:
+            os.fsync(self.output.fileno())
+            self._unsynced = 0
+
+
+async def _answer(run: Callable[[list[dict[str, Any]]], Awaitable[Any]], record_id: str, record: Record) -> Record:
+    entry: Record = {"id": record_id, "user_id": record.get("user_id"), "query": record.get("query")}
+    if "error" in record:
+        return {**entry, "error": record["error"], "seconds": 0.0}
+    start = time.perf_counter()
+    try:
+        result = await run(build_messages(record))
+    except Exception as e:
+        entry["error"] = f"{type(e).__name__}: {e}"
+    else:
+        content = response_text(result)
+        if content is None:
+            entry["error"] = f"Unexpected agent result: {type(result).__name__}"
+        else:
+            entry["response"] = content
+    entry["seconds"] = round(time.perf_counter() - start, 3)
+    return entry
+
+
+async def run_batch(
+    records: Iterator[tuple[str, Record]],
+    run: Callable[[list[dict[str, Any]]], Awaitable[Any]],
+    writer: OutputWriter,
+    concurrency: int = 8,
+    done: set[str] | None = None,
+    progress_every: int = 100,
+) -> BatchStats:
+    """Answer records with at most concurrency runs in flight, writing each answer as it completes.
+
+    Records whose id is in done are skipped, as are repeated ids within the input.
+    """
+    stats = BatchStats()
+    seen = set(done or ())
+    queue: asyncio.Queue[tuple[str, Record] | None] = asyncio.Queue(maxsize=concurrency * 2)
+
+    async def read() -> None:
+        for record_id, record in records:
+            if record_id in seen:
+                stats.skipped += 1
+                continue
+            seen.add(record_id)
+            await queue.put((record_id, record))
+        for _ in range(concurrency):
+            await queue.put(None)
+
+    async def work() -> None:
+        while (item := await queue.get()) is not None:
+            entry = await _answer(run, *item)
+            writer.write(entry)
+            if "error" in entry:
+                stats.failed += 1
+            else:
+                stats.answered += 1
+            if (stats.answered + stats.failed) % progress_every == 0:
+                print(f"🗂️  Batch: {stats.answered} answered, {stats.failed} failed ({stats.rate:.1f} req/s)")
+
+    await asyncio.gather(read(), *(work() for _ in range(concurrency)))
+    writer.sync()
+    return stats
+
+
+async def batch(args: argparse.Namespace) -> BatchStats:
+    """Initialize the agent for offline use and answer every pending record of the input file."""
+    # Whole answers instead of streams, a pool sized for the workers, and the run's rate limits
+    os.environ["AGENT_STREAMING"] = "false"
+    os.environ.setdefault("AGENT_POOL_SIZE", str(args.concurrency))
+    if args.llm_rps is not None:
+        os.environ["OPENROUTER_RATE_LIMIT"] = str(args.llm_rps)
+    if args.exa_rps is not None:
+        os.environ["EXA_RATE_LIMIT"] = str(args.exa_rps)
+
+    from movie_recommender_agent.main import cleanup, ensure_initialized, handler
+
+    done = completed_ids(args.output)
+    if done:
+        print(f"⏩ Resuming: {len(done)} requests already answered in {args.output}")
+    await ensure_initialized()
+    try:
+        with open(args.output, "a", encoding="utf-8") as output:
+            writer = OutputWriter(output, args.sync_every)
+            return await run_batch(
+                read_records(args.input), handler, writer, args.concurrency, done, args.progress_every
+            )
+    finally:
+        await cleanup()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m movie_recommender_agent batch",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("input", help="JSONL file of requests")
+    parser.add_argument("--output", required=True, help="JSONL file the answers are appended to (the checkpoint)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Requests in flight at once")
+    parser.add_argument("--llm-rps", type=float, help="OpenRouter requests per second (default: OPENROUTER_RATE_LIMIT)")
+    parser.add_argument("--exa-rps", type=float, help="Exa requests per second (default: EXA_RATE_LIMIT)")
+    parser.add_argument("--sync-every", type=int, default=100, help="Answers written between fsyncs")
+    parser.add_argument("--progress-every", type=int, default=100, help="Answers between progress lines")
+    args = parser.parse_args(argv)
+
+    stats = asyncio.run(batch(args))
+    print(
+        f"✅ Batch finished: {stats.answered} answered, {stats.failed} failed, "
+        f"{stats.skipped} skipped as already answered ({stats.rate:.1f} req/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Load test of the request path (handler -> run_agent) against fake OpenRouter and Exa.
+
+The fakes are served through the pooled HTTP clients, so everything from the handler to
+the wire is exercised: caches, coalescing, the agent pool, routing, the agno tool loop
+and response streaming. The fake model asks for one batched Exa lookup, then streams a
+markdown report; latencies are drawn from configurable distributions with a fixed seed.
+
+Run with:
+
+    python -m movie_recommender_agent.bench --requests 200 --concurrency 16 --output bench.json
+
+Results are written as JSON; --baseline compares them with an earlier run and exits with
+status 1 when p95 latency or throughput regressed by more than --max-regression.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+import resource
+import sys
+import threading
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+import yaml
+
+from movie_recommender_agent.clients import ClientManager
+from movie_recommender_agent.history import count_tokens
+from movie_recommender_agent.main import cleanup, ensure_initialized, handler
+
+SKILL_PATH = Path(__file__).parent / "skills" / "movie-recommender" / "skill.yaml"
+
+# Titles the fake backends recommend and look up
+_TITLES = [
+    "Oldboy", "Memories of Murder", "The Handmaiden", "Inception", "Tenet", "Arrival", "Heat", "Paddington 2",
+    "Coco", "Knives Out", "The Nice Guys", "Prisoners", "Burning", "Mother", "Interstellar", "The Prestige",
+]  # fmt: skip
+
+
+@dataclass
+class Latency:
+    """A latency distribution in seconds: fixed:S, uniform:A,B or lognormal:MEDIAN,SIGMA."""
+
+    kind: str = "fixed"
+    a: float = 0.0
+    b: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> "Latency":
+        kind, _, args = spec.partition(":")
+        values = [float(v) for v in args.split(",") if v] if args else [float(kind)]
+        if not args:
+            kind = "fixed"
+        if kind not in ("fixed", "uniform", "lognormal") or len(values) != (1 if kind == "fixed" else 2):
+            error_msg = f"Latency must be fixed:S, uniform:A,B or lognormal:MEDIAN,SIGMA, not {spec!r}"
+            raise ValueError(error_msg)
+        return cls(kind, *values)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "uniform":
+            return rng.uniform(self.a, self.b)
+        if self.kind == "lognormal":
+            return rng.lognormvariate(math.log(self.a), self.b)
+        return self.a
+
+
+class FakeOpenRouter:
+    """OpenAI-compatible chat completions: one batched Exa tool call, then a streamed report."""
+
+    def __init__(
+        self, first_token: Latency, tokens_per_second: float = 80.0, output_tokens: int = 600, seed: int = 7
+    ) -> None:
+        self.first_token = first_token
+        self.tokens_per_second = tokens_per_second
+        self.output_tokens = output_tokens
+        self.calls = 0
+        self._rng = random.Random(seed)  # noqa: S311
+        self._lock = threading.Lock()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        messages = body.get("messages", [])
+        with self._lock:
+            self.calls += 1
+            first_token = self.first_token.sample(self._rng)
+        prompt_tokens = sum(count_tokens(str(m.get("content") or "")) for m in messages)
+        query = next((m["content"] for m in reversed(messages) if m.get("role") == "user"), "")
+        tool_names = {tool["function"]["name"] for tool in body.get("tools") or []}
+        if "search_movies" in tool_names and not any(m.get("role") == "tool" for m in messages):
+            delta = {"tool_calls": [_tool_call(_titles(query, 3))]}
+            return self._respond(body, [delta], "tool_calls", prompt_tokens, first_token, output_tokens=30)
+        words = _report(query, self.output_tokens).split(" ")
+        deltas = [{"content": " ".join(words[i : i + 8]) + " "} for i in range(0, len(words), 8)]
+        return self._respond(body, deltas, "stop", prompt_tokens, first_token, len(words))
+
+    def _respond(
+        self,
+        body: dict[str, Any],
+        deltas: list[dict[str, Any]],
+        finish_reason: str,
+        prompt_tokens: int,
+        first_token: float,
+        output_tokens: int,
+    ) -> httpx.Response:
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": output_tokens,
+            "total_tokens": prompt_tokens + output_tokens,
+        }
+        model = body.get("model", "fake")
+        if body.get("stream"):
+            return httpx.Response(
+                200,
+                headers={"content-type": "text/event-stream"},
+                content=self._events(model, deltas, finish_reason, usage, first_token),
+            )
+
+        content = "".join(d.get("content", "") for d in deltas) or None
+        tool_calls = [call for d in deltas for call in d.get("tool_calls", [])] or None
+        message = {"role": "assistant", "content": content, "tool_calls": tool_calls}
+        choice = {"index": 0, "message": message, "finish_reason": finish_reason}
+
+        async def delayed() -> AsyncIterator[bytes]:
+            await asyncio.sleep(first_token + output_tokens / self.tokens_per_second)
+            completion = {"id": "bench", "object": "chat.completion", "created": 0, "model": model}
+            yield json.dumps({**completion, "choices": [choice], "usage": usage}).encode()
+
+        return httpx.Response(200, headers={"content-type": "application/json"}, content=delayed())
+
+    async def _events(
+        self, model: str, deltas: list[dict[str, Any]], finish_reason: str, usage: dict[str, int], first_token: float
+    ) -> AsyncIterator[bytes]:
+        chunk = {"id": "bench", "object": "chat.completion.chunk", "created": 0, "model": model}
+        await asyncio.sleep(first_token)
+        for delta in deltas:
+            choice = {"index": 0, "delta": {"role": "assistant", **delta}, "finish_reason": None}
+            yield f"data: {json.dumps({**chunk, 'choices': [choice]})}\n\n".encode()
+            await asyncio.sleep(len(str(delta.get("content", "")).split()) / self.tokens_per_second)
+        finish = {"index": 0, "delta": {}, "finish_reason": finish_reason}
+        yield f"data: {json.dumps({**chunk, 'choices': [finish]})}\n\n".encode()
+        yield f"data: {json.dumps({**chunk, 'choices': [], 'usage': usage})}\n\n".encode()
+        yield b"data: [DONE]\n\n"
+
+
+class FakeExa:
+    """Exa search, contents and find-similar responses after a sampled network latency."""
+
+    def __init__(self, latency: Latency, seed: int = 11) -> None:
+        self.latency = latency
+        self.calls = 0
+        self._rng = random.Random(seed)  # noqa: S311
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content or b"{}")
+        with self._lock:
+            self.calls += 1
+            delay = self.latency.sample(self._rng)
+        time.sleep(delay)
+        query = str(body.get("query") or body.get("url") or body.get("urls") or "")
+        results = [
+            {
+                "id": f"https://www.imdb.com/title/tt{i:07d}",
+                "url": f"https://www.imdb.com/title/tt{i:07d}",
+                "title": title,
+                "score": 0.9,
+                "text": f"{title} - rating 8.1/10, runtime 2h 05m, director and cast, streaming on Netflix.",
+            }
+            for i, title in enumerate(_titles(query, int(body.get("numResults", 3))))
+        ]
+        return httpx.Response(200, json={"requestId": "bench", "results": results})
+
+
+def _titles(seed_text: str, count: int) -> list[str]:
+    start = int.from_bytes(hashlib.blake2b(seed_text.encode(), digest_size=4).digest(), "big")
+    return [_TITLES[(start + i) % len(_TITLES)] for i in range(count)]
+
+
+def _tool_call(titles: list[str]) -> dict[str, Any]:
+    arguments = json.dumps({"titles": titles})
+    return {"index": 0, "id": "call_bench", "type": "function", "function": {"name": "search_movies", "arguments": arguments}}  # fmt: skip
+
+
+def _report(query: str, tokens: int) -> str:
+    """A markdown report of about the given number of words."""
+    rows = [
+        f"| **{title}** | 2019 | ⭐ 8.1/10 | Thriller | 2h 05m | Matches your request |" for title in _titles(query, 5)
+    ]
+    text = f"# 🎬 Movie Recommendations for {query}\n\n| Movie | Year | Rating | Genre | Runtime | Why |\n" + "\n".join(
+        rows
+    )
+    filler = "A tense, beautifully shot film with a memorable cast and a satisfying ending."
+    while len(text.split(" ")) < tokens:
+        text += "\n\n" + filler
+    return text
+
+
+# Settings recorded with the results, so runs are only compared like for like
+_CONFIG_KEYS = (
+    "requests", "concurrency", "stream", "llm_latency", "exa_latency", "tokens_per_second", "output_tokens",
+    "response_cache", "seed",
+)  # fmt: skip
+
+
+@dataclass
+class Sample:
+    """One request of the load test."""
+
+    seconds: float
+    first_chunk_seconds: float | None
+    error: str | None = None
+
+
+def default_queries() -> list[str]:
+    """Example queries of the skill definition."""
+    return list(yaml.safe_load(SKILL_PATH.read_text())["examples"])
+
+
+def percentiles(values: list[float]) -> dict[str, float] | None:
+    """p50 / p95 / p99 / mean / max of the values, in milliseconds."""
+    if not values:
+        return None
+    ordered = sorted(values)
+
+    def at(q: float) -> float:
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)] * 1e3
+
+    return {
+        "p50": round(at(0.5), 2),
+        "p95": round(at(0.95), 2),
+        "p99": round(at(0.99), 2),
+        "mean": round(sum(ordered) / len(ordered) * 1e3, 2),
+        "max": round(ordered[-1] * 1e3, 2),
+    }
+
+
+async def _one_request(handler: Any, query: str) -> Sample:
+    start = time.perf_counter()
+    first_chunk = None
+    try:
+        result = await handler([{"role": "user", "content": query}])
+        if hasattr(result, "__aiter__"):
+            async for _ in result:
+                if first_chunk is None:
+                    first_chunk = time.perf_counter() - start
+    except Exception as e:
+        return Sample(time.perf_counter() - start, first_chunk, f"{type(e).__name__}: {e}")
+    return Sample(time.perf_counter() - start, first_chunk)
+
+
+async def run_load(handler: Any, queries: list[str], requests: int, concurrency: int) -> tuple[list[Sample], float]:
+    """Send requests (cycling through queries) with at most concurrency in flight; returns samples and wall time."""
+    pending = iter(range(requests))
+    samples: list[Sample] = []
+
+    async def worker() -> None:
+        for i in pending:
+            samples.append(await _one_request(handler, queries[i % len(queries)]))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples, time.perf_counter() - start
+
+
+def _rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], max_regression: float) -> list[str]:
+    """Regressions of p95 latency and throughput beyond max_regression (a fraction) against a baseline."""
+    regressions = []
+    p95, base_p95 = results["latency_ms"]["p95"], baseline["latency_ms"]["p95"]
+    if base_p95 and p95 > base_p95 * (1 + max_regression):
+        regressions.append(f"p95 latency {p95:.0f} ms vs {base_p95:.0f} ms")
+    rps, base_rps = results["throughput_rps"], baseline["throughput_rps"]
+    if base_rps and rps < base_rps * (1 - max_regression):
+        regressions.append(f"throughput {rps:.2f} req/s vs {base_rps:.2f} req/s")
+    return regressions
+
+
+async def benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    """Initialize the agent on the fake backends and run the load test."""
+    # Never reach a real service: fake keys, no Mem0, and every request served by the fakes
+    os.environ["OPENROUTER_API_KEY"] = "bench"
+    os.environ["EXA_API_KEY"] = "bench"
+    os.environ["MEMORY_BACKEND"] = "none"
+    os.environ["AGENT_SNAPSHOTS"] = "false"
+    os.environ["AGENT_STREAMING"] = "true" if args.stream else "false"
+    if not args.response_cache:
+        os.environ["RESPONSE_CACHE_SIZE"] = "0"
+        os.environ["MODEL_RESPONSE_CACHE"] = "false"
+
+    llm = FakeOpenRouter(Latency.parse(args.llm_latency), args.tokens_per_second, args.output_tokens, args.seed)
+    exa = FakeExa(Latency.parse(args.exa_latency), args.seed + 1)
+    http = ClientManager(transport=httpx.MockTransport(exa), async_transport=httpx.MockTransport(llm))
+    rss_start = _rss_mb()
+    await ensure_initialized(http)
+
+    queries = [line for line in Path(args.queries).read_text().splitlines() if line.strip()] if args.queries else default_queries()  # fmt: skip
+    if args.warmup:
+        await run_load(handler, queries, args.warmup, args.concurrency)
+    samples, wall = await run_load(handler, queries, args.requests, args.concurrency)
+    await cleanup()
+
+    ok = [s for s in samples if s.error is None]
+    errors = sorted({s.error for s in samples if s.error})
+    return {
+        "config": {key: getattr(args, key) for key in _CONFIG_KEYS},
+        "requests": len(samples),
+        "errors": len(samples) - len(ok),
+        "error_messages": errors[:10],
+        "duration_s": round(wall, 3),
+        "throughput_rps": round(len(ok) / wall, 3) if wall else 0.0,
+        "latency_ms": percentiles([s.seconds for s in ok]),
+        "ttft_ms": percentiles([s.first_chunk_seconds for s in ok if s.first_chunk_seconds is not None]),
+        "memory_mb": {"rss_start": round(rss_start, 1), "rss_peak": round(_rss_mb(), 1)},
+        "backend_calls": {"llm": llm.calls, "exa": exa.calls},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=100, help="Measured requests")
+    parser.add_argument("--warmup", type=int, default=8, help="Requests sent before measuring")
+    parser.add_argument("--concurrency", type=int, default=8, help="Requests in flight at once")
+    parser.add_argument("--queries", help="File with one query per line (default: skill.yaml examples)")
+    parser.add_argument("--stream", action=argparse.BooleanOptionalAction, default=True, help="Stream responses")
+    parser.add_argument("--llm-latency", default="lognormal:0.6,0.3", help="Model time to first token")
+    parser.add_argument("--exa-latency", default="lognormal:0.25,0.4", help="Exa round trip")
+    parser.add_argument("--tokens-per-second", type=float, default=80.0, help="Model decode speed")
+    parser.add_argument("--output-tokens", type=int, default=600, help="Report length in tokens")
+    parser.add_argument("--response-cache", action="store_true", help="Keep the response and model response caches on")
+    parser.add_argument("--seed", type=int, default=7, help="Seed of the latency samples")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--baseline", help="Earlier results to compare with")
+    parser.add_argument("--max-regression", type=float, default=0.1, help="Allowed regression vs the baseline")
+    args = parser.parse_args()
+
+    results = asyncio.run(benchmark(args))
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2, ensure_ascii=False) + "\n")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(Path(args.baseline).read_text()), args.max_regression)
+        for regression in regressions:
+            print(f"❌ Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+        print("✅ No regression against the baseline")
+
+
+if __name__ == "__main__":
+    main()
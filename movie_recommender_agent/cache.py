@@ -0,0 +1,190 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Result caching for Exa lookups.
+
+Repeated queries ("thrillers like Inception") are served from an in-memory LRU tier,
+optionally backed by an on-disk SQLite tier so results survive restarts and are shared
+between processes. Every entry carries its own expiry time. The Exa tools that use it
+live in exa_tools.py, so this module (also used by the response cache) never loads exa_py.
+"""
+
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Column, Float, MetaData, String, Table, Text, create_engine, delete, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase a query and collapse whitespace so trivially different spellings share a key."""
+    return _WHITESPACE.sub(" ", query.strip().lower())
+
+
+def make_cache_key(operation: str, query: Any, **params: Any) -> str:
+    """Build a stable cache key from an operation name, its query and keyword parameters."""
+    if isinstance(query, str):
+        query = normalize_query(query)
+    payload = json.dumps([operation, query, params], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a ResultCache."""
+
+    hits: int = 0
+    misses: int = 0
+    disk_hits: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from either tier."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResultCache:
+    """Two-tier TTL cache: an in-memory LRU in front of an optional SQLite table."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+        db_path: str | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_entries < 1:
+            error_msg = "max_entries must be at least 1"
+            raise ValueError(error_msg)
+
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+        self._engine = None
+        self._table: Table | None = None
+        if db_path:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._engine = create_engine(f"sqlite:///{db_path}")
+            metadata = MetaData()
+            self._table = Table(
+                "exa_cache",
+                metadata,
+                Column("key", String(64), primary_key=True),
+                Column("value", Text, nullable=False),
+                Column("expires_at", Float, nullable=False, index=True),
+            )
+            metadata.create_all(self._engine)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value for key, or None when missing or expired."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return value
+                del self._entries[key]
+                self.stats.expirations += 1
+
+        disk_entry = self._disk_get(key, now)
+        with self._lock:
+            if disk_entry is None:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            self.stats.disk_hits += 1
+            self._store(key, *disk_entry)
+        return disk_entry[0]
+
+    def set(self, key: str, value: str, ttl_seconds: float | None = None) -> None:
+        """Store value under key for ttl_seconds (defaults to the cache-wide TTL)."""
+        expires_at = self._clock() + (self.ttl_seconds if ttl_seconds is None else ttl_seconds)
+        with self._lock:
+            self._store(key, value, expires_at)
+        self._disk_set(key, value, expires_at)
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._entries.clear()
+        if self._engine is not None and self._table is not None:
+            with self._engine.begin() as conn:
+                conn.execute(delete(self._table))
+
+    def purge_expired(self) -> int:
+        """Remove expired entries from both tiers and return how many were dropped from memory."""
+        now = self._clock()
+        with self._lock:
+            expired = [key for key, (_, expires_at) in self._entries.items() if expires_at <= now]
+            for key in expired:
+                del self._entries[key]
+            self.stats.expirations += len(expired)
+        if self._engine is not None and self._table is not None:
+            with self._engine.begin() as conn:
+                conn.execute(delete(self._table).where(self._table.c.expires_at <= now))
+        return len(expired)
+
+    def close(self) -> None:
+        """Release the SQLite connection pool, if any."""
+        if self._engine is not None:
+            self._engine.dispose()
+
+    def after_fork(self) -> None:
+        """Drop pooled SQLite connections inherited from the parent process without closing them."""
+        self._lock = threading.Lock()
+        if self._engine is not None:
+            self._engine.dispose(close=False)
+
+    def _store(self, key: str, value: str, expires_at: float) -> None:
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _disk_get(self, key: str, now: float) -> tuple[str, float] | None:
+        if self._engine is None or self._table is None:
+            return None
+        table = self._table
+        with self._engine.connect() as conn:
+            row = conn.execute(select(table.c.value, table.c.expires_at).where(table.c.key == key)).first()
+        if row is None or row.expires_at <= now:
+            return None
+        return row.value, row.expires_at
+
+    def _disk_set(self, key: str, value: str, expires_at: float) -> None:
+        if self._engine is None or self._table is None:
+            return
+        stmt = sqlite_insert(self._table).values(key=key, value=value, expires_at=expires_at)
+        stmt = stmt.on_conflict_do_update(index_elements=["key"], set_={"value": value, "expires_at": expires_at})
+        with self._engine.begin() as conn:
+            conn.execute(stmt)
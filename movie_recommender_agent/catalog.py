@@ -0,0 +1,534 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Offline movie catalog.
+
+Ingests a bulk metadata dump (CSV/TSV/JSONL in an IMDb-style layout) into a compact
+columnar store and builds in-memory inverted indexes on title tokens, genre, year,
+director and cast, so metadata lookups never leave the process. Exa remains the
+source for freshness questions such as new releases and streaming availability.
+
+Build a store from a dump with:
+
+    python -m movie_recommender_agent.catalog title.basics.tsv catalog.npz
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import re
+import unicodedata
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from agno.tools import Toolkit
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_LIST_SEPARATOR = re.compile(r"\s*[,|]\s*")
+_NULL_VALUES = {"", "\\N", "null", "none", "n/a", "nan"}
+
+TEXT_FIELDS = ("id", "title", "language", "content_rating", "synopsis")
+LIST_FIELDS = ("genres", "directors", "cast", "keywords")
+
+_FIELD_ALIASES = {
+    "tconst": "id",
+    "imdb_id": "id",
+    "primarytitle": "title",
+    "primary_title": "title",
+    "name": "title",
+    "startyear": "year",
+    "start_year": "year",
+    "release_year": "year",
+    "runtimeminutes": "runtime",
+    "runtime_minutes": "runtime",
+    "averagerating": "rating",
+    "average_rating": "rating",
+    "imdb_rating": "rating",
+    "numvotes": "votes",
+    "num_votes": "votes",
+    "genre": "genres",
+    "director": "directors",
+    "stars": "cast",
+    "actors": "cast",
+    "original_language": "language",
+    "certificate": "content_rating",
+    "rated": "content_rating",
+    "plot": "synopsis",
+    "overview": "synopsis",
+    "keyword": "keywords",
+    "tags": "keywords",
+}
+
+
+def normalize_text(value: str) -> str:
+    """Fold case and accents so "Amélie" and "amelie" compare equal."""
+    if not value.isascii():
+        value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode()
+    return " ".join(_TOKEN.findall(value.lower()))
+
+
+def tokenize(value: str) -> list[str]:
+    """Split text into normalized alphanumeric tokens."""
+    return normalize_text(value).split()
+
+
+def _title_hash(key: str) -> int:
+    return hash(key) & 0xFFFF_FFFF_FFFF_FFFF
+
+
+def _clean(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        return None if value.lower() in _NULL_VALUES else value
+    return value
+
+
+def _to_list(value: Any) -> list[str]:
+    value = _clean(value)
+    if value is None:
+        return []
+    items = value if isinstance(value, list) else _LIST_SEPARATOR.split(str(value))
+    return [str(item).strip() for item in items if _clean(item) is not None]
+
+
+def _to_number(value: Any, cast: type) -> Any:
+    value = _clean(value)
+    if value is None:
+        return None
+    try:
+        return cast(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class TextColumn:
+    """Immutable string column stored as one UTF-8 blob plus offsets."""
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray) -> None:
+        self.blob = blob
+        self.offsets = offsets
+
+    @classmethod
+    def from_strings(cls, values: Iterable[str]) -> "TextColumn":
+        encoded = [value.encode() for value in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(item) for item in encoded], out=offsets[1:])
+        blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return cls(blob, offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.blob[start:end].tobytes().decode()
+
+    def __iter__(self) -> Iterator[str]:
+        data = self.blob.tobytes()
+        offsets = self.offsets.tolist()
+        for start, end in itertools.pairwise(offsets):
+            yield data[start:end].decode()
+
+
+class ListColumn:
+    """Dictionary-encoded multi-valued column (genres, cast, ...) in CSR layout.
+
+    Row i holds the vocabulary codes ``codes[offsets[i]:offsets[i + 1]]``.
+    """
+
+    def __init__(self, vocab: TextColumn, offsets: np.ndarray, codes: np.ndarray) -> None:
+        self.vocab = vocab
+        self.offsets = offsets
+        self.codes = codes
+
+    @classmethod
+    def from_lists(cls, rows: Iterable[list[str]]) -> "ListColumn":
+        vocab: dict[str, int] = {}
+        raw_codes: dict[str, int] = {}
+        display: list[str] = []
+        codes: list[int] = []
+        lengths: list[int] = []
+        for values in rows:
+            seen: set[int] = set()
+            for value in values:
+                code = raw_codes.get(value)
+                if code is None:
+                    key = normalize_text(value)
+                    code = vocab.get(key, -1) if key else -1
+                    if key and code < 0:
+                        code = vocab[key] = len(display)
+                        display.append(value)
+                    raw_codes[value] = code
+                if code >= 0 and code not in seen:
+                    seen.add(code)
+                    codes.append(code)
+            lengths.append(len(seen))
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return cls(TextColumn.from_strings(display), offsets, np.asarray(codes, dtype=np.int32))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def row_codes(self, index: int) -> np.ndarray:
+        """Vocabulary codes for one row."""
+        return self.codes[self.offsets[index] : self.offsets[index + 1]]
+
+    def values(self, index: int) -> list[str]:
+        """Display values for one row."""
+        return [self.vocab[int(code)] for code in self.row_codes(index)]
+
+
+class InvertedIndex:
+    """Term -> ascending row ids postings, stored as one contiguous array."""
+
+    def __init__(self, terms: dict[str, int], starts: np.ndarray, rows: np.ndarray) -> None:
+        self.terms = terms
+        self.starts = starts
+        self.rows = rows
+
+    @classmethod
+    def from_codes(cls, terms: dict[str, int], offsets: np.ndarray, codes: np.ndarray) -> "InvertedIndex":
+        """Invert a CSR row -> codes mapping into code -> rows postings."""
+        row_of_entry = np.repeat(np.arange(len(offsets) - 1, dtype=np.int32), np.diff(offsets))
+        order = np.argsort(codes, kind="stable")
+        starts = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(codes, minlength=len(terms)), out=starts[1:])
+        return cls(terms, starts, row_of_entry[order])
+
+    def postings(self, term: str) -> np.ndarray:
+        """Row ids containing term (an empty array when the term is unknown)."""
+        code = self.terms.get(term)
+        if code is None:
+            return self.rows[:0]
+        return self.rows[self.starts[code] : self.starts[code + 1]]
+
+    def __contains__(self, term: str) -> bool:
+        return term in self.terms
+
+
+class MovieCatalog:
+    """Columnar movie metadata store with inverted indexes for fast lookups."""
+
+    def __init__(self, columns: dict[str, Any]) -> None:
+        self.text: dict[str, TextColumn] = {name: columns[name] for name in TEXT_FIELDS}
+        self.lists: dict[str, ListColumn] = {name: columns[name] for name in LIST_FIELDS}
+        self.year: np.ndarray = columns["year"]
+        self.runtime: np.ndarray = columns["runtime"]
+        self.rating: np.ndarray = columns["rating"]
+        self.votes: np.ndarray = columns["votes"]
+        self._build_indexes()
+
+    def __len__(self) -> int:
+        return len(self.year)
+
+    # ------------------------------------------------------------------ ingest
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict[str, Any]]) -> "MovieCatalog":
+        """Build a catalog from dict records using IMDb-style or plain field names."""
+        text: dict[str, list[str]] = {name: [] for name in TEXT_FIELDS}
+        lists: dict[str, list[list[str]]] = {name: [] for name in LIST_FIELDS}
+        year: list[int] = []
+        runtime: list[int] = []
+        rating: list[float] = []
+        votes: list[int] = []
+
+        for raw in records:
+            record = {_FIELD_ALIASES.get(key.lower(), key.lower()): value for key, value in raw.items()}
+            title = _clean(record.get("title"))
+            if title is None:
+                continue
+            record["title"] = title
+            for name in TEXT_FIELDS:
+                value = _clean(record.get(name))
+                text[name].append("" if value is None else str(value))
+            for name in LIST_FIELDS:
+                lists[name].append(_to_list(record.get(name)))
+            year.append(_to_number(record.get("year"), int) or 0)
+            runtime.append(_to_number(record.get("runtime"), int) or 0)
+            parsed_rating = _to_number(record.get("rating"), float)
+            rating.append(np.nan if parsed_rating is None else parsed_rating)
+            votes.append(_to_number(record.get("votes"), int) or 0)
+
+        columns: dict[str, Any] = {name: TextColumn.from_strings(values) for name, values in text.items()}
+        columns.update({name: ListColumn.from_lists(values) for name, values in lists.items()})
+        columns["year"] = np.asarray(year, dtype=np.int16)
+        columns["runtime"] = np.asarray(runtime, dtype=np.int16)
+        columns["rating"] = np.asarray(rating, dtype=np.float32)
+        columns["votes"] = np.asarray(votes, dtype=np.int32)
+        return cls(columns)
+
+    @classmethod
+    def from_dump(cls, path: str | Path) -> "MovieCatalog":
+        """Ingest a CSV, TSV or JSONL dump."""
+        path = Path(path)
+        if path.suffix.lower() in {".jsonl", ".ndjson"}:
+            with open(path, encoding="utf-8") as f:
+                return cls.from_records(json.loads(line) for line in f if line.strip())
+
+        # IMDb TSV dumps do not escape quotes inside titles
+        if path.suffix.lower() in {".tsv", ".tab"}:
+            delimiter, quoting = "\t", csv.QUOTE_NONE
+        else:
+            delimiter, quoting = ",", csv.QUOTE_MINIMAL
+        with open(path, encoding="utf-8", newline="") as f:
+            return cls.from_records(csv.DictReader(f, delimiter=delimiter, quoting=quoting))
+
+    @classmethod
+    def load(cls, path: str | Path) -> "MovieCatalog":
+        """Load a catalog from a saved ``.npz`` store or ingest a raw dump."""
+        path = Path(path)
+        if path.suffix.lower() != ".npz":
+            return cls.from_dump(path)
+
+        with np.load(path, allow_pickle=False) as data:
+            columns: dict[str, Any] = {
+                name: TextColumn(data[f"{name}.blob"], data[f"{name}.offsets"]) for name in TEXT_FIELDS
+            }
+            for name in LIST_FIELDS:
+                vocab = TextColumn(data[f"{name}.vocab.blob"], data[f"{name}.vocab.offsets"])
+                columns[name] = ListColumn(vocab, data[f"{name}.offsets"], data[f"{name}.codes"])
+            for name in ("year", "runtime", "rating", "votes"):
+                columns[name] = data[name]
+        return cls(columns)
+
+    def save(self, path: str | Path) -> None:
+        """Persist the columnar store as an uncompressed ``.npz`` archive."""
+        arrays: dict[str, np.ndarray] = {}
+        for name, column in self.text.items():
+            arrays[f"{name}.blob"] = column.blob
+            arrays[f"{name}.offsets"] = column.offsets
+        for name, column in self.lists.items():
+            arrays[f"{name}.vocab.blob"] = column.vocab.blob
+            arrays[f"{name}.vocab.offsets"] = column.vocab.offsets
+            arrays[f"{name}.offsets"] = column.offsets
+            arrays[f"{name}.codes"] = column.codes
+        arrays.update(year=self.year, runtime=self.runtime, rating=self.rating, votes=self.votes)
+        np.savez(path, **arrays)
+
+    # ----------------------------------------------------------------- indexes
+
+    def _build_indexes(self) -> None:
+        self._list_indexes: dict[str, InvertedIndex] = {}
+        for name in ("genres", "directors", "cast"):
+            column = self.lists[name]
+            terms = {normalize_text(value): code for code, value in enumerate(column.vocab)}
+            self._list_indexes[name] = InvertedIndex.from_codes(terms, column.offsets, column.codes)
+
+        title_keys = [normalize_text(title) for title in self.text["title"]]
+        titles = ListColumn.from_lists(key.split() for key in title_keys)
+        title_terms = {value: code for code, value in enumerate(titles.vocab)}
+        self._title_index = InvertedIndex.from_codes(title_terms, titles.offsets, titles.codes)
+
+        # Exact-title lookups binary search a sorted array of normalized-title hashes
+        hashes = np.fromiter((_title_hash(key) for key in title_keys), dtype=np.uint64, count=len(title_keys))
+        self._title_order = np.argsort(hashes, kind="stable").astype(np.int32)
+        self._title_hashes = hashes[self._title_order]
+
+        order = np.argsort(self.year, kind="stable").astype(np.int32)
+        years, starts = np.unique(self.year[order], return_index=True)
+        bounds = np.append(starts, len(order))
+        self._year_postings = {int(year): order[bounds[i] : bounds[i + 1]] for i, year in enumerate(years)}
+
+    def exact_title_matches(self, title: str) -> np.ndarray:
+        """Row ids whose normalized title equals title."""
+        key = normalize_text(title)
+        target = np.uint64(_title_hash(key))
+        start = np.searchsorted(self._title_hashes, target, side="left")
+        end = np.searchsorted(self._title_hashes, target, side="right")
+        rows = self._title_order[start:end]
+        # Guard against hash collisions
+        return rows[[normalize_text(self.text["title"][row]) == key for row in rows]] if len(rows) else rows
+
+    def title_matches(self, title: str) -> np.ndarray:
+        """Row ids whose title contains every token of title."""
+        tokens = tokenize(title)
+        if not tokens:
+            return self._title_index.rows[:0]
+        postings = sorted((self._title_index.postings(token) for token in tokens), key=len)
+        matches = postings[0]
+        for rows in postings[1:]:
+            matches = np.intersect1d(matches, rows, assume_unique=True)
+        return matches
+
+    def _field_postings(self, field: str, value: str) -> np.ndarray:
+        return self._list_indexes[field].postings(normalize_text(value))
+
+    def year_postings(self, start: int, end: int | None = None) -> np.ndarray:
+        """Row ids released between start and end (inclusive)."""
+        end = start if end is None else end
+        parts = [rows for year, rows in self._year_postings.items() if start <= year <= end]
+        return np.sort(np.concatenate(parts)) if parts else np.empty(0, dtype=np.int32)
+
+    # ----------------------------------------------------------------- queries
+
+    def record(self, index: int) -> dict[str, Any]:
+        """Materialise one row as a plain dict."""
+        index = int(index)
+        rating = float(self.rating[index])
+        return {
+            "id": self.text["id"][index] or None,
+            "title": self.text["title"][index],
+            "year": int(self.year[index]) or None,
+            "rating": None if np.isnan(rating) else round(rating, 1),
+            "votes": int(self.votes[index]),
+            "runtime_minutes": int(self.runtime[index]) or None,
+            "genres": self.lists["genres"].values(index),
+            "directors": self.lists["directors"].values(index),
+            "cast": self.lists["cast"].values(index),
+            "language": self.text["language"][index] or None,
+            "content_rating": self.text["content_rating"][index] or None,
+            "synopsis": self.text["synopsis"][index] or None,
+        }
+
+    def rank(self, rows: np.ndarray, limit: int) -> np.ndarray:
+        """Order rows by rating, then vote count, keeping the best limit."""
+        if len(rows) == 0:
+            return rows
+        rating = np.nan_to_num(self.rating[rows], nan=-1.0)
+        if len(rows) > limit > 0:
+            # Only rows rated at least as high as the limit-th best can make the cut
+            keep = rating >= np.partition(rating, -limit)[-limit]
+            rows, rating = rows[keep], rating[keep]
+        order = np.lexsort((-self.votes[rows], -rating))
+        return rows[order[:limit]]
+
+    def lookup(self, title: str, year: int | None = None, limit: int = 5) -> list[dict[str, Any]]:
+        """Find movies by title, preferring exact (normalized) title matches."""
+        rows = self.exact_title_matches(title)
+        if year is not None:
+            rows = rows[self.year[rows] == year]
+        if len(rows) == 0:
+            rows = self.title_matches(title)
+            if year is not None:
+                rows = rows[self.year[rows] == year]
+        rows = rows[np.argsort(-self.votes[rows], kind="stable")][:limit]
+        return [self.record(row) for row in rows]
+
+    def search(
+        self,
+        title: str | None = None,
+        genres: list[str] | None = None,
+        year_from: int | None = None,
+        year_to: int | None = None,
+        director: str | None = None,
+        actor: str | None = None,
+        min_rating: float | None = None,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """Return the best-rated movies matching every given criterion."""
+        candidates: list[np.ndarray] = []
+        if title:
+            candidates.append(self.title_matches(title))
+        for genre in genres or []:
+            candidates.append(self._field_postings("genres", genre))
+        if director:
+            candidates.append(self._field_postings("directors", director))
+        if actor:
+            candidates.append(self._field_postings("cast", actor))
+        if year_from is not None or year_to is not None:
+            candidates.append(self.year_postings(year_from or 1, year_to or np.iinfo(np.int16).max))
+
+        if candidates:
+            candidates.sort(key=len)
+            rows = candidates[0]
+            for other in candidates[1:]:
+                rows = np.intersect1d(rows, other, assume_unique=True)
+        else:
+            rows = np.arange(len(self), dtype=np.int32)
+
+        if min_rating is not None:
+            rows = rows[self.rating[rows] >= min_rating]
+        return [self.record(row) for row in self.rank(rows, limit)]
+
+
+class CatalogTools(Toolkit):
+    """Agent toolkit answering movie metadata questions from the local catalog."""
+
+    def __init__(self, catalog: MovieCatalog, **kwargs: Any) -> None:
+        self.catalog = catalog
+        super().__init__(
+            name="movie_catalog",
+            tools=[self.lookup_movie, self.search_catalog],
+            instructions=(
+                "Use the local movie catalog first for title, year, rating, runtime, director, cast and genre. "
+                "Only use Exa search for new releases, streaming availability, news or titles missing from the catalog."
+            ),
+            add_instructions=True,
+            **kwargs,
+        )
+
+    def lookup_movie(self, title: str, year: int | None = None) -> str:
+        """Look up a movie's metadata (year, rating, runtime, genres, director, cast) in the local catalog.
+
+        Args:
+            title (str): The movie title to look up.
+            year (Optional[int]): Release year, to disambiguate remakes.
+
+        Returns:
+            str: Matching movies in JSON format, or an empty list when not in the catalog.
+        """
+        return json.dumps(self.catalog.lookup(title, year=year), ensure_ascii=False)
+
+    def search_catalog(
+        self,
+        genres: list[str] | None = None,
+        year_from: int | None = None,
+        year_to: int | None = None,
+        director: str | None = None,
+        actor: str | None = None,
+        min_rating: float | None = None,
+        limit: int = 10,
+    ) -> str:
+        """Find the best-rated movies in the local catalog matching all given filters.
+
+        Args:
+            genres (Optional[list[str]]): Genres every result must have, e.g. ["Comedy"].
+            year_from (Optional[int]): Earliest release year.
+            year_to (Optional[int]): Latest release year.
+            director (Optional[str]): Director name.
+            actor (Optional[str]): Cast member name.
+            min_rating (Optional[float]): Minimum IMDb-style rating (0-10).
+            limit (int): Maximum number of movies to return. Defaults to 10.
+
+        Returns:
+            str: Matching movies in JSON format, best rated first.
+        """
+        results = self.catalog.search(
+            genres=genres,
+            year_from=year_from,
+            year_to=year_to,
+            director=director,
+            actor=actor,
+            min_rating=min_rating,
+            limit=limit,
+        )
+        return json.dumps(results, ensure_ascii=False)
+
+
+def main() -> None:
+    """Convert a raw metadata dump into a columnar ``.npz`` store."""
+    parser = argparse.ArgumentParser(description="Build the offline movie catalog from a CSV/TSV/JSONL dump")
+    parser.add_argument("source", type=Path, help="Metadata dump (.csv, .tsv or .jsonl)")
+    parser.add_argument("output", type=Path, help="Destination .npz store")
+    args = parser.parse_args()
+
+    catalog = MovieCatalog.from_dump(args.source)
+    catalog.save(args.output)
+    print(f"🎞️ Catalog with {len(catalog):,} movies written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
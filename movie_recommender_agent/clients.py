@@ -0,0 +1,497 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Shared, pooled HTTP clients for OpenRouter and Exa.
+
+exa_py opens a new connection (DNS lookup, TCP and TLS handshakes) for every call, and
+each model would otherwise build its own client. ClientManager owns one sync and one
+async httpx client with keep-alive HTTP/2 connection pools, a DNS cache, retries
+with jittered exponential backoff (POSTs only when they were never sent or rejected
+unprocessed) and optional per-host rate limits; the model and the Exa tools are given these clients,
+and cleanup() closes them.
+
+Connection pools are created lazily per process, so a pre-forked worker never reuses
+sockets it inherited from the parent.
+"""
+
+import asyncio
+import contextlib
+import email.utils
+import importlib.util
+import json
+import os
+import random
+import socket
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpcore
+import httpx
+from exa_py import Exa
+from exa_py.api import ExaJSONEncoder
+
+# Worth retrying: rate limiting and transient gateway / availability errors
+RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+# Safe to send twice; other methods (POST, PATCH) are only retried when they were never
+# sent or the server turned them away without acting on them
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+REJECTED_STATUSES = frozenset({408, 429, 502, 503, 504})
+
+
+@dataclass
+class ClientConfig:
+    """Connection pool, DNS and retry settings."""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 60.0
+    connect_timeout: float = 5.0
+    read_timeout: float = 120.0
+    http2: bool = True
+    retries: int = 2
+    backoff: float = 0.25
+    max_backoff: float = 8.0
+    dns_ttl: float = 300.0
+    rate_limits: dict[str, float] = field(default_factory=dict)  # host -> requests per second
+
+
+@dataclass
+class ClientStats:
+    """Counters shared by the clients of a ClientManager."""
+
+    requests: int = 0
+    retries: int = 0
+    connections: int = 0
+    dns_hits: int = 0
+    dns_misses: int = 0
+    throttled: int = 0
+    throttle_seconds: float = 0.0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fraction of requests served on an already open connection."""
+        return 1.0 - self.connections / self.requests if self.requests else 0.0
+
+
+class DNSCache:
+    """Resolved addresses cached for ttl seconds, so new pooled connections skip the lookup."""
+
+    def __init__(
+        self, ttl: float = 300.0, stats: ClientStats | None = None, clock: Callable[[], float] = time.monotonic
+    ):
+        self.ttl = ttl
+        self.stats = stats or ClientStats()
+        self._clock = clock
+        self._entries: dict[tuple[str, int], tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, host: str, port: int) -> str | None:
+        """Cached address of host, or None when it has to be resolved."""
+        if self.ttl <= 0 or _is_ip_address(host):
+            return host
+        with self._lock:
+            entry = self._entries.get((host, port))
+            if entry is not None and entry[1] > self._clock():
+                self.stats.dns_hits += 1
+                return entry[0]
+        return None
+
+    def store(self, host: str, port: int, infos: list) -> str:
+        """Remember the first address getaddrinfo returned for host."""
+        address = infos[0][4][0]
+        with self._lock:
+            self.stats.dns_misses += 1
+            self._entries[(host, port)] = (address, self._clock() + self.ttl)
+        return address
+
+    def forget(self, host: str, port: int) -> None:
+        """Drop a cached address that could not be connected to."""
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+    def resolve(self, host: str, port: int) -> str:
+        address = self.lookup(host, port)
+        if address is None:
+            address = self.store(host, port, socket.getaddrinfo(host, port, type=socket.SOCK_STREAM))
+        return address
+
+    async def aresolve(self, host: str, port: int) -> str:
+        address = self.lookup(host, port)
+        if address is None:
+            infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            address = self.store(host, port, infos)
+        return address
+
+
+class _CachingBackend(httpcore.NetworkBackend):
+    """Sync network backend that connects to DNS-cached addresses (TLS still verifies the hostname)."""
+
+    def __init__(self, dns: DNSCache) -> None:
+        self._dns = dns
+        self._backend = httpcore.SyncBackend()
+
+    def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Any = None,
+    ) -> httpcore.NetworkStream:
+        address = self._dns.resolve(host, port)
+        self._dns.stats.connections += 1
+        try:
+            return self._backend.connect_tcp(address, port, timeout, local_address, socket_options)
+        except httpcore.ConnectError:
+            self._dns.forget(host, port)
+            raise
+
+    def connect_unix_socket(self, path: str, timeout: float | None = None, socket_options: Any = None) -> Any:
+        return self._backend.connect_unix_socket(path, timeout, socket_options)
+
+    def sleep(self, seconds: float) -> None:
+        self._backend.sleep(seconds)
+
+
+class _AsyncCachingBackend(httpcore.AsyncNetworkBackend):
+    """Async counterpart of _CachingBackend."""
+
+    def __init__(self, dns: DNSCache) -> None:
+        self._dns = dns
+        self._backend = httpcore.AnyIOBackend()
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Any = None,
+    ) -> httpcore.AsyncNetworkStream:
+        address = await self._dns.aresolve(host, port)
+        self._dns.stats.connections += 1
+        try:
+            return await self._backend.connect_tcp(address, port, timeout, local_address, socket_options)
+        except httpcore.ConnectError:
+            self._dns.forget(host, port)
+            raise
+
+    async def connect_unix_socket(self, path: str, timeout: float | None = None, socket_options: Any = None) -> Any:
+        return await self._backend.connect_unix_socket(path, timeout, socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class RateLimiter:
+    """Token bucket: `rate` requests per second on average, in bursts of up to `burst`.
+
+    Callers reserve a token and wait until it is due, so concurrent callers (threads or
+    tasks) are spaced out in the order they arrived.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None, clock: Callable[[], float] = time.monotonic) -> None:
+        if rate <= 0:
+            error_msg = "rate must be positive"
+            raise ValueError(error_msg)
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token; returns the seconds to wait before using it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate) - 1
+            self._updated = now
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+
+class _Retrying:
+    """Retry policy, rate limits and per-process transport shared by the sync and async transports."""
+
+    def __init__(
+        self,
+        config: ClientConfig,
+        stats: ClientStats,
+        create: Callable[[], Any],
+        limiters: dict[str, RateLimiter] | None = None,
+    ) -> None:
+        self.config = config
+        self.stats = stats
+        self.limiters = limiters or {}
+        self._create = create
+        self._transport: Any = None
+        self._pid: int | None = None
+
+    @property
+    def transport(self) -> Any:
+        # A forked worker builds its own pool; the inherited one is left for the parent to close
+        if self._pid != os.getpid():
+            self._transport, self._pid = self._create(), os.getpid()
+        return self._transport
+
+    def release(self) -> Any:
+        """Forget the pooled transport; returns it when this process created it and should close it."""
+        transport = self._transport if self._pid == os.getpid() else None
+        self._transport, self._pid = None, None
+        return transport
+
+    def delay(self, attempt: int, response: httpx.Response | None) -> float:
+        """Full-jitter exponential backoff, or the server's Retry-After when it is shorter than the cap."""
+        retry_after = _retry_after(response) if response is not None else None
+        if retry_after is not None and retry_after <= self.config.max_backoff:
+            return retry_after
+        return random.uniform(0, min(self.config.max_backoff, self.config.backoff * 2**attempt))  # noqa: S311
+
+    def throttle(self, request: httpx.Request) -> float:
+        """Seconds to wait before sending a request to a rate-limited host (every attempt counts)."""
+        limiter = self.limiters.get(request.url.host)
+        delay = limiter.reserve() if limiter is not None else 0.0
+        if delay:
+            self.stats.throttled += 1
+            self.stats.throttle_seconds += delay
+        return delay
+
+    def should_retry(
+        self,
+        attempt: int,
+        request: httpx.Request,
+        response: httpx.Response | None,
+        error: httpx.TransportError | None = None,
+    ) -> bool:
+        if attempt >= self.config.retries:
+            return False
+        if request.method not in IDEMPOTENT_METHODS:
+            # The server may already have acted on it unless it was never sent or rejected
+            if response is None:
+                return isinstance(error, NOT_SENT_ERRORS)
+            return response.status_code in REJECTED_STATUSES
+        return response is None or response.status_code in RETRY_STATUSES
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Pooled sync transport that retries transport errors and retryable statuses."""
+
+    def __init__(self, retrying: _Retrying) -> None:
+        self._retrying = retrying
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            throttle = self._retrying.throttle(request)
+            if throttle:
+                time.sleep(throttle)
+            self._retrying.stats.requests += 1
+            try:
+                response = self._retrying.transport.handle_request(request)
+            except httpx.TransportError as e:
+                if not self._retrying.should_retry(attempt, request, None, e):
+                    raise
+                response = None
+            if response is not None and not self._retrying.should_retry(attempt, request, response):
+                return response
+            delay = self._retrying.delay(attempt, response)
+            if response is not None:
+                # Reading the (short) error body lets its connection go back to the pool
+                response.read()
+                response.close()
+            self._retrying.stats.retries += 1
+            attempt += 1
+            time.sleep(delay)
+
+    def close(self) -> None:
+        transport = self._retrying.release()
+        if transport is not None:
+            transport.close()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Pooled async transport that retries transport errors and retryable statuses."""
+
+    def __init__(self, retrying: _Retrying) -> None:
+        self._retrying = retrying
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            throttle = self._retrying.throttle(request)
+            if throttle:
+                await asyncio.sleep(throttle)
+            self._retrying.stats.requests += 1
+            try:
+                response = await self._retrying.transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                if not self._retrying.should_retry(attempt, request, None, e):
+                    raise
+                response = None
+            if response is not None and not self._retrying.should_retry(attempt, request, response):
+                return response
+            delay = self._retrying.delay(attempt, response)
+            if response is not None:
+                await response.aread()
+                await response.aclose()
+            self._retrying.stats.retries += 1
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        transport = self._retrying.release()
+        if transport is not None:
+            await transport.aclose()
+
+
+class ClientManager:
+    """Owns the pooled HTTP clients shared by the model and the tools.
+
+    transport and async_transport replace the pooled network transports (retries and rate
+    limits still apply); the benchmark uses them to serve requests from fake backends.
+    Rate limits are shared by both clients, so a host's limit holds across all callers.
+    """
+
+    def __init__(
+        self,
+        config: ClientConfig | None = None,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.config = config or ClientConfig()
+        self.stats = ClientStats()
+        self.dns = DNSCache(self.config.dns_ttl, self.stats)
+        self.transport = transport
+        self.async_transport = async_transport
+        self.limiters = {host: RateLimiter(rate) for host, rate in self.config.rate_limits.items() if rate > 0}
+        self._client: httpx.Client | None = None
+        self._async_client: httpx.AsyncClient | None = None
+
+    @property
+    def http2(self) -> bool:
+        """Whether HTTP/2 is negotiated (h2 comes with httpx[http2]; a bare httpx falls back to HTTP/1.1)."""
+        return self.config.http2 and importlib.util.find_spec("h2") is not None
+
+    @property
+    def client(self) -> httpx.Client:
+        """The shared sync client."""
+        if self._client is None:
+            retrying = _Retrying(self.config, self.stats, self._create_transport, self.limiters)
+            self._client = httpx.Client(transport=RetryTransport(retrying), timeout=self._timeout())
+        return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """The shared async client."""
+        if self._async_client is None:
+            retrying = _Retrying(self.config, self.stats, self._create_async_transport, self.limiters)
+            self._async_client = httpx.AsyncClient(transport=AsyncRetryTransport(retrying), timeout=self._timeout())
+        return self._async_client
+
+    def close(self) -> None:
+        """Close the sync client's pooled connections."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self) -> None:
+        """Close both clients' pooled connections."""
+        self.close()
+        if self._async_client is not None:
+            # Connections opened on an event loop that is already closed cannot be closed gracefully
+            with contextlib.suppress(RuntimeError):
+                await self._async_client.aclose()
+            self._async_client = None
+
+    def _timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(self.config.read_timeout, connect=self.config.connect_timeout)
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.config.max_connections,
+            max_keepalive_connections=self.config.max_keepalive_connections,
+            keepalive_expiry=self.config.keepalive_expiry,
+        )
+
+    def _create_transport(self) -> httpx.BaseTransport:
+        if self.transport is not None:
+            return self.transport
+        transport = httpx.HTTPTransport(http2=self.http2, limits=self._limits())
+        # httpx has no public hook for name resolution; swap in the caching backend (httpcore is pinned to 1.x)
+        transport._pool._network_backend = _CachingBackend(self.dns)
+        return transport
+
+    def _create_async_transport(self) -> httpx.AsyncBaseTransport:
+        if self.async_transport is not None:
+            return self.async_transport
+        transport = httpx.AsyncHTTPTransport(http2=self.http2, limits=self._limits())
+        transport._pool._network_backend = _AsyncCachingBackend(self.dns)
+        return transport
+
+
+class PooledExa(Exa):
+    """exa_py client that sends its requests over a shared pooled httpx client."""
+
+    def __init__(self, api_key: str | None, client: httpx.Client, **kwargs: Any) -> None:
+        super().__init__(api_key, **kwargs)
+        self.client = client
+
+    def request(
+        self,
+        endpoint: str,
+        data: dict[str, Any] | str | None = None,
+        method: str = "POST",
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Any:
+        streaming = (isinstance(data, dict) and data.get("stream")) or (params and params.get("stream") == "true")
+        if streaming or method.upper() not in ("GET", "POST", "PATCH", "DELETE"):
+            return super().request(endpoint, data, method, params, headers)
+
+        body = data if isinstance(data, str) else json.dumps(data, cls=ExaJSONEncoder) if data else None
+        response = self.client.request(
+            method.upper(),
+            self.base_url + endpoint,
+            content=body if method.upper() in ("POST", "PATCH") else None,
+            params=params,
+            headers={**self.headers, **(headers or {})},
+        )
+        if response.status_code >= 400:
+            error_msg = f"Request failed with status code {response.status_code}: {response.text}"
+            raise ValueError(error_msg)
+        return response.json()
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Seconds from a Retry-After header (delta-seconds or HTTP date), if any."""
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(email.utils.parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_ip_address(host: str) -> bool:
+    for family in (socket.AF_INET, socket.AF_INET6):
+        try:
+            socket.inet_pton(family, host)
+        except OSError:
+            continue
+        return True
+    return False
@@ -0,0 +1,556 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Collaborative filtering: "people who liked what you liked also liked" from rating history.
+
+Ratings (0.5-5 stars) form a sparse user x movie matrix kept as plain NumPy CSR arrays.
+The model is implicit-feedback ALS: a rating of at least ``dislike_below`` is a like and
+a lower one a dislike, held with confidence ``1 + alpha * |rating - dislike_below|``.
+User and movie factors are fitted alternately with a few conjugate-gradient steps per
+row, vectorized over all rows at once.
+
+New ratings are folded in without retraining: the user's factor is re-solved exactly
+against the fixed movie factors (one small linear system), so recommendations change
+on the next call. Movies nobody had rated at training time join at the next full fit.
+A user's latest rating of a movie replaces the earlier one, so replaying a ratings log
+that a later fit already absorbed is harmless.
+
+Train a model from a ratings dump (CSV/TSV/JSONL with user, movie and rating columns) with:
+
+    python -m movie_recommender_agent.collaborative ratings.csv cf.npz
+"""
+
+import argparse
+import csv
+import json
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from agno.run import RunContext
+from agno.tools import Toolkit
+
+from movie_recommender_agent.catalog import MovieCatalog
+
+# Column names accepted for each field of a ratings dump (MovieLens, IMDb-style or plain)
+_FIELD_ALIASES = {
+    "user": ("user_id", "userid", "user"),
+    "movie": ("movie_id", "movieid", "tconst", "item_id", "itemid", "id"),
+    "rating": ("rating", "score", "stars"),
+}
+
+
+def read_ratings(paths: Iterable[str | Path]) -> Iterator[tuple[str, str, float]]:
+    """Stream (user, movie, rating) triples from CSV, TSV or JSONL dumps; rows without a rating are likes (5)."""
+    for path in map(Path, paths):
+        with open(path, encoding="utf-8", newline="") as f:
+            if path.suffix.lower() in {".jsonl", ".ndjson"}:
+                records: Iterable[dict[str, Any]] = (json.loads(line) for line in f if line.strip())
+            else:
+                records = csv.DictReader(f, delimiter="\t" if path.suffix.lower() in {".tsv", ".tab"} else ",")
+            for raw in records:
+                record = {key.lower(): value for key, value in raw.items()}
+                fields = {name: _first(record, names) for name, names in _FIELD_ALIASES.items()}
+                if fields["user"] in (None, "") or fields["movie"] in (None, ""):
+                    continue
+                rating = fields["rating"]
+                yield str(fields["user"]), str(fields["movie"]), 5.0 if rating in (None, "") else float(rating)
+
+
+def _first(record: dict[str, Any], names: tuple[str, ...]) -> Any:
+    return next((record[name] for name in names if name in record), None)
+
+
+def _weights(ratings: np.ndarray, alpha: float, dislike_below: float) -> tuple[np.ndarray, np.ndarray]:
+    """Confidence of each rating and its preference (1 for a like, 0 for a dislike)."""
+    confidence = 1 + alpha * np.abs(ratings - dislike_below)
+    return confidence.astype(np.float32), (ratings >= dislike_below).astype(np.float32)
+
+
+def _segment_sum(values: np.ndarray, indptr: np.ndarray) -> np.ndarray:
+    """Sum of the columns of values over each [indptr[i], indptr[i + 1]) segment; empty segments sum to zero.
+
+    Values are factor-major (factors x entries): ``reduceat`` along contiguous rows is
+    several times faster than along the first axis.
+    """
+    out = np.zeros((values.shape[0], len(indptr) - 1), dtype=values.dtype)
+    nonempty = np.flatnonzero(np.diff(indptr))
+    if len(nonempty):
+        out[:, nonempty] = np.add.reduceat(values, indptr[nonempty], axis=1)
+    return out
+
+
+def _row_chunks(indptr: np.ndarray, max_nnz: int) -> Iterator[tuple[int, int]]:
+    """Consecutive row ranges holding at most max_nnz entries each (or a single larger row)."""
+    start, n_rows = 0, len(indptr) - 1
+    while start < n_rows:
+        end = int(np.searchsorted(indptr, indptr[start] + max_nnz, side="right")) - 1
+        end = min(max(end, start + 1), n_rows)
+        yield start, end
+        start = end
+
+
+def _conjugate_gradient(
+    factors: np.ndarray,
+    other: np.ndarray,
+    indptr: np.ndarray,
+    indices: np.ndarray,
+    confidence: np.ndarray,
+    preference: np.ndarray,
+    regularization: float,
+    steps: int,
+    max_nnz: int = 1 << 20,
+) -> None:
+    """Update every row of factors in place with a few CG steps on its implicit-ALS system.
+
+    Row u solves (OᵀO + λI + Oᵤᵀ(Cᵤ - I)Oᵤ) x = Oᵤᵀ Cᵤ pᵤ, where Oᵤ are the factors of
+    the entries it rated and pᵤ their preferences. Rows are processed in chunks so the
+    gathered factors stay bounded.
+    """
+    gram = other.T @ other + regularization * np.eye(other.shape[1], dtype=other.dtype)
+    other_t = np.ascontiguousarray(other.T)
+    for start, end in _row_chunks(indptr, max_nnz):
+        lo, hi = indptr[start], indptr[end]
+        local = indptr[start : end + 1] - lo
+        rows = np.repeat(np.arange(end - start), np.diff(local))
+        rated = np.take(other_t, indices[lo:hi], axis=1)
+        weight = confidence[lo:hi]
+        target = weight * preference[lo:hi]
+
+        def apply(p: np.ndarray, rated=rated, weight=weight, rows=rows, local=local) -> np.ndarray:
+            projected = (weight - 1) * np.einsum("ij,ij->j", rated, np.take(p, rows, axis=1))
+            return gram @ p + _segment_sum(rated * projected, local)
+
+        # Column u of x is the factor of row start + u
+        x = np.ascontiguousarray(factors[start:end].T)
+        residual = _segment_sum(rated * target, local) - apply(x)
+        direction = residual.copy()
+        norm = (residual * residual).sum(axis=0)
+        for _ in range(steps):
+            applied = apply(direction)
+            curvature = (direction * applied).sum(axis=0)
+            step = np.divide(norm, curvature, out=np.zeros_like(norm), where=curvature > 0)
+            x += step * direction
+            residual -= step * applied
+            new_norm = (residual * residual).sum(axis=0)
+            ratio = np.divide(new_norm, norm, out=np.zeros_like(norm), where=norm > 0)
+            direction = residual + ratio * direction
+            norm = new_norm
+        factors[start:end] = x.T
+
+
+class CollaborativeModel:
+    """Implicit-feedback matrix factorization over a sparse user x movie rating matrix.
+
+    ``indptr``/``indices``/``ratings`` are the CSR rating matrix at training time; users
+    with folded-in ratings keep their current history in a small overlay.
+    """
+
+    def __init__(
+        self,
+        user_ids: list[str],
+        movie_ids: list[str],
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        ratings: np.ndarray,
+        user_factors: np.ndarray,
+        movie_factors: np.ndarray,
+        regularization: float = 0.05,
+        alpha: float = 2.0,
+        dislike_below: float = 2.5,
+    ) -> None:
+        self.user_ids = list(user_ids)
+        self.movie_ids = list(movie_ids)
+        self.user_index = {user: row for row, user in enumerate(self.user_ids)}
+        self.movie_index = {movie: row for row, movie in enumerate(self.movie_ids)}
+        self.indptr = indptr
+        self.indices = indices
+        self.ratings = ratings
+        self.movie_factors = movie_factors
+        self.regularization = regularization
+        self.alpha = alpha
+        self.dislike_below = dislike_below
+        self.folded = 0
+        self._user_factors = np.array(user_factors, dtype=np.float32)
+        self._history: dict[int, tuple[np.ndarray, np.ndarray]] = {}
+        self._gram = movie_factors.T @ movie_factors + regularization * np.eye(movie_factors.shape[1], dtype=np.float32)
+        norms = np.linalg.norm(movie_factors, axis=1, keepdims=True)
+        self._unit_movies = movie_factors / np.where(norms > 0, norms, 1.0)
+        self._lock = threading.Lock()
+
+    @property
+    def n_users(self) -> int:
+        return len(self.user_ids)
+
+    @property
+    def n_movies(self) -> int:
+        return len(self.movie_ids)
+
+    @property
+    def user_factors(self) -> np.ndarray:
+        return self._user_factors[: self.n_users]
+
+    # ---------------------------------------------------------------- training
+
+    @classmethod
+    def fit(
+        cls,
+        ratings: Iterable[tuple[str, str, float]],
+        factors: int = 64,
+        iterations: int = 10,
+        regularization: float = 0.05,
+        alpha: float = 2.0,
+        dislike_below: float = 2.5,
+        cg_steps: int = 3,
+        seed: int = 0,
+    ) -> "CollaborativeModel":
+        """Fit user and movie factors on (user, movie, rating) triples; a repeated pair keeps its last rating."""
+        ratings = list(ratings)
+        users, movies, values = zip(*ratings, strict=True) if ratings else ((), (), ())
+        user_ids, user_codes = np.unique(np.asarray(users, dtype=str), return_inverse=True)
+        movie_ids, movie_codes = np.unique(np.asarray(movies, dtype=str), return_inverse=True)
+        values = np.asarray(values, dtype=np.float32)
+
+        # Unique (user, movie) pairs in CSR order, each with its last rating
+        pairs = user_codes.astype(np.int64) * len(movie_ids) + movie_codes
+        _, last_from_end = np.unique(pairs[::-1], return_index=True)
+        keep = len(pairs) - 1 - last_from_end
+        user_codes, movie_codes, values = user_codes[keep], movie_codes[keep].astype(np.int32), values[keep]
+
+        indptr = np.zeros(len(user_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(user_codes, minlength=len(user_ids)), out=indptr[1:])
+        by_movie = np.argsort(movie_codes, kind="stable")
+        movie_ptr = np.zeros(len(movie_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(movie_codes, minlength=len(movie_ids)), out=movie_ptr[1:])
+        confidence, preference = _weights(values, alpha, dislike_below)
+
+        rng = np.random.default_rng(seed)
+        user_factors = (rng.standard_normal((len(user_ids), factors)) * 0.01).astype(np.float32)
+        movie_factors = (rng.standard_normal((len(movie_ids), factors)) * 0.01).astype(np.float32)
+        for _ in range(iterations):
+            _conjugate_gradient(
+                user_factors, movie_factors, indptr, movie_codes, confidence, preference, regularization, cg_steps
+            )
+            _conjugate_gradient(
+                movie_factors,
+                user_factors,
+                movie_ptr,
+                user_codes[by_movie],
+                confidence[by_movie],
+                preference[by_movie],
+                regularization,
+                cg_steps,
+            )
+        return cls(
+            user_ids.tolist(),
+            movie_ids.tolist(),
+            indptr,
+            movie_codes,
+            values,
+            user_factors,
+            movie_factors,
+            regularization,
+            alpha,
+            dislike_below,
+        )
+
+    # ----------------------------------------------------------------- fold-in
+
+    def history(self, user: int) -> tuple[np.ndarray, np.ndarray]:
+        """Movies a user rated and their ratings, including folded-in ones."""
+        if user in self._history:
+            return self._history[user]
+        if user >= len(self.indptr) - 1:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+        start, end = self.indptr[user], self.indptr[user + 1]
+        return self.indices[start:end], self.ratings[start:end]
+
+    def add_ratings(self, user_id: str, ratings: dict[str, float]) -> list[str]:
+        """Fold new ratings of a (possibly new) user into the model; returns the movie ids it does not know."""
+        unknown = [movie for movie in ratings if movie not in self.movie_index]
+        with self._lock:
+            user = self.user_index.get(user_id)
+            if user is None:
+                user = self._add_user(user_id)
+            movies, values = self.history(user)
+            merged = dict(zip(movies.tolist(), values.tolist(), strict=True))
+            merged.update({
+                self.movie_index[movie]: rating for movie, rating in ratings.items() if movie not in unknown
+            })
+            movies = np.fromiter(merged, dtype=np.int32, count=len(merged))
+            values = np.fromiter(merged.values(), dtype=np.float32, count=len(merged))
+            self._history[user] = (movies, values)
+            self._user_factors[user] = self._solve(movies, values)
+            self.folded += 1
+        return unknown
+
+    def _solve(self, movies: np.ndarray, ratings: np.ndarray) -> np.ndarray:
+        """Exact least-squares user factor for a rating history, with the movie factors fixed."""
+        rated = self.movie_factors[movies]
+        confidence, preference = _weights(ratings, self.alpha, self.dislike_below)
+        system = self._gram + (rated.T * (confidence - 1)) @ rated
+        return np.linalg.solve(system, rated.T @ (confidence * preference))
+
+    def _add_user(self, user_id: str) -> int:
+        user = self.n_users
+        if user == len(self._user_factors):
+            grown = np.zeros((max(2 * user, 16), self.movie_factors.shape[1]), dtype=np.float32)
+            grown[:user] = self._user_factors[:user]
+            self._user_factors = grown
+        self.user_ids.append(user_id)
+        self.user_index[user_id] = user
+        return user
+
+    # ----------------------------------------------------------------- scoring
+
+    def recommend(self, user_id: str, k: int = 10) -> tuple[np.ndarray, np.ndarray]:
+        """Top-k unrated movies for a user as (movie rows, scores); empty for unknown users."""
+        user = self.user_index.get(user_id)
+        if user is None:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        rows, scores = self.recommend_batch([user], k)
+        found = rows[0] >= 0
+        return rows[0][found], scores[0][found]
+
+    def recommend_batch(
+        self, users: list[int] | np.ndarray, k: int = 10, chunk: int = 1024
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Top-k unrated movies for many users as (rows, scores) arrays of shape (users, k).
+
+        Users are scored chunk by chunk with one matrix product and a row-wise
+        ``argpartition``; slots left when a user has rated nearly everything are -1.
+        """
+        users = np.asarray(users, dtype=np.int64)
+        k = max(min(k, self.n_movies), 0)
+        result_rows = np.full((len(users), k), -1, dtype=np.int64)
+        result_scores = np.zeros((len(users), k), dtype=np.float32)
+        if not k:
+            return result_rows, result_scores
+        for start in range(0, len(users), chunk):
+            block = users[start : start + chunk]
+            scores = self.user_factors[block] @ self.movie_factors.T
+            for i, user in enumerate(block):
+                scores[i, self.history(int(user))[0]] = -np.inf
+            top = np.argpartition(scores, -k, axis=1)[:, -k:]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind="stable")
+            top_rows = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+            missing = np.isneginf(top_scores)
+            top_rows[missing], top_scores[missing] = -1, 0.0
+            result_rows[start : start + len(block)] = top_rows
+            result_scores[start : start + len(block)] = top_scores
+        return result_rows, result_scores
+
+    def because(self, user_id: str, movies: np.ndarray) -> np.ndarray:
+        """For each movie, the movie the user rated whose factors are most alike (-1 without history)."""
+        rated = self.history(self.user_index[user_id])[0] if user_id in self.user_index else np.empty(0, np.int32)
+        if len(rated) == 0 or len(movies) == 0:
+            return np.full(len(movies), -1, dtype=np.int64)
+        similarity = self._unit_movies[movies] @ self._unit_movies[rated].T
+        return rated[np.argmax(similarity, axis=1)].astype(np.int64)
+
+    # ------------------------------------------------------------- persistence
+
+    def replay(self, path: str | Path) -> int:
+        """Fold in the ratings of a log written since the model was trained; returns how many were applied."""
+        path = Path(path)
+        if not path.exists():
+            return 0
+        by_user: dict[str, dict[str, float]] = {}
+        for user, movie, rating in read_ratings([path]):
+            by_user.setdefault(user, {})[movie] = rating
+        for user, ratings in by_user.items():
+            self.add_ratings(user, ratings)
+        return sum(len(ratings) for ratings in by_user.values())
+
+    def save(self, path: str | Path) -> None:
+        """Persist factors and the rating matrix (with folded-in ratings) as an uncompressed ``.npz``."""
+        with self._lock:
+            histories = [self.history(user) for user in range(self.n_users)]
+            indptr = np.zeros(self.n_users + 1, dtype=np.int64)
+            np.cumsum([len(movies) for movies, _ in histories], out=indptr[1:])
+            empty = (np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32))
+            np.savez(
+                path,
+                user_ids=np.asarray(self.user_ids, dtype=str),
+                movie_ids=np.asarray(self.movie_ids, dtype=str),
+                indptr=indptr,
+                indices=np.concatenate([movies for movies, _ in histories] or [empty[0]]).astype(np.int32),
+                ratings=np.concatenate([values for _, values in histories] or [empty[1]]).astype(np.float32),
+                user_factors=self.user_factors,
+                movie_factors=self.movie_factors,
+                regularization=np.float32(self.regularization),
+                alpha=np.float32(self.alpha),
+                dislike_below=np.float32(self.dislike_below),
+            )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "CollaborativeModel":
+        """Load a model saved with ``save``."""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                data["user_ids"].tolist(),
+                data["movie_ids"].tolist(),
+                data["indptr"],
+                data["indices"],
+                data["ratings"],
+                data["user_factors"],
+                data["movie_factors"],
+                float(data["regularization"]),
+                float(data["alpha"]),
+                float(data["dislike_below"]),
+            )
+
+
+def ratings_log_path(model_path: str | Path) -> Path:
+    """Log of ratings collected since the model at model_path was trained."""
+    model_path = Path(model_path)
+    return model_path.with_name(f"{model_path.stem}.ratings.jsonl")
+
+
+class CollaborativeTools(Toolkit):
+    """Agent toolkit recommending from the user's rating history and recording new ratings."""
+
+    def __init__(
+        self,
+        catalog: MovieCatalog,
+        model: CollaborativeModel,
+        log_path: str | Path | None = None,
+        user_id: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self.catalog = catalog
+        self.model = model
+        self.log_path = Path(log_path) if log_path else None
+        self.user_id = user_id
+        self._log_lock = threading.Lock()
+        # Model movie -> catalog row, matched on the catalog's movie id (tconst)
+        catalog_ids = np.asarray(list(catalog.text["id"]), dtype=str)
+        movie_ids = np.asarray(model.movie_ids, dtype=str)
+        order = np.argsort(catalog_ids, kind="stable")
+        positions = np.clip(np.searchsorted(catalog_ids[order], movie_ids), 0, max(len(order) - 1, 0))
+        found = catalog_ids[order][positions] == movie_ids if len(order) else np.zeros(len(movie_ids), dtype=bool)
+        self.catalog_rows = np.where(found, order[positions] if len(order) else -1, -1)
+        super().__init__(
+            name="collaborative_filtering",
+            tools=[self.recommend_from_history, self.rate_movies],
+            instructions=(
+                "For personal picks, call recommend_from_history first and choose among its candidates "
+                "instead of searching; when the user tells you how they liked movies, call rate_movies."
+            ),
+            add_instructions=True,
+            **kwargs,
+        )
+
+    def _user_id(self, run_context: RunContext) -> str | None:
+        return getattr(run_context, "user_id", None) or self.user_id
+
+    def recommend_from_history(self, run_context: RunContext, limit: int = 10) -> str:
+        """Recommend movies the user has not rated, from what users with similar ratings liked.
+
+        Args:
+            limit (int): Maximum number of movies to return. Defaults to 10.
+
+        Returns:
+            str: JSON candidates, best first, each with the rated movie it most resembles.
+        """
+        user_id = self._user_id(run_context)
+        if user_id is None:
+            return "Error in recommend_from_history: A user_id must be provided in the method call."
+        if user_id not in self.model.user_index:
+            return json.dumps({"recommendations": [], "note": "No rating history yet; ask which movies they liked."})
+
+        # Over-fetch: movies missing from the catalog are skipped
+        limit = max(limit, 0)
+        movies, scores = self.model.recommend(user_id, k=limit * 2)
+        keep = self.catalog_rows[movies] >= 0
+        movies, scores = movies[keep][:limit], scores[keep][:limit]
+        because = self.model.because(user_id, movies)
+        results = []
+        for movie, score, seed in zip(movies, scores, because, strict=True):
+            record = self.catalog.record(self.catalog_rows[movie])
+            record["score"] = round(float(score), 3)
+            if seed >= 0 and self.catalog_rows[seed] >= 0:
+                record["because_you_rated"] = self.catalog.text["title"][self.catalog_rows[seed]]
+            results.append(record)
+        return json.dumps({"recommendations": results}, ensure_ascii=False)
+
+    def rate_movies(self, run_context: RunContext, ratings: dict[str, float]) -> str:
+        """Record how the user rated movies so the next recommendations take it into account.
+
+        Args:
+            ratings (dict[str, float]): Movie title -> stars from 0.5 to 5, e.g. {"Oldboy": 5, "Tenet": 2}.
+
+        Returns:
+            str: JSON with the recorded titles and those that could not be matched.
+        """
+        user_id = self._user_id(run_context)
+        if user_id is None:
+            return "Error in rate_movies: A user_id must be provided in the method call."
+        by_id: dict[str, float] = {}
+        titles: dict[str, str] = {}
+        not_found: list[str] = []
+        for title, rating in ratings.items():
+            matches = self.catalog.exact_title_matches(title)
+            if len(matches) == 0:
+                matches = self.catalog.title_matches(title)
+            movie_id = ""
+            if len(matches):
+                movie_id = self.catalog.text["id"][int(matches[np.argmax(self.catalog.votes[matches])])]
+            if not movie_id:
+                not_found.append(title)
+                continue
+            by_id[movie_id] = float(rating)
+            titles[movie_id] = title
+
+        unknown = set(self.model.add_ratings(user_id, by_id)) if by_id else set()
+        if self.log_path is not None and by_id:
+            lines = "".join(
+                json.dumps({"user_id": user_id, "movie_id": movie_id, "rating": rating}) + "\n"
+                for movie_id, rating in by_id.items()
+            )
+            with self._log_lock, open(self.log_path, "a", encoding="utf-8") as log:
+                log.write(lines)
+        payload = {
+            "recorded": [titles[movie_id] for movie_id in by_id if movie_id not in unknown],
+            "recorded_for_next_training": [titles[movie_id] for movie_id in unknown],
+            "not_found": not_found,
+        }
+        return json.dumps(payload, ensure_ascii=False)
+
+
+def main() -> None:
+    """Train a collaborative-filtering model on ratings dumps."""
+    parser = argparse.ArgumentParser(description="Train the collaborative-filtering model on a ratings dump")
+    parser.add_argument("sources", type=Path, nargs="+", help="Ratings dumps (.csv, .tsv or .jsonl), oldest first")
+    parser.add_argument("output", type=Path, help="Destination .npz model")
+    parser.add_argument("--factors", type=int, default=64, help="Latent factors per user and movie")
+    parser.add_argument("--iterations", type=int, default=10, help="ALS iterations")
+    parser.add_argument("--regularization", type=float, default=0.05, help="L2 regularization")
+    parser.add_argument("--alpha", type=float, default=2.0, help="Confidence gained per star from the threshold")
+    parser.add_argument("--dislike-below", type=float, default=2.5, help="Ratings below this are dislikes")
+    args = parser.parse_args()
+
+    model = CollaborativeModel.fit(
+        list(read_ratings(args.sources)),
+        factors=args.factors,
+        iterations=args.iterations,
+        regularization=args.regularization,
+        alpha=args.alpha,
+        dislike_below=args.dislike_below,
+    )
+    model.save(args.output)
+    print(f"👥 Collaborative model of {model.n_users:,} users x {model.n_movies:,} movies written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,403 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Hard-constraint filtering (genre, language, content rating, year, runtime, rating) over the catalog.
+
+Every attribute value owns a roaring-style container: a sorted ``int32`` array of row
+ids while the value is rare (fewer than one movie in 32, where the array is smaller
+than a bitmap) and a dense ``uint64`` bitmap otherwise. Year, runtime and rating are
+range-encoded: one bitmap per bucket edge holds every movie below that edge, so a
+range snapped to its nearest edges is ``below[hi] & ~below[lo]``, and the few rows
+between each bound and its edge are added or removed using a value-sorted copy of the
+column.
+
+A compound constraint ANDs one container per attribute (values of one attribute are
+ORed). Arrays are intersected with each other first and then probed against bitmaps
+bit by bit, as roaring does, so a selective constraint never touches a whole bitmap;
+only all-dense queries run word-wise over the catalog. Results stay encoded: they are
+counted with a popcount, and the best-rated few are found by probing the rating order
+from the top instead of decoding and sorting every match.
+"""
+
+import json
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+from agno.tools import Toolkit
+
+from movie_recommender_agent.catalog import MovieCatalog, normalize_text
+
+# Bucket edges of the range-encoded columns
+YEAR_EDGES = np.arange(1890, 2035, 5)
+RUNTIME_EDGES = np.arange(30, 241, 15)
+RATING_EDGES = np.arange(1.0, 10.0, 0.5)
+
+
+def _words(size: int) -> int:
+    return (size + 63) // 64
+
+
+def _is_sparse(count: int, size: int) -> bool:
+    return count * 32 < size
+
+
+def bits_from_mask(mask: np.ndarray) -> np.ndarray:
+    """Bitmap of a boolean row mask."""
+    packed = np.zeros(_words(len(mask)) * 8, dtype=np.uint8)
+    packed[: (len(mask) + 7) // 8] = np.packbits(mask, bitorder="little")
+    return packed.view("<u8").astype(np.uint64)
+
+
+def bits_from_rows(rows: np.ndarray, size: int) -> np.ndarray:
+    """Bitmap of ``size`` bits with the given rows set."""
+    if len(rows) * 64 > size:
+        mask = np.zeros(size, dtype=bool)
+        mask[rows] = True
+        return bits_from_mask(mask)
+    words = np.zeros(_words(size), dtype=np.uint64)
+    np.bitwise_or.at(words, rows >> 6, np.left_shift(np.uint64(1), (rows & 63).astype(np.uint64)))
+    return words
+
+
+def rows_from_bits(words: np.ndarray) -> np.ndarray:
+    """Ascending row ids set in a bitmap.
+
+    Peels the lowest set bit off every non-zero word per pass, so the cost follows the
+    number of rows rather than the catalog size.
+    """
+    index = np.flatnonzero(words)
+    words = words[index]
+    parts = []
+    while len(words):
+        lowest = words & (~words + np.uint64(1))
+        # A power of two converts to float64 exactly, so log2 is its bit position
+        parts.append(index * 64 + np.log2(lowest.astype(np.float64)).astype(np.int64))
+        words ^= lowest
+        remaining = words != 0
+        words, index = words[remaining], index[remaining]
+    return np.sort(np.concatenate(parts)).astype(np.int32) if parts else np.empty(0, dtype=np.int32)
+
+
+def to_rows(container: np.ndarray) -> np.ndarray:
+    """Ascending row ids of a container."""
+    return rows_from_bits(container) if container.dtype == np.uint64 else container
+
+
+def count(container: np.ndarray) -> int:
+    """Number of rows in a container."""
+    return int(np.bitwise_count(container).sum()) if container.dtype == np.uint64 else len(container)
+
+
+def _contains(container: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Mask of the rows present in a container."""
+    if container.dtype != np.uint64:
+        return np.isin(rows, container, assume_unique=True)
+    return ((container[rows >> 6] >> (rows & 63).astype(np.uint64)) & np.uint64(1)).astype(bool)
+
+
+def _dense(container: np.ndarray, size: int) -> np.ndarray:
+    return container if container.dtype == np.uint64 else bits_from_rows(container, size)
+
+
+def _container(rows: np.ndarray, size: int) -> np.ndarray:
+    """Sorted row array for rare values, bitmap for common ones."""
+    rows = np.sort(rows).astype(np.int32)
+    return rows if _is_sparse(len(rows), size) else bits_from_rows(rows, size)
+
+
+def _union(containers: list[np.ndarray], size: int) -> np.ndarray:
+    if all(container.dtype != np.uint64 for container in containers):
+        return np.unique(np.concatenate(containers)).astype(np.int32)
+    return np.bitwise_or.reduce([_dense(container, size) for container in containers])
+
+
+class ValueIndex:
+    """Attribute value -> container, for categorical columns (genres, language, content rating)."""
+
+    def __init__(self, terms: dict[str, int], containers: list[np.ndarray], size: int) -> None:
+        self.terms = terms
+        self.containers = containers
+        self.size = size
+
+    @classmethod
+    def from_codes(cls, terms: dict[str, int], offsets: np.ndarray, codes: np.ndarray, size: int) -> "ValueIndex":
+        """Build from a CSR row -> value codes mapping."""
+        rows = np.repeat(np.arange(len(offsets) - 1, dtype=np.int32), np.diff(offsets))
+        order = np.argsort(codes, kind="stable")
+        bounds = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(codes, minlength=len(terms)), out=bounds[1:])
+        rows = rows[order]
+        containers = [_container(rows[bounds[code] : bounds[code + 1]], size) for code in range(len(terms))]
+        return cls(terms, containers, size)
+
+    @classmethod
+    def from_values(cls, values: Iterable[str]) -> "ValueIndex":
+        """Build from a single-valued text column; empty values are left out."""
+        distinct: dict[str, int] = {}
+        raw_codes = np.fromiter((distinct.setdefault(value, len(distinct)) for value in values), dtype=np.int64)
+        # Normalize each distinct value once; values normalizing to the same key share a code
+        terms: dict[str, int] = {}
+        keys = [normalize_text(value) for value in distinct]
+        mapping = np.array([terms.setdefault(key, len(terms)) if key else -1 for key in keys], dtype=np.int64)
+        codes = mapping[raw_codes] if len(raw_codes) else raw_codes
+        offsets = np.zeros(len(codes) + 1, dtype=np.int64)
+        np.cumsum(codes >= 0, out=offsets[1:])
+        return cls.from_codes(terms, offsets, codes[codes >= 0], len(codes))
+
+    def any_of(self, values: list[str]) -> tuple[np.ndarray, list[str]]:
+        """Rows having at least one of values, plus the values not in the index."""
+        containers, unknown = [], []
+        for value in values:
+            code = self.terms.get(normalize_text(value))
+            if code is None:
+                unknown.append(value)
+            else:
+                containers.append(self.containers[code])
+        if not containers:
+            return np.empty(0, dtype=np.int32), unknown
+        return _union(containers, self.size), unknown
+
+    @property
+    def nbytes(self) -> int:
+        return sum(container.nbytes for container in self.containers)
+
+
+class RangeIndex:
+    """Range-encoded bucket bitmaps over a numeric column, with exact bucket edges."""
+
+    def __init__(
+        self, values: np.ndarray, known: np.ndarray, edges: np.ndarray, tiebreak: np.ndarray | None = None
+    ) -> None:
+        self.size = len(values)
+        rows = np.flatnonzero(known).astype(np.int32)
+        # Equal values are ordered by tiebreak, then by descending row
+        keys = [values[rows]] if tiebreak is None else [-rows, tiebreak[rows], values[rows]]
+        self.order = rows[np.lexsort(keys)]
+        self.sorted_values = values[self.order]
+        edges = edges.astype(values.dtype)
+        # below[i] holds the rows order[:positions[i]]: nothing, every row under each edge, every row
+        self.positions = np.concatenate(([0], np.searchsorted(self.sorted_values, edges), [len(self.order)]))
+        self.below = np.stack([
+            bits_from_mask(np.zeros(self.size, dtype=bool)),
+            *(bits_from_mask(known & (values < edge)) for edge in edges),
+            bits_from_mask(known),
+        ])
+
+    def _nearest_edge(self, position: int) -> int:
+        i = int(np.searchsorted(self.positions, position))
+        if i == len(self.positions) or (i and position - self.positions[i - 1] < self.positions[i] - position):
+            return i - 1
+        return i
+
+    def _adjust(self, words: np.ndarray, edge: int, position: int, lower_bound: bool) -> None:
+        """Move the boundary of words from the bucket edge to an exact sorted position."""
+        edge_position = int(self.positions[edge])
+        piece = self.order[min(edge_position, position) : max(edge_position, position)]
+        if len(piece) == 0:
+            return
+        if (position < edge_position) == lower_bound:
+            words |= bits_from_rows(piece, self.size)
+        else:
+            words &= ~bits_from_rows(piece, self.size)
+
+    def between(self, low: float | None = None, high: float | None = None) -> np.ndarray:
+        """Rows whose value lies in [low, high] (either bound may be open)."""
+        # Bounds are compared in the column's dtype, so min_rating=7.1 keeps a float32 7.1
+        cast = self.sorted_values.dtype.type
+        start = 0 if low is None else int(np.searchsorted(self.sorted_values, cast(low), side="left"))
+        end = len(self.order) if high is None else int(np.searchsorted(self.sorted_values, cast(high), side="right"))
+        if end - start <= 0:
+            return np.empty(0, dtype=np.int32)
+        # Whole buckets between the edges nearest to each bound, then add or remove the rows in between
+        first, last = self._nearest_edge(start), self._nearest_edge(end)
+        if _is_sparse(end - start, self.size) or first >= last:
+            return _container(self.order[start:end], self.size)
+        words = self.below[last] & ~self.below[first]
+        self._adjust(words, first, start, lower_bound=True)
+        self._adjust(words, last, end, lower_bound=False)
+        return words
+
+    @property
+    def nbytes(self) -> int:
+        return self.below.nbytes + self.order.nbytes + self.sorted_values.nbytes
+
+
+def intersect(include: list[np.ndarray], exclude: list[np.ndarray], size: int) -> np.ndarray:
+    """Container of the rows present in every include container and in no exclude container."""
+    arrays = sorted((c for c in include if c.dtype != np.uint64), key=len)
+    bitmaps = [c for c in include if c.dtype == np.uint64]
+    if arrays:
+        rows = arrays[0]
+        for other in arrays[1:]:
+            rows = np.intersect1d(rows, other, assume_unique=True)
+        for container in bitmaps:
+            rows = rows[_contains(container, rows)]
+        for container in exclude:
+            rows = rows[~_contains(container, rows)]
+        return rows
+
+    words = np.bitwise_and.reduce(bitmaps) if bitmaps else bits_from_mask(np.ones(size, dtype=bool))
+    for container in exclude:
+        words = words & ~_dense(container, size)
+    return words
+
+
+class ConstraintIndex:
+    """Bitmap indexes answering compound hard constraints over a catalog."""
+
+    def __init__(self, catalog: MovieCatalog) -> None:
+        self.catalog = catalog
+        self.size = len(catalog)
+        genres = catalog.lists["genres"]
+        terms = {normalize_text(value): code for code, value in enumerate(genres.vocab)}
+        self.genres = ValueIndex.from_codes(terms, genres.offsets, genres.codes, self.size)
+        self.languages = ValueIndex.from_values(catalog.text["language"])
+        self.content_ratings = ValueIndex.from_values(catalog.text["content_rating"])
+        self.year = RangeIndex(catalog.year, catalog.year > 0, YEAR_EDGES)
+        self.runtime = RangeIndex(catalog.runtime, catalog.runtime > 0, RUNTIME_EDGES)
+        # Read backwards, the rating order is MovieCatalog.rank order: rating, then votes, then row
+        self.rating = RangeIndex(catalog.rating, ~np.isnan(catalog.rating), RATING_EDGES, tiebreak=catalog.votes)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the indexes."""
+        indexes = (self.genres, self.languages, self.content_ratings, self.year, self.runtime, self.rating)
+        return sum(index.nbytes for index in indexes)
+
+    def filter(
+        self,
+        genres: list[str] | None = None,
+        exclude_genres: list[str] | None = None,
+        languages: list[str] | None = None,
+        content_ratings: list[str] | None = None,
+        year_from: int | None = None,
+        year_to: int | None = None,
+        runtime_min: int | None = None,
+        runtime_max: int | None = None,
+        min_rating: float | None = None,
+    ) -> tuple[np.ndarray, list[str]]:
+        """Container of the rows matching every constraint, plus requested values the catalog does not know.
+
+        Every genre is required; any of the languages or content ratings will do.
+        """
+        include: list[np.ndarray] = []
+        unknown: list[str] = []
+        for genre in genres or []:
+            rows, missing = self.genres.any_of([genre])
+            include.append(rows)
+            unknown += missing
+        for index, values in ((self.languages, languages), (self.content_ratings, content_ratings)):
+            if values:
+                rows, missing = index.any_of(values)
+                include.append(rows)
+                unknown += missing
+        for index, low, high in (
+            (self.year, year_from, year_to),
+            (self.runtime, runtime_min, runtime_max),
+            (self.rating, min_rating, None),
+        ):
+            if low is not None or high is not None:
+                include.append(index.between(low, high))
+
+        exclude = [self.genres.any_of([genre])[0] for genre in exclude_genres or []]
+        return intersect(include, exclude, self.size), unknown
+
+    def best(self, container: np.ndarray, limit: int) -> np.ndarray:
+        """The limit best-rated rows of a container, as ``MovieCatalog.rank`` orders them.
+
+        For a bitmap, walks the rating order from the top, probing a widening window of
+        rows against it, so only about limit / density rows are read.
+        """
+        if container.dtype != np.uint64 or limit <= 0:
+            return self.catalog.rank(to_rows(container), limit)
+        order = self.rating.order
+        window = 4 * limit
+        while True:
+            start = max(len(order) - window, 0)
+            top = order[start:][::-1]
+            hits = top[_contains(container, top)]
+            if len(hits) >= limit or start == 0:
+                break
+            window *= 4
+        if len(hits) >= limit:
+            return hits[:limit]
+        unrated = rows_from_bits(container & ~self.rating.below[-1])
+        return np.concatenate((hits, self.catalog.rank(unrated, limit - len(hits))))
+
+
+class ConstraintTools(Toolkit):
+    """Agent toolkit returning the catalog movies that satisfy every hard constraint."""
+
+    def __init__(self, catalog: MovieCatalog, index: ConstraintIndex | None = None, **kwargs: Any) -> None:
+        self.catalog = catalog
+        self.index = index or ConstraintIndex(catalog)
+        super().__init__(
+            name="movie_constraints",
+            tools=[self.filter_movies],
+            instructions=(
+                "When a request has hard constraints (decade, runtime, language, content rating, genres to include "
+                "or avoid, minimum rating), call filter_movies first and recommend from its candidates instead of "
+                "checking search results against the constraints yourself."
+            ),
+            add_instructions=True,
+            **kwargs,
+        )
+
+    def filter_movies(
+        self,
+        genres: list[str] | None = None,
+        exclude_genres: list[str] | None = None,
+        languages: list[str] | None = None,
+        content_ratings: list[str] | None = None,
+        year_from: int | None = None,
+        year_to: int | None = None,
+        runtime_min: int | None = None,
+        runtime_max: int | None = None,
+        min_rating: float | None = None,
+        limit: int = 20,
+    ) -> str:
+        """Find the best-rated catalog movies that satisfy every hard constraint.
+
+        Args:
+            genres (Optional[list[str]]): Genres every result must have, e.g. ["Thriller"].
+            exclude_genres (Optional[list[str]]): Genres no result may have, e.g. ["Horror"].
+            languages (Optional[list[str]]): Accepted languages, any of them, e.g. ["French", "Italian"].
+            content_ratings (Optional[list[str]]): Accepted content ratings, e.g. ["G", "PG", "PG-13"].
+            year_from (Optional[int]): Earliest release year, e.g. 1990 for "90s movies".
+            year_to (Optional[int]): Latest release year, e.g. 1999.
+            runtime_min (Optional[int]): Minimum runtime in minutes.
+            runtime_max (Optional[int]): Maximum runtime in minutes, e.g. 100 for "under 100 minutes".
+            min_rating (Optional[float]): Minimum IMDb-style rating (0-10).
+            limit (int): Maximum number of candidates to return. Defaults to 20.
+
+        Returns:
+            str: JSON with the number of matching movies, constraint values missing from the catalog
+                and the best-rated candidates.
+        """
+        rows, unknown = self.index.filter(
+            genres=genres,
+            exclude_genres=exclude_genres,
+            languages=languages,
+            content_ratings=content_ratings,
+            year_from=year_from,
+            year_to=year_to,
+            runtime_min=runtime_min,
+            runtime_max=runtime_max,
+            min_rating=min_rating,
+        )
+        candidates = []
+        for row in self.index.best(rows, limit):
+            record = self.catalog.record(row)
+            candidates.append({
+                key: record[key]
+                for key in ("id", "title", "year", "rating", "runtime_minutes", "genres", "language", "content_rating")
+            })
+        payload = {"matches": count(rows), "unknown_values": unknown, "candidates": candidates}
+        return json.dumps(payload, ensure_ascii=False)
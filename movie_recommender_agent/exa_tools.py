@@ -0,0 +1,190 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Exa tools backed by the result cache.
+
+Repeated lookups are answered from a ResultCache, and search_movies researches several
+films concurrently in a single tool call.
+"""
+
+import json
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any
+
+import httpx
+from agno.tools.exa import ExaTools
+
+from movie_recommender_agent.cache import ResultCache, make_cache_key
+from movie_recommender_agent.clients import PooledExa
+
+
+class CachedExaTools(ExaTools):
+    """ExaTools whose lookups are answered from a ResultCache when possible.
+
+    Error responses are never cached, so a transient Exa failure is retried on the next call.
+    Concurrent identical lookups (the same film researched for several users) share one
+    Exa call. With an http_client, Exa requests go over its pooled connections.
+    """
+
+    def __init__(
+        self,
+        cache: ResultCache | None = None,
+        max_concurrency: int = 8,
+        batch_timeout: float | None = None,
+        http_client: httpx.Client | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self.cache = cache if cache is not None else ResultCache()
+        self.max_concurrency = max_concurrency
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._inflight: dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self.coalesced = 0
+        super().__init__(**kwargs)
+        if http_client is not None:
+            # Reuse pooled keep-alive connections instead of a new connection per lookup
+            self.exa = PooledExa(self.api_key, client=http_client)
+        self.batch_timeout = batch_timeout if batch_timeout is not None else float(self.timeout)
+        self.register(self.search_movies)
+
+    def _cached(self, fetch: Callable[..., str], query: Any, **params: Any) -> str:
+        key = make_cache_key(fetch.__name__, query, **params)
+        value = self.cache.get(key)
+        if value is not None:
+            return value
+        with self._inflight_lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                self._inflight[key] = future = Future()
+            else:
+                self.coalesced += 1
+        if pending is not None:
+            return pending.result()
+        try:
+            value = fetch(query, **params)
+            if not value.startswith("Error:"):
+                self.cache.set(key, value)
+            future.set_result(value)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+        return value
+
+    def search_exa(self, query: str, num_results: int = 5, category: str | None = None) -> str:
+        """Use this function to search Exa (a web search engine) for a query.
+
+        Args:
+            query (str): The query to search for.
+            num_results (int): Number of results to return. Defaults to 5.
+            category (Optional[str]): The category to filter search results.
+                Options are "company", "research paper", "news", "pdf", "github",
+                "tweet", "personal site", "linkedin profile", "financial report".
+
+        Returns:
+            str: The search results in JSON format.
+        """
+        return self._cached(super().search_exa, query, num_results=num_results, category=category)
+
+    def get_contents(self, urls: list[str]) -> str:
+        """Retrieve detailed content from specific URLs using the Exa API.
+
+        Args:
+            urls (list(str)): A list of URLs from which to fetch content.
+
+        Returns:
+            str: The search results in JSON format.
+        """
+        return self._cached(super().get_contents, urls)
+
+    def find_similar(self, url: str, num_results: int = 5) -> str:
+        """Find similar links to a given URL using the Exa API.
+
+        Args:
+            url (str): The URL for which to find similar links.
+            num_results (int, optional): The number of similar links to return. Defaults to 5.
+
+        Returns:
+            str: The search results in JSON format.
+        """
+        return self._cached(super().find_similar, url, num_results=num_results)
+
+    def exa_answer(self, query: str, text: bool = False) -> str:
+        """Get an LLM answer to a question informed by Exa search results.
+
+        Args:
+            query (str): The question or query to answer.
+            text (bool): Include full text from citation. Default is False.
+
+        Returns:
+            str: The answer results in JSON format with both generated answer and sources.
+        """
+        return self._cached(super().exa_answer, query, text=text)
+
+    def search_movies(
+        self,
+        titles: list[str],
+        details: str = "rating, runtime, director, cast, reviews and streaming availability",
+        num_results: int = 3,
+    ) -> str:
+        """Research several movies at once; use this instead of one search per movie.
+
+        Args:
+            titles (list(str)): Movie titles to look up, optionally with the year, e.g. "Oldboy (2003)".
+            details (str): What to find out about each movie.
+                Defaults to rating, runtime, director, cast, reviews and streaming availability.
+            num_results (int): Number of results per movie. Defaults to 3.
+
+        Returns:
+            str: JSON with the search results for each title, and an error message for
+                each title whose lookup failed or timed out.
+        """
+        titles = list(dict.fromkeys(titles))
+        futures = {
+            title: self._pool().submit(self.search_exa, f"{title} movie {details}", num_results=num_results)
+            for title in titles
+        }
+        # Lookups run concurrently, so the whole batch shares one deadline
+        wait(futures.values(), timeout=self.batch_timeout)
+
+        results: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+        for title, future in futures.items():
+            if not future.done():
+                future.cancel()
+                errors[title] = f"Timed out after {self.batch_timeout:g}s"
+                continue
+            try:
+                value = future.result()
+            except Exception as e:
+                errors[title] = str(e)
+                continue
+            if value.startswith("Error:"):
+                errors[title] = value.removeprefix("Error:").strip()
+            else:
+                results[title] = json.loads(value)
+        return json.dumps({"results": results, "errors": errors}, ensure_ascii=False)
+
+    def close(self) -> None:
+        """Stop the lookup threads without waiting for lookups that already timed out."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _pool(self) -> ThreadPoolExecutor:
+        # Created on first use, so pre-forked workers never inherit live threads
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_concurrency, thread_name_prefix="exa")
+            return self._executor
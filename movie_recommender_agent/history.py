@@ -0,0 +1,200 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Bounded conversation history with a rolling preference summary.
+
+bindu hands the handler the whole conversation on every request, so in a long
+browsing session the prompt would grow without bound. HistoryWindow keeps the most
+recent turns verbatim, up to a turn count and a token budget, and folds the older
+turns into a short preference summary ("likes Korean, thriller; dislikes horror;
+already recommended: Tenet") sent as a system message in their place.
+
+The summary is built without an LLM and incrementally: the summary of a conversation
+prefix is cached under a chained hash of its turns, so each request only folds the
+turns that left the window since the previous one.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from movie_recommender_agent.catalog import tokenize
+
+_WORD_OR_SYMBOL = re.compile(r"\w+|[^\w\s]")
+_BOLD_TITLE = re.compile(r"\*\*([^*\n]{2,80}?)\*\*")
+_REFERENCE_TITLE = re.compile(r"\b(?:like|similar to|such as)\s+((?:[A-Z0-9][\w'\u2019:&-]*\s?)+)")
+_CLAUSE = re.compile(r"[.;!?\n]|,\s*(?:but|and)\b|\bbut\b")
+_NEGATIONS = frozenset({
+    "aren", "avoid", "cannot", "didn", "dislike", "dislikes", "doesn", "doesnt", "don", "dont", "hate", "hates", "isn",
+    "never", "no", "not", "nothing", "without", "won",
+})  # fmt: skip
+
+# Words worth remembering as a preference, mapped to the label used in the summary
+_PREFERENCE_TERMS = {
+    "action": "action", "adventure": "adventure", "animated": "animation", "animation": "animation",
+    "anime": "anime", "comedies": "comedy", "comedy": "comedy", "crime": "crime", "documentaries": "documentary",
+    "documentary": "documentary", "drama": "drama", "dramas": "drama", "fantasy": "fantasy", "heist": "heist",
+    "horror": "horror", "musical": "musical", "musicals": "musical", "mystery": "mystery", "noir": "noir",
+    "romance": "romance", "romantic": "romance", "scifi": "sci-fi", "sci": "sci-fi", "superhero": "superhero",
+    "thriller": "thriller", "thrillers": "thriller", "war": "war", "western": "western", "westerns": "western",
+    "bollywood": "Bollywood", "chinese": "Chinese", "french": "French", "german": "German", "hindi": "Hindi",
+    "italian": "Italian", "japanese": "Japanese", "korean": "Korean", "spanish": "Spanish",
+    "subtitles": "subtitles", "dubbed": "dubbed", "gore": "gore", "violence": "violence", "violent": "violence",
+    "slow": "slow-paced", "sad": "sad endings", "feelgood": "feel-good", "uplifting": "uplifting",
+    "dark": "dark tone", "kids": "kid-friendly", "family": "family-friendly", "classic": "classics",
+    "classics": "classics", "recent": "recent releases", "short": "short runtimes", "long": "long runtimes",
+}  # fmt: skip
+
+
+def count_tokens(text: str) -> int:
+    """Local estimate of BPE tokens: one per common word, more for long words, one per symbol."""
+    return sum(1 + (len(piece) - 1) // 7 for piece in _WORD_OR_SYMBOL.findall(text))
+
+
+def message_tokens(message: dict[str, Any]) -> int:
+    """Tokens of a chat message, including a few for the role and framing."""
+    content = message.get("content")
+    return 4 + (count_tokens(content) if isinstance(content, str) else 0)
+
+
+@dataclass
+class PreferenceSummary:
+    """What the user asked for in turns that no longer fit the window."""
+
+    likes: dict[str, None] = field(default_factory=dict)
+    dislikes: dict[str, None] = field(default_factory=dict)
+    references: dict[str, None] = field(default_factory=dict)
+    recommended: dict[str, None] = field(default_factory=dict)
+    turns: int = 0
+
+    def copy(self) -> "PreferenceSummary":
+        return PreferenceSummary(
+            dict(self.likes), dict(self.dislikes), dict(self.references), dict(self.recommended), self.turns
+        )
+
+    def fold(self, message: dict[str, Any]) -> None:
+        """Update the summary with one older turn."""
+        content = message.get("content")
+        if not isinstance(content, str):
+            return
+        self.turns += 1
+        if message.get("role") == "assistant":
+            for title in _BOLD_TITLE.findall(content):
+                self.recommended[title.strip()] = None
+            return
+        if message.get("role") != "user":
+            return
+
+        for title in _REFERENCE_TITLE.findall(content):
+            self.references[title.strip()] = None
+        for clause in _CLAUSE.split(content):
+            words = tokenize(clause)
+            negated = any(word in _NEGATIONS for word in words)
+            for word in words:
+                label = _PREFERENCE_TERMS.get(word)
+                if label is None:
+                    continue
+                # A later turn can change its mind: the latest statement wins
+                target, other = (self.dislikes, self.likes) if negated else (self.likes, self.dislikes)
+                other.pop(label, None)
+                target.pop(label, None)
+                target[label] = None
+
+    def render(self, max_tokens: int = 200) -> str:
+        """The summary as a short system message, most recent items kept when over max_tokens."""
+        parts = []
+        for name, items, limit in (
+            ("likes", self.likes, 12),
+            ("dislikes", self.dislikes, 12),
+            ("reference titles", self.references, 8),
+            ("already recommended (avoid repeating)", self.recommended, 30),
+        ):
+            if items:
+                parts.append((name, list(items)[-limit:]))
+
+        while True:
+            body = "; ".join(f"{name}: {', '.join(values)}" for name, values in parts)
+            text = f"Summary of {self.turns} earlier turns of this conversation. User preferences so far - {body}."
+            longest = max(parts, key=lambda part: len(part[1]), default=None)
+            if count_tokens(text) <= max_tokens or longest is None or len(longest[1]) <= 1:
+                return text
+            longest[1].pop(0)
+
+
+class HistoryWindow:
+    """Trim a chat request to its recent turns, summarizing the rest."""
+
+    def __init__(
+        self, max_turns: int = 8, token_budget: int = 2_000, summary_max_tokens: int = 200, cache_size: int = 1_024
+    ) -> None:
+        if max_turns < 1:
+            error_msg = "max_turns must be at least 1"
+            raise ValueError(error_msg)
+        self.max_turns = max_turns
+        self.token_budget = token_budget
+        self.summary_max_tokens = summary_max_tokens
+        self.cache_size = cache_size
+        self.folded_turns = 0
+        self._summaries: OrderedDict[bytes, PreferenceSummary] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, values: dict[str, Any]) -> "HistoryWindow | None":
+        """Build from the "history" section of agent_config.json; None when it is absent or disabled."""
+        if not values.get("enabled", False):
+            return None
+        options = ("max_turns", "token_budget", "summary_max_tokens", "cache_size")
+        return cls(**{key: values[key] for key in options if key in values})
+
+    def window(self, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Leading system messages, a summary of older turns if any, then the recent turns."""
+        lead = 0
+        while lead < len(messages) and messages[lead].get("role") == "system":
+            lead += 1
+        system, turns = messages[:lead], messages[lead:]
+
+        # Walk back from the newest turn; the last one is always kept
+        budget = self.token_budget
+        keep = 0
+        for message in reversed(turns):
+            cost = message_tokens(message)
+            if keep and (keep >= self.max_turns or cost > budget):
+                break
+            budget -= cost
+            keep += 1
+        if keep == len(turns):
+            return messages
+
+        older, recent = turns[: len(turns) - keep], turns[len(turns) - keep :]
+        summary = self._summarize(older)
+        return [*system, {"role": "system", "content": summary.render(self.summary_max_tokens)}, *recent]
+
+    def _summarize(self, older: list[dict[str, Any]]) -> PreferenceSummary:
+        """Summary of the given turns, resuming from the longest prefix summarized before."""
+        chain = [b""]
+        for message in older:
+            payload = f"{message.get('role')}\0{message.get('content')}".encode()
+            chain.append(hashlib.blake2b(chain[-1] + payload, digest_size=16).digest())
+
+        with self._lock:
+            start = next((i for i in range(len(older), 0, -1) if chain[i] in self._summaries), 0)
+            summary = self._summaries[chain[start]].copy() if start else PreferenceSummary()
+        for message in older[start:]:
+            summary.fold(message)
+
+        with self._lock:
+            self.folded_turns += len(older) - start
+            self._summaries[chain[-1]] = summary
+            self._summaries.move_to_end(chain[-1])
+            while len(self._summaries) > self.cache_size:
+                self._summaries.popitem(last=False)
+        return summary
@@ -15,28 +15,71 @@ Uses Exa search for up-to-date movie information, ratings, and reviews.
 
 import argparse
 import asyncio
+import inspect
 import json
 import os
 import sys
+import time
 import traceback
+from collections.abc import AsyncIterator
+from contextlib import ExitStack
 from pathlib import Path
-from textwrap import dedent
-from typing import Any
-
-from agno.agent import Agent
-from agno.models.openrouter import OpenRouter
-from agno.tools.exa import ExaTools
-from agno.tools.mem0 import Mem0Tools
-from bindu.penguin.bindufy import bindufy
+from typing import TYPE_CHECKING, Any
+
 from dotenv import load_dotenv
 
+from movie_recommender_agent.history import HistoryWindow
+from movie_recommender_agent.pool import AgentPool, PoolExhaustedError
+from movie_recommender_agent.prompt import PromptStats, SystemPrompt
+from movie_recommender_agent.rendering import RecommendationSet, render_json, render_markdown
+from movie_recommender_agent.response_cache import SemanticResponseCache, request_key, request_user, response_text
+from movie_recommender_agent.routing import FAST, PREMIUM, ModelRouter, RoutingConfig
+from movie_recommender_agent.singleflight import SingleFlight
+from movie_recommender_agent.snapshots import SnapshotConfig, SnapshotRefresher, SnapshotStore
+from movie_recommender_agent.streaming import StreamedResponse, agent_deltas, line_chunks, relay
+from movie_recommender_agent.telemetry import MetricsServer, Span, Telemetry
+
+# agno's Agent and models, Exa, Mem0, bindu and the optional tools take seconds to import;
+# they are imported where the agent is built or served, so importing this module (and
+# --help) stays fast and Mem0 is only loaded when it is used
+if TYPE_CHECKING:
+    from agno.agent import Agent
+    from agno.models.openrouter import OpenRouter
+    from agno.tools.mem0 import Mem0Tools
+
+    from movie_recommender_agent.cache import ResultCache
+    from movie_recommender_agent.catalog import MovieCatalog
+    from movie_recommender_agent.clients import ClientManager
+    from movie_recommender_agent.exa_tools import CachedExaTools
+    from movie_recommender_agent.mem0_tools import QueuedMem0Tools
+    from movie_recommender_agent.memory import LocalMemoryStore, WriteBehindQueue
+
 # Load environment variables from .env file
 load_dotenv()
 
 # Global instances
-agent: Agent | None = None
+agent: "Agent | None" = None
+agent_pool: AgentPool | None = None
+_fast_pool: AgentPool | None = None
+_history: HistoryWindow | None = None
+_memory_store: "LocalMemoryStore | None" = None
+_mem0_tools: "QueuedMem0Tools | None" = None
+_router: ModelRouter | None = None
+_exa_cache: "ResultCache | None" = None
+_exa_tools: "CachedExaTools | None" = None
+_http: "ClientManager | None" = None
+_response_cache: SemanticResponseCache | None = None
+_snapshots: SnapshotRefresher | None = None
+catalog: "MovieCatalog | None" = None
 _initialized = False
+_ready_pid: int | None = None
 _init_lock = asyncio.Lock()
+_single_flight = SingleFlight()
+# Set when a tool answers or writes per user (collaborative filtering): responses are then never shared
+_per_user_tools = False
+_prompt_stats = PromptStats()
+_telemetry = Telemetry()
+_metrics_server: MetricsServer | None = None
 
 
 class APIKeyError(ValueError):
@@ -106,8 +149,31 @@ def _get_api_keys() -> tuple[str | None, str | None, str | None, str]:
     return openrouter_api_key, mem0_api_key, exa_api_key, model_name
 
 
-def _create_llm_model(openrouter_api_key: str, model_name: str) -> OpenRouter:
+def _create_http_clients() -> "ClientManager":
+    """Create the pooled HTTP clients shared by the models and Exa from environment settings."""
+    from movie_recommender_agent.clients import ClientConfig, ClientManager
+
+    return ClientManager(
+        ClientConfig(
+            max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", "100")),
+            max_keepalive_connections=int(os.getenv("HTTP_MAX_KEEPALIVE", "20")),
+            keepalive_expiry=float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "60")),
+            http2=os.getenv("HTTP_HTTP2", "true").lower() in ("1", "true", "yes"),
+            retries=int(os.getenv("HTTP_RETRIES", "2")),
+            dns_ttl=float(os.getenv("HTTP_DNS_TTL", "300")),
+            # Requests per second (0: unlimited), shared by every caller in this process
+            rate_limits={
+                "openrouter.ai": float(os.getenv("OPENROUTER_RATE_LIMIT", "0")),
+                "api.exa.ai": float(os.getenv("EXA_RATE_LIMIT", "0")),
+            },
+        )
+    )
+
+
+def _create_llm_model(openrouter_api_key: str, model_name: str, http: "ClientManager | None" = None) -> "OpenRouter":
     """Create and return the OpenRouter model."""
+    from agno.models.openrouter import OpenRouter
+
     if not openrouter_api_key:
         error_msg = (
             "OpenRouter API key is required. Set OPENROUTER_API_KEY environment variable.\n"
@@ -118,29 +184,115 @@ def _create_llm_model(openrouter_api_key: str, model_name: str) -> OpenRouter:
     return OpenRouter(
         id=model_name,
         api_key=openrouter_api_key,
-        cache_response=True,
+        cache_response=os.getenv("MODEL_RESPONSE_CACHE", "true").lower() in ("1", "true", "yes"),
         supports_native_structured_outputs=True,
+        # Retries (with jitter) are handled by the pooled client's transport
+        http_client=http.async_client if http is not None else None,
+        max_retries=0 if http is not None else None,
+    )
+
+
+def _create_exa_cache() -> "ResultCache":
+    """Create the Exa result cache from environment settings."""
+    from movie_recommender_agent.cache import ResultCache
+
+    return ResultCache(
+        max_entries=int(os.getenv("EXA_CACHE_SIZE", "1024")),
+        ttl_seconds=float(os.getenv("EXA_CACHE_TTL", "3600")),
+        db_path=os.getenv("EXA_CACHE_PATH") or None,
+    )
+
+
+def _create_response_cache() -> SemanticResponseCache | None:
+    """Create the semantic response cache from environment settings (RESPONSE_CACHE_SIZE=0 disables it)."""
+    max_entries = int(os.getenv("RESPONSE_CACHE_SIZE", "512"))
+    if max_entries <= 0:
+        return None
+    return SemanticResponseCache(
+        max_entries=max_entries,
+        ttl_seconds=float(os.getenv("RESPONSE_CACHE_TTL", "600")),
+        threshold=float(os.getenv("RESPONSE_CACHE_THRESHOLD", "0.92")),
+        per_user=_responses_per_user(),
+    )
+
+
+def _create_snapshots(config: dict) -> SnapshotRefresher | None:
+    """Background-refreshed snapshots of the canonical queries in the "snapshots" config section.
+
+    AGENT_SNAPSHOTS=true/false overrides the section's "enabled" flag.
+    """
+    snapshot_config = SnapshotConfig.from_dict(config.get("snapshots", {}))
+    override = os.getenv("AGENT_SNAPSHOTS")
+    if override:
+        snapshot_config.enabled = override.lower() in ("1", "true", "yes")
+    if not snapshot_config.enabled or not snapshot_config.queries:
+        return None
+    store = SnapshotStore(snapshot_config)
+    print(
+        f"📸 Snapshots of {len(store.queries)} canonical queries ({len(store)} stored), "
+        f"refreshed every {snapshot_config.refresh_interval / 3600:g}h while idle"
     )
+    return SnapshotRefresher(store, _refresh_snapshot)
 
 
-def _setup_tools(mem0_api_key: str | None, exa_api_key: str) -> list:
+async def _refresh_snapshot(query: str) -> str | None:
+    """Answer a canonical query with a fresh agent run, for its next snapshot version."""
+    with _telemetry.span("snapshot.refresh"):
+        return response_text(await run_agent([{"role": "user", "content": query}]))
+
+
+def _responses_per_user() -> bool:
+    """Whether cached and coalesced responses are scoped to the requesting user.
+
+    Always true with per-user tools (memory, collaborative filtering) loaded: one user's
+    history-based picks must not be served to another, and a user's memories and ratings
+    must reach a run of their own.
+    """
+    return _per_user_tools or os.getenv("RESPONSE_CACHE_PER_USER", "false").lower() in ("1", "true", "yes")
+
+
+def _setup_tools(mem0_api_key: str | None, exa_api_key: str, http: "ClientManager | None" = None) -> list:
     """Set up all tools for the movie recommender agent."""
+    global _exa_cache, _exa_tools, _memory_store, _per_user_tools
+
+    from movie_recommender_agent.exa_tools import CachedExaTools
+
     tools = []
 
-    # ExaTools is required for movie information search
+    # Optional: offline catalog and the tools built on it (similarity, constraints, ratings, semantic search)
+    tools.extend(_setup_catalog_tools())
+
+    # ExaTools is required for movie information search; repeated lookups are cached
     try:
-        exa_tools = ExaTools(api_key=exa_api_key)
-        tools.append(exa_tools)
+        _exa_cache = _create_exa_cache()
+        _exa_tools = CachedExaTools(
+            cache=_exa_cache,
+            api_key=exa_api_key,
+            max_concurrency=int(os.getenv("EXA_MAX_CONCURRENCY", "8")),
+            http_client=http.client if http is not None else None,
+        )
+        tools.append(_exa_tools)
         print("🎬 Exa search enabled for movie information and ratings")
     except Exception as e:
         print(f"❌ Failed to initialize ExaTools: {e}")
         raise
 
-    # Optional: Mem0 for conversation memory
-    if mem0_api_key:
+    # Optional: conversation memory, kept locally in SQLite or remotely in Mem0
+    memory_backend = _memory_backend()
+    if memory_backend == "local":
         try:
-            mem0_tools = Mem0Tools(api_key=mem0_api_key)
-            tools.append(mem0_tools)
+            from movie_recommender_agent.memory import LocalMemoryStore, LocalMemoryTools
+
+            _memory_store = LocalMemoryStore(os.getenv("MEMORY_DB_PATH", ".cache/memory.sqlite"))
+            tools.append(LocalMemoryTools(_memory_store, user_id=os.getenv("MEMORY_DEFAULT_USER") or None))
+            _per_user_tools = True
+            print("🧠 Local memory store enabled for conversation context")
+        except Exception as e:
+            print(f"⚠️  Local memory store unavailable: {e}")
+    elif mem0_api_key and memory_backend in ("auto", "mem0"):
+        try:
+            tools.append(_create_mem0_tools(mem0_api_key))
+            _per_user_tools = True
             print("🧠 Mem0 memory system enabled for conversation context")
         except Exception as e:
             print(f"⚠️  Mem0 initialization issue: {e}")
@@ -148,9 +300,160 @@ def _setup_tools(mem0_api_key: str | None, exa_api_key: str) -> list:
     return tools
 
 
-async def initialize_agent() -> None:
-    """Initialize the movie recommender agent."""
-    global agent
+def _setup_catalog_tools() -> list:
+    """Tools answering from the offline catalog, when MOVIE_CATALOG_PATH is set."""
+    global catalog
+
+    tools = []
+
+    # Optional: offline catalog answers metadata lookups without a network round trip
+    catalog_path = os.getenv("MOVIE_CATALOG_PATH")
+    if catalog_path:
+        try:
+            from movie_recommender_agent.catalog import CatalogTools, MovieCatalog
+            from movie_recommender_agent.similarity import SimilarityTools
+
+            catalog = MovieCatalog.load(catalog_path)
+            tools.append(CatalogTools(catalog))
+            tools.append(SimilarityTools(catalog))
+            print(f"🎞️ Local movie catalog loaded with {len(catalog):,} titles")
+        except Exception as e:
+            print(f"⚠️  Movie catalog unavailable: {e}")
+
+    # Optional: bitmap indexes answering hard constraints (genre, language, years, runtime)
+    if catalog is not None:
+        tools.extend(_create_constraint_tools(catalog))
+
+    # Optional: collaborative filtering over users' rating history
+    cf_model_path = os.getenv("MOVIE_CF_MODEL_PATH")
+    if catalog is not None and cf_model_path:
+        tools.extend(_create_collaborative_tools(catalog, cf_model_path))
+
+    # Optional: memory-mapped ANN index for mood / theme queries over the catalog
+    semantic_index_path = os.getenv("MOVIE_SEMANTIC_INDEX_PATH")
+    if catalog is not None and semantic_index_path:
+        try:
+            from movie_recommender_agent.semantic import IVFIndex, SemanticSearchTools
+
+            nprobe = int(os.getenv("MOVIE_SEMANTIC_NPROBE", "8"))
+            index = IVFIndex.load(semantic_index_path, nprobe=nprobe, catalog=catalog)
+            tools.append(SemanticSearchTools(catalog, index))
+            print(f"🧭 Semantic movie index mapped with {len(index):,} vectors")
+        except Exception as e:
+            print(f"⚠️  Semantic movie index unavailable: {e}")
+
+    return tools
+
+
+def _create_constraint_tools(movies: "MovieCatalog") -> list:
+    """Hard-constraint filter tools; the catalog stays usable if building them fails."""
+    try:
+        from movie_recommender_agent.constraints import ConstraintTools
+
+        return [ConstraintTools(movies)]
+    except Exception as e:
+        print(f"⚠️  Constraint filter unavailable: {e}")
+        return []
+
+
+def _create_collaborative_tools(movies: "MovieCatalog", model_path: str) -> list:
+    """Collaborative-filtering tools; ratings collected since training are replayed from the model's log."""
+    global _per_user_tools
+
+    try:
+        from movie_recommender_agent.collaborative import CollaborativeModel, CollaborativeTools, ratings_log_path
+
+        model = CollaborativeModel.load(model_path)
+        log_path = ratings_log_path(model_path)
+        replayed = model.replay(log_path)
+        print(
+            f"👥 Collaborative filtering over {model.n_users:,} users and {model.n_movies:,} movies "
+            f"({replayed:,} new ratings folded in)"
+        )
+        _per_user_tools = True
+        return [CollaborativeTools(movies, model, log_path=log_path, user_id=os.getenv("MEMORY_DEFAULT_USER") or None)]
+    except Exception as e:
+        print(f"⚠️  Collaborative filtering model unavailable: {e}")
+        return []
+
+
+def _create_mem0_tools(api_key: str) -> "Mem0Tools":
+    """Mem0 tools; memory writes are queued and sent in the background unless MEM0_WRITE_BEHIND=false."""
+    global _mem0_tools
+
+    from movie_recommender_agent.mem0_tools import Mem0Tools, QueuedMem0Tools
+
+    if os.getenv("MEM0_WRITE_BEHIND", "true").lower() not in ("1", "true", "yes"):
+        return Mem0Tools(api_key=api_key)
+    _mem0_tools = QueuedMem0Tools(
+        api_key=api_key,
+        batch_size=int(os.getenv("MEM0_WRITE_BATCH_SIZE", "32")),
+        flush_interval=float(os.getenv("MEM0_WRITE_FLUSH_INTERVAL", "1.0")),
+        max_queue=int(os.getenv("MEM0_WRITE_QUEUE_SIZE", "1024")),
+    )
+    return _mem0_tools
+
+
+def _memory_backend() -> str:
+    """Where conversation memory is kept (MEMORY_BACKEND).
+
+    auto: Mem0 when MEM0_API_KEY is set; local: SQLite on this host; mem0: Mem0; none: disabled.
+    """
+    backend = os.getenv("MEMORY_BACKEND", "auto").lower()
+    if backend not in ("auto", "local", "mem0", "none"):
+        error_msg = f"MEMORY_BACKEND must be auto, local, mem0 or none, not {backend!r}"
+        raise ValueError(error_msg)
+    return backend
+
+
+def _output_mode() -> str:
+    """How the report is produced (AGENT_OUTPUT_MODE).
+
+    markdown: the LLM writes the markdown report; structured: the LLM returns a compact
+    RecommendationSet rendered to markdown locally; json: the same, returned as JSON.
+    """
+    mode = os.getenv("AGENT_OUTPUT_MODE", "markdown").lower()
+    if mode not in ("markdown", "structured", "json"):
+        error_msg = f"AGENT_OUTPUT_MODE must be markdown, structured or json, not {mode!r}"
+        raise ValueError(error_msg)
+    return mode
+
+
+def _prompt_profile() -> str:
+    """System prompt profile (AGENT_PROMPT_PROFILE): full or compact."""
+    return os.getenv("AGENT_PROMPT_PROFILE", "full").lower()
+
+
+def _build_agent(model: "OpenRouter", tools: list, prompt: SystemPrompt, structured: bool = False) -> "Agent":
+    """Create one movie recommender agent; pooled instances share the model, tools and prompt."""
+    from agno.agent import Agent
+
+    return Agent(
+        name="PopcornPal - Movie Recommender",
+        model=model,
+        tools=tools,
+        # Assembled with a byte-stable prefix so the provider's prompt cache can reuse it
+        system_message=prompt,
+        resolve_in_context=False,
+        output_schema=RecommendationSet if structured else None,
+        # One span per tool call when tracing or metrics are on
+        tool_hooks=[_telemetry.tool_hook] if _telemetry.enabled else None,
+    )
+
+
+def _create_agent_pool(model: "OpenRouter", tools: list, prompt: SystemPrompt, structured: bool) -> AgentPool:
+    """Pre-build a pool of agents so concurrent conversations never share run state."""
+    return AgentPool(
+        lambda: _build_agent(model, tools, prompt, structured),
+        size=int(os.getenv("AGENT_POOL_SIZE", "8")),
+        max_waiters=int(os.getenv("AGENT_POOL_MAX_WAITERS", "32")),
+        acquire_timeout=float(os.getenv("AGENT_POOL_TIMEOUT", "30")),
+    )
+
+
+async def initialize_agent(http: "ClientManager | None" = None) -> None:
+    """Initialize the movie recommender agent (http: clients to use instead of the pooled defaults)."""
+    global agent, agent_pool, _fast_pool, _history, _http, _response_cache, _router, _snapshots
 
     openrouter_api_key, mem0_api_key, exa_api_key, model_name = _get_api_keys()
 
@@ -169,144 +472,30 @@ async def initialize_agent() -> None:
         )
         raise APIKeyError(error_msg)
 
-    model = _create_llm_model(openrouter_api_key, model_name)
-    tools = _setup_tools(mem0_api_key, exa_api_key)
-
-    # Create the movie recommender agent
-    agent = Agent(
-        name="PopcornPal - Movie Recommender",
-        model=model,
-        tools=tools,
-        description=dedent("""\
-            You are PopcornPal, a passionate and knowledgeable film curator with expertise in cinema worldwide! 🎥
-
-            Your mission is to help users discover their next favorite movies by providing detailed,
-            personalized recommendations based on their preferences, viewing history, and the latest
-            in cinema. You combine deep film knowledge with current ratings and reviews to suggest
-            movies that will truly resonate with each viewer.
-
-            Expertise Areas:
-            - Global cinema from Hollywood to international films
-            - All genres: drama, comedy, thriller, horror, sci-fi, romance, documentary
-            - Film history and influential directors
-            - Current box office trends and upcoming releases
-            - Streaming platform availability
-            - Film festivals and award-winning cinema
-        """),
-        instructions=dedent("""\
-            RECOMMENDATION PROCESS:
-
-            1. ANALYSIS PHASE 🎯
-               - Carefully analyze user preferences, favorite movies, and specific requests
-               - Identify key themes, genres, styles, and mood preferences
-               - Consider rating preferences (IMDB, Rotten Tomatoes, etc.)
-               - Note any constraints: language, decade, runtime, content ratings
-
-            2. SEARCH & RESEARCH 🔍
-               - Use Exa search to find current, accurate movie information
-               - Search for: movie details, ratings, reviews, cast information
-               - Look for similar movies based on themes, directors, or actors
-               - Check for streaming availability when relevant
-               - Include upcoming releases for forward-looking recommendations
-
-            3. RECOMMENDATION CRITERIA 🏆
-               - Focus on highly-rated films (IMDB 7.5+, Rotten Tomatoes 80%+ when possible)
-               - Include a mix of popular and hidden gem recommendations
-               - Consider diverse genres unless specifically requested
-               - Balance between classic films and recent releases
-               - Include international cinema when appropriate
-
-            4. RESPONSE STRUCTURE 📋
-               For each movie recommendation, include:
-               - 🎬 Title and release year
-               - ⭐ Rating (IMDB/Rotten Tomatoes)
-               - 🎭 Genre(s) and subgenres
-               - ⏱️ Runtime
-               - 🎞️ Director and key cast members
-               - 📝 Brief, engaging plot summary (no spoilers)
-               - 🎟️ Content rating (PG, R, etc.)
-               - 🌐 Language and country of origin
-               - 💡 Why it matches the user's preferences
-
-            5. FORMATTING REQUIREMENTS ✨
-               - Use clear markdown formatting with emojis
-               - Present main recommendations in a structured table
-               - Group similar movies together thematically
-               - Include 5-10 recommendations per query
-               - Add "Bonus Recommendations" section for additional options
-               - Mention if movies are available on popular streaming platforms
-
-            6. SPECIAL SCENARIOS 🎪
-               - For "I don't know what to watch": Suggest genre samplers
-               - For mood-based requests: Match films to emotional tone
-               - For group watching: Consider diverse audience appeal
-               - For educational purposes: Include films with cultural/historical significance
-               - For date nights: Suggest appropriate romantic/engaging films
-
-            7. QUALITY STANDARDS ✅
-               - Verify all movie information is current and accurate
-               - Never recommend movies you haven't researched
-               - Acknowledge when information is limited or uncertain
-               - Provide alternatives when exact matches aren't available
-               - Always explain your reasoning for each recommendation
-        """),
-        expected_output=dedent("""\
-            # 🎬 Movie Recommendations for [User Request]
-
-            ## 🎯 Based on your preferences for: [Key preferences summary]
-
-            ### 🏆 Top Recommendations
-
-            | Movie | Year | Rating | Genre | Runtime | Why You Might Like It |
-            |-------|------|--------|-------|---------|----------------------|
-            | **[Movie 1]** | 2023 | ⭐ 8.2/10 IMDB | 🎭 Drama, ❤️ Romance | 2h 15m | [Brief explanation of match] |
-            | **[Movie 2]** | 2019 | ⭐ 7.9/10 IMDB | 🎬 Thriller, 🔍 Mystery | 1h 58m | [Brief explanation of match] |
-            | **[Movie 3]** | 2020 | 🍅 92% RT | 🤣 Comedy, 🎭 Drama | 1h 45m | [Brief explanation of match] |
-
-            ## 🎞️ Detailed Recommendations
-
-            ### 1. **[Movie Title]** (Year)
-            **⭐ Rating**: [IMDB/Rotten Tomatoes score]
-            **🎭 Genre**: [Primary genres with emojis]
-            **⏱️ Runtime**: [Duration]
-            **🎞️ Director**: [Director name]
-            **🌟 Starring**: [Key actors]
-            **🎟️ Rating**: [Content rating]
-            **🌐 Language**: [Language], [Country]
-
-            **📖 Synopsis**:
-            [Engaging, spoiler-free plot summary]
-
-            **💡 Why this matches your request**:
-            [Detailed explanation connecting to user preferences]
-
-            [Repeat for other top recommendations]
-
-            ## 🎪 Bonus Recommendations
-            - **[Bonus Movie 1]** - [Brief reason]
-            - **[Bonus Movie 2]** - [Brief reason]
-            - **[Bonus Movie 3]** - [Brief reason]
-
-            ## 🔮 Upcoming Releases to Watch For
-            - **[Upcoming Movie 1]** (Release Date) - [Why it's promising]
-            - **[Upcoming Movie 2]** (Release Date) - [Why it's promising]
-
-            ## 💡 Tips for Your Movie Night
-            - Consider [viewing suggestion]
-            - Pair with [food/drink suggestion] for better experience
-            - Watch in [ideal viewing conditions]
-
-            ---
-            *Recommendations curated by PopcornPal 🎥*
-            *Last updated: {current_date}*
-            *Note: Streaming availability may vary by region*
-        """),
-        add_datetime_to_context=True,
-        markdown=True,
-    )
-    print(f"✅ Movie Recommender agent initialized using {model_name}")
+    config = load_config()
+    routing = RoutingConfig.from_dict(config.get("routing", {}))
+    model_name = routing.premium_model or model_name
+    _http = http or _create_http_clients()
+    model = _create_llm_model(openrouter_api_key, model_name, _http)
+    tools = _setup_tools(mem0_api_key, exa_api_key, _http)
+    _response_cache = _create_response_cache()
+    _history = HistoryWindow.from_config(config.get("history", {}))
+    _snapshots = _create_snapshots(config)
+    structured = _output_mode() != "markdown"
+    prompt = SystemPrompt(tools, profile=_prompt_profile(), structured=structured)
+
+    agent_pool = _create_agent_pool(model, tools, prompt, structured)
+    agent = agent_pool.agents[0]
+    print(f"✅ Movie Recommender agent pool of {len(agent_pool)} initialized using {model_name}")
+
+    # Simple lookups run on a fast model; complex or uncertain requests stay on the premium one
+    if routing.enabled:
+        fast_model = _create_llm_model(openrouter_api_key, routing.fast_model, _http)
+        _fast_pool = _create_agent_pool(fast_model, tools, prompt, structured)
+        _router = ModelRouter.from_config(routing)
+        print(f"🔀 Model routing enabled: simple requests use {routing.fast_model}")
     print("🎬 Exa search enabled for movie information and ratings")
-    if mem0_api_key:
+    if _memory_store is not None or (mem0_api_key and _memory_backend() != "none"):
         print("🧠 Memory system enabled for conversation context")
 
 
@@ -318,25 +507,366 @@ async def run_agent(messages: list[dict[str, str]]) -> Any:
         error_msg = "Agent not initialized"
         raise RuntimeError(error_msg)
 
-    return await agent.arun(messages)  # type: ignore[invalid-await]
+    # Older turns are folded into a preference summary so the prompt stays within budget
+    if _history is not None:
+        messages = _history.window(messages)
+
+    if agent_pool is None:
+        with _telemetry.span("agent.run") as span:
+            result = await agent.arun(messages, user_id=request_user(messages))  # type: ignore[invalid-await]
+            _annotate_run(span, getattr(result, "metrics", None))
+        return present(result)
+
+    route = _router.route(messages).route if _router is not None else PREMIUM
+    if route == FAST:
+        result = await _run_fast(messages)
+        if result is not None:
+            return present(result)
+        route = PREMIUM
+    return present(await _run_on_route(route, messages))
+
+
+async def _run_fast(messages: list[dict[str, str]]) -> Any:
+    """Run on the fast model; None when the run failed and should be escalated to the premium model."""
+    if _router is None or not _router.escalate_on_error:
+        return await _run_on_route(FAST, messages)
+    try:
+        result = await _run_on_route(FAST, messages)
+    except PoolExhaustedError:
+        raise
+    except Exception as e:
+        print(f"⚠️  Fast model failed ({e}), escalating to the premium model")
+        result = None
+    if result is None or _run_failed(result):
+        _router.stats[PREMIUM].escalations += 1
+        return None
+    return result
+
+
+async def _run_on_route(route: str, messages: list[dict[str, str]]) -> Any:
+    """Run the messages on a pooled agent of the route's model, recording latency and tokens."""
+    pool = _pool_for(route)
+    start = time.perf_counter()
+    result = None
+    with _telemetry.span("agent.run", route=route) as span:
+        try:
+            # Each request runs on its own pooled agent; raises PoolExhaustedError when saturated
+            async with pool.checkout() as pooled_agent:
+                span.set(pool_wait_seconds=time.perf_counter() - start)
+                result = await pooled_agent.arun(messages, user_id=request_user(messages))  # type: ignore[invalid-await]
+            return result
+        finally:
+            metrics = getattr(result, "metrics", None)
+            if _router is not None:
+                failed = result is None or _run_failed(result)
+                _router.record(route, time.perf_counter() - start, metrics, failed)
+            if metrics is not None:
+                _record_prompt_metrics(metrics)
+            _annotate_run(span, metrics)
+
+
+def _annotate_run(span: Span, metrics: Any) -> None:
+    """Add an agent run's token counts and model time (the run minus tools and pool wait) to its span."""
+    if metrics is not None:
+        span.set(
+            input_tokens=getattr(metrics, "input_tokens", 0) or 0,
+            output_tokens=getattr(metrics, "output_tokens", 0) or 0,
+            cached_tokens=getattr(metrics, "cache_read_tokens", 0) or 0,
+        )
+    waited = span.attributes.get("tool_seconds", 0) + span.attributes.get("pool_wait_seconds", 0)
+    span.set(model_seconds=max(span.seconds - waited, 0.0))
+
 
+def _record_prompt_metrics(metrics: Any) -> None:
+    """Account prompt and cached prompt tokens of a run; logged per request with AGENT_PROMPT_METRICS."""
+    prompt_tokens, cached_tokens, first_token = _prompt_stats.record(metrics)
+    if os.getenv("AGENT_PROMPT_METRICS", "false").lower() in ("1", "true", "yes"):
+        ttft = f"{first_token:.2f}s" if first_token is not None else "n/a"
+        print(f"📏 Prompt: {prompt_tokens} tokens, {cached_tokens} cached, first token after {ttft}")
 
-async def handler(messages: list[dict[str, str]]) -> Any:
-    """Handle incoming agent messages with lazy initialization."""
+
+def _pool_for(route: str) -> AgentPool:
+    """Agent pool serving a route's model."""
+    if route == FAST and _fast_pool is not None:
+        return _fast_pool
+    return agent_pool  # type: ignore[return-value]
+
+
+def _run_failed(result: Any) -> bool:
+    """Whether an agent run ended in an error status."""
+    status = getattr(result, "status", None)
+    return str(getattr(status, "value", status)).upper() == "ERROR"
+
+
+def present(result: Any) -> Any:
+    """Render a structured run result as markdown (or JSON in json mode); other results pass through."""
+    content = getattr(result, "content", None)
+    if not isinstance(content, RecommendationSet):
+        return result
+    return render_json(content) if _output_mode() == "json" else render_markdown(content)
+
+
+async def stream_agent(messages: list[dict[str, str]]) -> AsyncIterator[str]:
+    """Stream the agent's markdown for the given messages as whole-line chunks."""
+    if not agent:
+        error_msg = "Agent not initialized"
+        raise RuntimeError(error_msg)
+
+    if _output_mode() != "markdown":
+        # Structured output is only complete once the run is; the rendered report follows at once
+        content = response_text(await run_agent(messages))
+        if content:
+            yield content
+        return
+
+    if _history is not None:
+        messages = _history.window(messages)
+
+    if agent_pool is None:
+        async for chunk in line_chunks(agent_deltas(agent, messages, request_user(messages))):
+            yield chunk
+        return
+
+    route = _router.route(messages).route if _router is not None else PREMIUM
+    pool = _pool_for(route)
+    start = time.perf_counter()
+    failed = True
+    with _telemetry.span("agent.stream", route=route) as span:
+        try:
+            async with pool.checkout() as pooled_agent:
+                span.set(pool_wait_seconds=time.perf_counter() - start)
+                async for chunk in line_chunks(agent_deltas(pooled_agent, messages, request_user(messages))):
+                    span.add("response_bytes", len(chunk))
+                    yield chunk
+            failed = False
+        finally:
+            if _router is not None:
+                _router.record(route, time.perf_counter() - start, failed=failed)
+            _annotate_run(span, None)
+
+
+def _streaming_enabled() -> bool:
+    """Whether responses are streamed to clients as they are generated."""
+    return os.getenv("AGENT_STREAMING", "false").lower() in ("1", "true", "yes")
+
+
+async def ensure_initialized(http: "ClientManager | None" = None) -> None:
+    """Initialize the agent exactly once; a no-op without locking once it is ready."""
     global _initialized
 
-    async with _init_lock:
-        if not _initialized:
-            print("🔧 Initializing Movie Recommender Agent...")
-            await initialize_agent()
-            _initialized = True
+    # Fast path: after warm-up no request ever touches the lock
+    if _initialized:
+        return
+
+    with _telemetry.span("init"):
+        async with _init_lock:
+            if not _initialized:
+                print("🔧 Initializing Movie Recommender Agent...")
+                await initialize_agent(http)
+                _initialized = True
+                _mark_ready()
+
+
+def _mark_ready() -> None:
+    """Signal readiness to the orchestrator by touching AGENT_READY_FILE, if configured."""
+    global _ready_pid
+
+    ready_file = os.getenv("AGENT_READY_FILE")
+    if ready_file:
+        _ready_pid = os.getpid()
+        Path(ready_file).parent.mkdir(parents=True, exist_ok=True)
+        Path(ready_file).touch()
+        print(f"🟢 Agent ready ({ready_file})")
+
+
+def is_ready() -> bool:
+    """Whether the agent has been built and can serve requests."""
+    return _initialized
 
-    return await run_agent(messages)
+
+async def handler(messages: list[dict[str, str]]) -> Any:
+    """Handle incoming agent messages with lazy initialization."""
+    with ExitStack() as request:
+        span = request.enter_context(_telemetry.span("handler", request_bytes=len(json.dumps(messages))))
+        # Background snapshot refreshes only run while no request is being served
+        refresher = _snapshots
+        if refresher is not None:
+            refresher.request_started()
+            request.callback(refresher.request_finished)
+        result = await _handle(messages)
+        if inspect.isasyncgen(result):
+            # A streamed response is still being produced after the handler returns
+            return _until_consumed(result, span, request.pop_all())
+        content = response_text(result)
+        if content is not None:
+            span.set(response_bytes=len(content))
+        return result
+
+
+async def _until_consumed(stream: AsyncIterator[Any], span: Span, request: ExitStack) -> AsyncIterator[Any]:
+    """Relay a streamed response; the handler span and request bookkeeping end with it."""
+    with request:
+        async for chunk in stream:
+            if isinstance(chunk, StreamedResponse):
+                span.set(response_bytes=len(chunk.content))
+            yield chunk
+
+
+async def _handle(messages: list[dict[str, str]]) -> Any:
+    """Answer messages from the response cache, a coalesced in-flight run, or a new agent run."""
+    await ensure_initialized()
+
+    # Canonical queries ("top-rated comedies from the last 2 years") are answered from their snapshot
+    if _snapshots is not None:
+        _snapshots.start()
+        with _telemetry.span("snapshot.get") as span:
+            snapshot = _snapshots.store.match(messages)
+            span.set(hit=snapshot is not None)
+        if snapshot is not None:
+            return snapshot.content
+
+    # Near-duplicate requests are answered from the response cache without an LLM or Exa call
+    if _response_cache is not None:
+        with _telemetry.span("response_cache.get") as span:
+            cached = _response_cache.get(messages)
+            span.set(hit=cached is not None)
+        if cached is not None:
+            return cached
+
+    # Identical requests already in flight share one agent run instead of starting their own
+    key = request_key(messages, _responses_per_user())
+    if _streaming_enabled():
+        return _stream_response(messages, key)
+    if key is None:
+        return await run_agent(messages)
+    return await _single_flight.do(key, lambda: _run_and_cache(messages))
+
+
+async def _run_and_cache(messages: list[dict[str, str]]) -> Any:
+    """Run the agent and store a completed response in the response cache."""
+    result = await run_agent(messages)
+    if _response_cache is not None:
+        content = response_text(result)
+        if content is not None:
+            _response_cache.set(messages, content)
+    return result
+
+
+def _stream_response(
+    messages: list[dict[str, str]], key: tuple[str, str] | None
+) -> AsyncIterator[str | StreamedResponse]:
+    """Stream a response chunk by chunk; coalesced requests receive the finished text at once."""
+    deltas: asyncio.Queue[str | None] = asyncio.Queue()
+
+    async def produce() -> str:
+        parts = []
+        try:
+            async for chunk in stream_agent(messages):
+                parts.append(chunk)
+                deltas.put_nowait(chunk)
+        finally:
+            deltas.put_nowait(None)
+        content = "".join(parts)
+        if _response_cache is not None and content:
+            _response_cache.set(messages, content)
+        return content
+
+    return relay(deltas, produce() if key is None else _single_flight.do(key, produce))
 
 
 async def cleanup() -> None:
     """Clean up any resources."""
     print("🧹 Cleaning up Movie Recommender Agent resources...")
+    # Only the process that signalled readiness withdraws it (not a pre-forked worker)
+    ready_file = os.getenv("AGENT_READY_FILE")
+    if ready_file and _ready_pid == os.getpid():
+        Path(ready_file).unlink(missing_ok=True)
+    _print_stats()
+    if _snapshots is not None:
+        _snapshots.stop()
+    if _exa_cache is not None:
+        _exa_cache.close()
+    if _exa_tools is not None:
+        _exa_tools.close()
+    # Persist memories still waiting in the write-behind queues
+    if _memory_store is not None:
+        _memory_store.close()
+    if _mem0_tools is not None:
+        _mem0_tools.close()
+    # Last: the queues above may still send requests over the pooled connections
+    if _http is not None:
+        await _http.aclose()
+    if _metrics_server is not None:
+        _metrics_server.close()
+    _telemetry.close()
+
+
+def _print_stats() -> None:
+    """Print cache, pool, routing and prompt counters collected while serving."""
+    if _exa_cache is not None:
+        stats = _exa_cache.stats
+        coalesced = _exa_tools.coalesced if _exa_tools is not None else 0
+        print(
+            f"📦 Exa cache: {stats.hits} hits, {stats.misses} misses ({stats.hit_ratio:.0%} hit ratio), "
+            f"{coalesced} in-flight lookups shared"
+        )
+    if _response_cache is not None:
+        stats = _response_cache.stats
+        print(f"💬 Response cache: {stats.hits} hits, {stats.misses} misses ({stats.hit_ratio:.0%} hit ratio)")
+    if _snapshots is not None:
+        stats = _snapshots.store.stats
+        print(f"📸 Snapshots: {stats.hits} served, {stats.refreshes} refreshed, {stats.failures} failed refreshes")
+    if agent_pool is not None:
+        pool = agent_pool.stats
+        print(
+            f"🏊 Agent pool: {pool.checkouts} checkouts, peak {pool.peak_in_use}/{pool.size} in use, "
+            f"{pool.rejected + pool.timeouts} rejected, {pool.mean_wait_seconds * 1e3:.1f} ms mean wait"
+        )
+    if _router is not None:
+        for route, stats in _router.stats.items():
+            print(
+                f"🔀 {route.capitalize()} route: {stats.requests} runs, p50 {stats.p50:.1f}s, p95 {stats.p95:.1f}s, "
+                f"{stats.mean_output_tokens:.0f} output tokens/run, {stats.escalations} escalated, {stats.errors} failed"
+            )
+    _print_memory_stats()
+    if _http is not None and _http.stats.requests:
+        stats = _http.stats
+        print(
+            f"🔌 HTTP: {stats.requests} requests over {stats.connections} connections "
+            f"({stats.reuse_ratio:.0%} reused), {stats.retries} retried, {stats.dns_hits} DNS cache hits, "
+            f"{stats.throttled} rate limited ({stats.throttle_seconds:.1f}s waited)"
+        )
+    if _history is not None and _history.folded_turns:
+        print(f"📜 History: {_history.folded_turns} older turns folded into preference summaries")
+    if _prompt_stats.runs:
+        print(
+            f"📏 Prompt cache: {_prompt_stats.cache_hit_ratio:.0%} of {_prompt_stats.prompt_tokens:,} prompt tokens "
+            f"cached over {_prompt_stats.runs} runs, {_prompt_stats.mean_first_token_seconds:.2f}s mean first token"
+        )
+    flights = _single_flight.stats
+    print(f"🛬 Coalesced {flights.coalesced} of {flights.calls + flights.coalesced} requests into in-flight runs")
+
+
+def _print_memory_stats() -> None:
+    """Print memory store and memory write queue counters."""
+    if _memory_store is not None:
+        stats = _memory_store.stats
+        print(
+            f"🧠 Memory store: {stats.writes} writes, {stats.searches} searches "
+            f"({stats.hit_ratio:.0%} of profile reads from the LRU)"
+        )
+        _print_queue_stats("Memory store", _memory_store.writes)
+    if _mem0_tools is not None:
+        _print_queue_stats("Mem0", _mem0_tools.writes)
+
+
+def _print_queue_stats(label: str, queue: "WriteBehindQueue") -> None:
+    stats = queue.stats
+    print(
+        f"✍️  {label} write queue: {stats.written} written, {stats.deduplicated} deduplicated, "
+        f"{stats.dropped} dropped, {stats.failed} failed, {len(queue)} pending (max {stats.max_depth}), "
+        f"{stats.mean_flush_seconds * 1e3:.1f} ms mean flush"
+    )
 
 
 def _setup_environment_variables(args: argparse.Namespace) -> None:
@@ -349,6 +879,55 @@ def _setup_environment_variables(args: argparse.Namespace) -> None:
         os.environ["EXA_API_KEY"] = args.exa_api_key
     if args.model:
         os.environ["MODEL_NAME"] = args.model
+    if args.lazy_init:
+        os.environ["AGENT_EAGER_INIT"] = "false"
+
+
+def _after_fork() -> None:
+    """Reset per-process state a pre-forked worker inherits from the parent."""
+    if _exa_cache is not None:
+        _exa_cache.after_fork()
+    if _memory_store is not None:
+        _memory_store.after_fork()
+    if _mem0_tools is not None:
+        _mem0_tools.after_fork()
+    # Each worker reports its own traffic, on METRICS_PORT + its slot
+    _telemetry.after_fork()
+    slot = int(os.getenv("AGENT_WORKER_SLOT", "0"))
+    _telemetry.labels["worker"] = str(slot)
+    _start_metrics_server(slot)
+
+
+def _setup_telemetry() -> None:
+    """Enable tracing (TELEMETRY_EXPORT, TELEMETRY_SAMPLE_RATE) and metrics (METRICS_PORT) if configured."""
+    export = os.getenv("TELEMETRY_EXPORT") or None
+    metrics = bool(os.getenv("METRICS_PORT"))
+    _telemetry.configure(export, float(os.getenv("TELEMETRY_SAMPLE_RATE", "0.05")), metrics)
+    if export:
+        print(f"🔭 Tracing {_telemetry.sample_rate:.0%} of requests to {export}")
+
+
+def _start_metrics_server(offset: int = 0) -> None:
+    """Serve Prometheus metrics on METRICS_HOST:METRICS_PORT (+ offset for pre-forked workers)."""
+    global _metrics_server
+
+    port = os.getenv("METRICS_PORT")
+    if not port:
+        return
+    host = os.getenv("METRICS_HOST", "127.0.0.1")
+    _metrics_server = MetricsServer(_telemetry, host, int(port) + offset)
+    print(f"📈 Metrics at http://{host}:{_metrics_server.port}/metrics (pid {os.getpid()})")
+
+
+def _warn_if_process_local_storage(config: dict) -> None:
+    """Tasks must be visible to every worker, which in-memory storage cannot provide."""
+    storage = config.get("storage", {}).get("type") or os.getenv("STORAGE_TYPE", "memory")
+    scheduler = config.get("scheduler", {}).get("type") or os.getenv("SCHEDULER_TYPE", "memory")
+    if storage == "memory" or scheduler == "memory":
+        print(
+            "⚠️  Multiple workers with in-memory storage/scheduler: a task created on one worker is not "
+            "visible to the others. Use STORAGE_TYPE=postgres and SCHEDULER_TYPE=redis."
+        )
 
 
 def _display_configuration_info() -> None:
@@ -382,6 +961,13 @@ def _display_configuration_info() -> None:
 
 def main() -> None:
     """Run the main entry point for the Movie Recommender Agent."""
+    # python -m movie_recommender_agent batch ...: offline bulk recommendations instead of the server
+    if sys.argv[1:2] == ["batch"]:
+        from movie_recommender_agent.batch import main as batch_main
+
+        batch_main(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(description="Movie Recommender Agent - Intelligent film recommendation system")
     parser.add_argument(
         "--openrouter-api-key",
@@ -407,17 +993,49 @@ def main() -> None:
         default=os.getenv("MODEL_NAME", "openai/gpt-4o"),
         help="Model ID for OpenRouter (env: MODEL_NAME)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("AGENT_WORKERS", "1")),
+        help="Pre-forked serving processes; 0 = one per CPU core (env: AGENT_WORKERS)",
+    )
+    parser.add_argument(
+        "--lazy-init",
+        action="store_true",
+        help="Build the agent on the first request instead of before serving (env: AGENT_EAGER_INIT=false)",
+    )
     args = parser.parse_args()
 
     _setup_environment_variables(args)
     _display_configuration_info()
+    _setup_telemetry()
 
     config = load_config()
+    if _streaming_enabled():
+        config.setdefault("capabilities", {})["streaming"] = True
+
+    # Warm up before the port opens, so health checks only pass once requests can be served
+    if os.getenv("AGENT_EAGER_INIT", "true").lower() in ("1", "true", "yes"):
+        try:
+            asyncio.run(ensure_initialized())
+        except Exception as e:
+            print(f"❌ Error initializing agent: {e}")
+            sys.exit(1)
 
     try:
         print("\n🚀 Starting Movie Recommender Agent server...")
         print(f"🌐 Access at: {config.get('deployment', {}).get('url', 'http://127.0.0.1:3773')}")
-        bindufy(config, handler)
+        workers = args.workers or os.cpu_count() or 1
+        if workers > 1:
+            _warn_if_process_local_storage(config)
+            from movie_recommender_agent.workers import serve_workers
+
+            serve_workers(config, handler, workers, after_fork=_after_fork, on_exit=lambda: asyncio.run(cleanup()))
+        else:
+            from bindu.penguin.bindufy import bindufy
+
+            _start_metrics_server()
+            bindufy(config, handler)
     except KeyboardInterrupt:
         print("\n🛑 Movie Recommender Agent stopped")
     except Exception as e:
@@ -0,0 +1,123 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Mem0 tools with memory writes moved off the response path.
+
+Kept apart from memory.py because importing agno's Mem0Tools loads mem0 and its vector
+store clients, which only deployments that keep memories in Mem0 should pay for.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from agno.run import RunContext
+from agno.tools.mem0 import Mem0Tools
+
+from movie_recommender_agent.memory import WriteBehindQueue
+
+
+class QueuedMem0Tools(Mem0Tools):
+    """Mem0Tools whose add_memory returns at once; facts reach Mem0 through a write-behind queue.
+
+    Queued facts are written in batches, one Mem0 call per user per batch; a user whose
+    call fails does not hold back the others. A fact already queued or recently written
+    for the same user is not sent again, and delete_all_memories also drops the user's
+    facts still waiting in the queue.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        batch_size: int = 32,
+        flush_interval: float = 1.0,
+        max_queue: int = 1_024,
+        recent_size: int = 4_096,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.recent_size = recent_size
+        self.writes = WriteBehindQueue(
+            self._write_batch, batch_size, flush_interval, name="mem0-writer", max_size=max_queue, key=_fact_key
+        )
+        self._recent: OrderedDict[tuple[str, str], None] = OrderedDict()
+        self._recent_lock = threading.Lock()
+
+    def add_memory(self, run_context: RunContext, content: str | dict[str, str]) -> str:
+        """Add facts to the user's memory.
+
+        Args:
+            content: The facts that should be stored, e.g. "Loves Korean thrillers, dislikes horror".
+
+        Returns:
+            str: JSON with the queued memory, or an error message.
+        """
+        user_id = self._get_user_id("add_memory", run_context=run_context)
+        if user_id.startswith("Error in add_memory:"):
+            return user_id
+        content = json.dumps(content) if isinstance(content, dict) else str(content)
+        item = (user_id, content)
+        # Only facts Mem0 accepted count as saved; a failed or dropped write can be queued again
+        with self._recent_lock:
+            saved = _fact_key(item) in self._recent
+        if saved:
+            self.writes.stats.deduplicated += 1
+            return json.dumps({"status": "already saved", "memory": content})
+        self.writes.put(item)
+        return json.dumps({"status": "queued", "memory": content})
+
+    def delete_all_memories(self, run_context: RunContext) -> str:
+        """Delete *all* memories associated with the current user."""
+        user_id = self._get_user_id("delete_all_memories", run_context=run_context)
+        if not user_id.startswith("Error in delete_all_memories:"):
+            self.writes.discard(lambda item: item[0] == user_id)
+            with self._recent_lock:
+                for key in [key for key in self._recent if key[0] == user_id]:
+                    del self._recent[key]
+        return super().delete_all_memories(run_context)
+
+    def flush(self) -> None:
+        """Send every queued fact to Mem0 now."""
+        self.writes.flush()
+
+    def close(self) -> None:
+        """Send the queued facts and stop the writer thread."""
+        self.writes.close()
+
+    def after_fork(self) -> None:
+        """Restart the writer thread and reset the locks a forked worker inherited."""
+        self._recent_lock = threading.Lock()
+        self.writes.after_fork()
+
+    def _write_batch(self, batch: list[tuple[str, str]]) -> int:
+        by_user: dict[str, list[tuple[str, str]]] = {}
+        for item in batch:
+            by_user.setdefault(item[0], []).append(item)
+        failed = 0
+        for user_id, items in by_user.items():
+            messages = [{"role": "user", "content": content} for _, content in items]
+            try:
+                self.client.add(messages, user_id=user_id, infer=self.infer)
+            except Exception as e:
+                failed += len(items)
+                print(f"⚠️  Mem0 write of {len(items)} memories for {user_id} failed: {e}")
+                continue
+            with self._recent_lock:
+                for item in items:
+                    self._recent[_fact_key(item)] = None
+                while len(self._recent) > self.recent_size:
+                    self._recent.popitem(last=False)
+        return failed
+
+
+def _fact_key(item: tuple[str, str]) -> tuple[str, str]:
+    """Dedup key of a queued fact: the user and the fact with case and spacing normalized."""
+    user_id, content = item
+    return user_id, " ".join(content.lower().split())
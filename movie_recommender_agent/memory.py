@@ -0,0 +1,447 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Local user memory: an embedded alternative to remote Mem0 calls.
+
+Memories live in SQLite, with an in-process LRU of hot user profiles in front of it.
+Each profile keeps the embedding of every memory and a precomputed preference vector
+(their normalized centroid), so searches are a single matrix-vector product with no
+I/O. Writes update the profile immediately and reach SQLite through a write-behind
+queue flushed in batches by a background thread, so they never block a response.
+LocalMemoryTools exposes the store through the same tools as agno's Mem0Tools.
+
+When memories stay in Mem0, QueuedMem0Tools (mem0_tools.py) moves the writes off the
+response path through the same kind of write-behind queue.
+"""
+
+import itertools
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from agno.run import RunContext
+from agno.tools import Toolkit
+from sqlalchemy import (
+    Column,
+    Float,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    create_engine,
+    delete,
+    insert,
+    select,
+    text,
+)
+
+from movie_recommender_agent.semantic import HashingEmbedder
+
+
+@dataclass
+class QueueStats:
+    """Counters for a WriteBehindQueue."""
+
+    queued: int = 0
+    written: int = 0
+    failed: int = 0
+    deduplicated: int = 0
+    dropped: int = 0
+    max_depth: int = 0
+    flushes: int = 0
+    flush_seconds: float = 0.0
+
+    @property
+    def mean_flush_seconds(self) -> float:
+        """Mean time to write one batch."""
+        return self.flush_seconds / self.flushes if self.flushes else 0.0
+
+
+class WriteBehindQueue:
+    """Buffer writes and apply them in batches from a background thread.
+
+    put() never blocks on I/O. A batch is written once it reaches batch_size or
+    flush_interval seconds after its first item; flush() writes everything pending.
+    The write function may return how many items of the batch it failed to write.
+    With a key function, an item whose key is already queued is dropped as a duplicate;
+    with max_size, a full queue drops its oldest item to make room (backpressure
+    without ever blocking the caller).
+    """
+
+    def __init__(
+        self,
+        write: Callable[[list[Any]], int | None],
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+        name: str = "write-behind",
+        max_size: int | None = None,
+        key: Callable[[Any], Hashable] | None = None,
+    ) -> None:
+        self.write = write
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.name = name
+        self.max_size = max_size
+        self.key = key
+        self.stats = QueueStats()
+        self._sequence = itertools.count()
+        self._start()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def put(self, item: Any) -> bool:
+        """Queue one write; False when an identical write is already queued."""
+        key = self.key(item) if self.key is not None else next(self._sequence)
+        with self._wakeup:
+            if key in self._pending:
+                self.stats.deduplicated += 1
+                return False
+            if self.max_size is not None and len(self._pending) >= self.max_size:
+                self._pending.popitem(last=False)
+                self.stats.dropped += 1
+            self._pending[key] = item
+            self.stats.queued += 1
+            self.stats.max_depth = max(self.stats.max_depth, len(self._pending))
+            if len(self._pending) == 1 or len(self._pending) >= self.batch_size:
+                self._wakeup.notify()
+        return True
+
+    def discard(self, predicate: Callable[[Any], bool]) -> int:
+        """Drop queued items matching the predicate; returns how many were dropped."""
+        with self._wakeup:
+            keys = [key for key, item in self._pending.items() if predicate(item)]
+            for key in keys:
+                del self._pending[key]
+        return len(keys)
+
+    def pending(self, predicate: Callable[[Any], bool]) -> list[Any]:
+        """Items matching the predicate that are queued or being written, oldest first.
+
+        Readers merge these into what they read back, since a write in flight may or may
+        not be visible yet.
+        """
+        with self._wakeup:
+            return [item for item in (*self._in_flight, *self._pending.values()) if predicate(item)]
+
+    def flush(self) -> None:
+        """Write every queued item now, in the calling thread."""
+        with self._write_lock:
+            with self._wakeup:
+                pending, self._pending = list(self._pending.values()), OrderedDict()
+                self._in_flight = pending
+            try:
+                # Bounded batches keep each write (and its transaction) short
+                for start in range(0, len(pending), self.batch_size):
+                    self._write(pending[start : start + self.batch_size])
+            finally:
+                with self._wakeup:
+                    self._in_flight = []
+
+    def close(self) -> None:
+        """Stop the background thread and write whatever is still queued."""
+        with self._wakeup:
+            self._closed = True
+            self._wakeup.notify()
+        self._thread.join()
+        self.flush()
+
+    def after_fork(self) -> None:
+        """Restart the writer in a forked child; writes queued by the parent stay with the parent."""
+        self._start()
+
+    def _start(self) -> None:
+        self._pending: OrderedDict[Hashable, Any] = OrderedDict()
+        self._in_flight: list[Any] = []
+        self._closed = False
+        self._wakeup = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._wakeup:
+                while not self._pending and not self._closed:
+                    self._wakeup.wait()
+                if self._closed:
+                    return
+                # Give a burst of writes the chance to join the same batch
+                deadline = time.monotonic() + self.flush_interval
+                while len(self._pending) < self.batch_size and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._wakeup.wait(remaining)
+            self.flush()
+
+    def _write(self, batch: list[Any]) -> None:
+        if not batch:
+            return
+        start = time.perf_counter()
+        try:
+            failed = self.write(batch) or 0
+            self.stats.written += len(batch) - failed
+            self.stats.failed += failed
+        except Exception as e:
+            self.stats.failed += len(batch)
+            print(f"⚠️  {self.name}: failed to write {len(batch)} queued items: {e}")
+        self.stats.flushes += 1
+        self.stats.flush_seconds += time.perf_counter() - start
+
+
+class UserProfile:
+    """A user's memories with their embeddings and running preference vector."""
+
+    def __init__(self, loaded_at: float = 0.0) -> None:
+        self.memories: list[dict[str, Any]] = []
+        self.loaded_at = loaded_at
+        self._matrix: np.ndarray | None = None
+        self._sum: np.ndarray | None = None
+
+    @property
+    def vectors(self) -> np.ndarray | None:
+        """Embeddings of the memories, one row each."""
+        return None if self._matrix is None else self._matrix[: len(self.memories)]
+
+    @property
+    def preference(self) -> np.ndarray | None:
+        """Normalized centroid of the memory embeddings."""
+        if self._sum is None:
+            return None
+        norm = np.linalg.norm(self._sum)
+        return self._sum / norm if norm else self._sum
+
+    def add(self, memory: dict[str, Any], vector: np.ndarray) -> None:
+        count = len(self.memories)
+        if self._matrix is None:
+            self._matrix = np.zeros((8, vector.shape[0]), dtype=np.float32)
+            self._sum = np.zeros(vector.shape[0], dtype=np.float32)
+        elif count == len(self._matrix):
+            # Grow geometrically so appends stay amortized O(1)
+            self._matrix = np.concatenate([self._matrix, np.zeros_like(self._matrix)])
+        self._matrix[count] = vector
+        self._sum += vector
+        self.memories.append(memory)
+
+
+@dataclass
+class MemoryStats:
+    """Counters for a LocalMemoryStore."""
+
+    profile_hits: int = 0
+    profile_loads: int = 0
+    writes: int = 0
+    searches: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of profile reads served from the in-process LRU."""
+        total = self.profile_hits + self.profile_loads
+        return self.profile_hits / total if total else 0.0
+
+
+class LocalMemoryStore:
+    """User memories in SQLite behind an LRU of hot profiles and a write-behind queue."""
+
+    def __init__(
+        self,
+        db_path: str,
+        max_profiles: int = 1024,
+        profile_ttl: float = 60.0,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+        embedder: HashingEmbedder | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_profiles = max_profiles
+        self.profile_ttl = profile_ttl
+        self.embedder = embedder or HashingEmbedder()
+        self.stats = MemoryStats()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._profiles: OrderedDict[str, UserProfile] = OrderedDict()
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._engine = create_engine(f"sqlite:///{db_path}")
+        metadata = MetaData()
+        self._table = Table(
+            "memories",
+            metadata,
+            Column("id", Integer, primary_key=True, autoincrement=True),
+            Column("user_id", String(255), nullable=False, index=True),
+            Column("memory", Text, nullable=False),
+            Column("created_at", Float, nullable=False),
+        )
+        metadata.create_all(self._engine)
+        with self._engine.begin() as conn:
+            # Readers in other worker processes are not blocked by the writer
+            conn.execute(text("PRAGMA journal_mode=WAL"))
+        self.writes = WriteBehindQueue(self._write_batch, batch_size, flush_interval, name="memory-writer")
+
+    def add(self, user_id: str, memory: str) -> dict[str, Any]:
+        """Remember a fact about a user; visible immediately, persisted in the background."""
+        entry = {"memory": memory, "created_at": self._clock()}
+        vector = self.embedder.embed(memory)
+        with self._lock:
+            self._profile(user_id).add(entry, vector)
+            self.stats.writes += 1
+            self.writes.put(("add", user_id, memory, entry["created_at"]))
+        return entry
+
+    def search(self, user_id: str, query: str, limit: int = 5) -> list[dict[str, Any]]:
+        """The user's memories most similar to the query."""
+        vector = self.embedder.embed(query)
+        with self._lock:
+            profile = self._profile(user_id)
+            self.stats.searches += 1
+            if profile.vectors is None:
+                return []
+            scores = profile.vectors @ vector
+            top = np.argsort(-scores)[:limit]
+            return [{**profile.memories[i], "score": round(float(scores[i]), 3)} for i in top if scores[i] > 0]
+
+    def get_all(self, user_id: str) -> list[dict[str, Any]]:
+        """Every memory of a user, most representative of their preferences first."""
+        with self._lock:
+            profile = self._profile(user_id)
+            if profile.vectors is None:
+                return []
+            order = np.argsort(-(profile.vectors @ profile.preference))
+            return [profile.memories[i] for i in order]
+
+    def preference_vector(self, user_id: str) -> np.ndarray | None:
+        """Normalized centroid of the user's memory embeddings, or None without memories."""
+        with self._lock:
+            return self._profile(user_id).preference
+
+    def delete_all(self, user_id: str) -> None:
+        """Forget everything about a user."""
+        with self._lock:
+            self._profiles[user_id] = UserProfile(loaded_at=self._clock())
+            self._profiles.move_to_end(user_id)
+            self.writes.put(("delete", user_id, None, None))
+
+    def flush(self) -> None:
+        """Persist every queued write now."""
+        self.writes.flush()
+
+    def close(self) -> None:
+        """Persist queued writes and release the SQLite connection pool."""
+        self.writes.close()
+        self._engine.dispose()
+
+    def after_fork(self) -> None:
+        """Reset the lock, writer thread and pooled connections a forked worker inherited."""
+        self._lock = threading.Lock()
+        self.writes.after_fork()
+        self._engine.dispose(close=False)
+
+    def _profile(self, user_id: str) -> UserProfile:
+        """Hot profile from the LRU, (re)loaded from SQLite when missing or older than profile_ttl."""
+        profile = self._profiles.get(user_id)
+        if profile is not None and self._clock() - profile.loaded_at < self.profile_ttl:
+            self._profiles.move_to_end(user_id)
+            self.stats.profile_hits += 1
+            return profile
+
+        # This user's queued or in-flight writes are replayed over the rows read back instead
+        # of flushed first, which would put every user's pending writes on the request path.
+        # Taken before the read: an add that lands in between is then both read and replayed.
+        pending = self.writes.pending(lambda item: item[1] == user_id)
+        table = self._table
+        with self._engine.connect() as conn:
+            rows = conn.execute(
+                select(table.c.memory, table.c.created_at).where(table.c.user_id == user_id).order_by(table.c.id)
+            ).all()
+        memories = [(row.memory, row.created_at) for row in rows]
+        for operation, _, memory, created_at in pending:
+            if operation == "delete":
+                memories = []
+            elif (memory, created_at) not in memories:
+                memories.append((memory, created_at))
+
+        profile = UserProfile(loaded_at=self._clock())
+        if memories:
+            vectors = self.embedder.embed_batch([memory for memory, _ in memories])
+            for (memory, created_at), vector in zip(memories, vectors, strict=True):
+                profile.add({"memory": memory, "created_at": created_at}, vector)
+        self.stats.profile_loads += 1
+
+        self._profiles[user_id] = profile
+        self._profiles.move_to_end(user_id)
+        while len(self._profiles) > self.max_profiles:
+            self._profiles.popitem(last=False)
+        return profile
+
+    def _write_batch(self, batch: list[tuple[str, str, str | None, float | None]]) -> None:
+        with self._engine.begin() as conn:
+            for operation, user_id, memory, created_at in batch:
+                if operation == "add":
+                    conn.execute(insert(self._table).values(user_id=user_id, memory=memory, created_at=created_at))
+                else:
+                    conn.execute(delete(self._table).where(self._table.c.user_id == user_id))
+
+
+class LocalMemoryTools(Toolkit):
+    """Drop-in replacement for Mem0Tools backed by a LocalMemoryStore."""
+
+    def __init__(self, store: LocalMemoryStore, user_id: str | None = None, **kwargs: Any) -> None:
+        self.store = store
+        self.user_id = user_id
+        tools = [self.add_memory, self.search_memory, self.get_all_memories, self.delete_all_memories]
+        super().__init__(name="memory_tools", tools=tools, **kwargs)
+
+    def _user_id(self, run_context: RunContext) -> str | None:
+        return getattr(run_context, "user_id", None) or self.user_id
+
+    def add_memory(self, run_context: RunContext, content: str | dict[str, str]) -> str:
+        """Add facts to the user's memory.
+
+        Args:
+            content: The facts that should be stored, e.g. "Loves Korean thrillers, dislikes horror".
+
+        Returns:
+            str: JSON with the stored memory, or an error message.
+        """
+        user_id = self._user_id(run_context)
+        if user_id is None:
+            return "Error in add_memory: A user_id must be provided in the method call."
+        if not isinstance(content, str):
+            content = json.dumps(content)
+        return json.dumps(self.store.add(user_id, content))
+
+    def search_memory(self, run_context: RunContext, query: str) -> str:
+        """Semantic search for *query* across the user's stored memories."""
+        user_id = self._user_id(run_context)
+        if user_id is None:
+            return "Error in search_memory: A user_id must be provided in the method call."
+        return json.dumps(self.store.search(user_id, query))
+
+    def get_all_memories(self, run_context: RunContext) -> str:
+        """Return **all** memories for the current user as a JSON string."""
+        user_id = self._user_id(run_context)
+        if user_id is None:
+            return "Error in get_all_memories: A user_id must be provided in the method call."
+        return json.dumps(self.store.get_all(user_id))
+
+    def delete_all_memories(self, run_context: RunContext) -> str:
+        """Delete *all* memories associated with the current user."""
+        user_id = self._user_id(run_context)
+        if user_id is None:
+            return "Error deleting all memories: A user_id must be provided in the method call."
+        self.store.delete_all(user_id)
+        return f"Successfully deleted all memories for user_id: {user_id}."
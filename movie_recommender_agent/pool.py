@@ -0,0 +1,120 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Pool of pre-built agent instances.
+
+Each concurrent request checks out its own Agent, so run state never bleeds between
+conversations, while the model client and tool objects are shared by every instance.
+When all agents are busy, callers queue for a bounded time; once the wait queue is
+full, new requests are rejected immediately instead of piling up.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+
+class PoolExhaustedError(RuntimeError):
+    """No agent became available; the request should be retried later (HTTP 429)."""
+
+    status_code = 429
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass
+class PoolStats:
+    """Utilization counters for an AgentPool."""
+
+    size: int = 0
+    in_use: int = 0
+    waiting: int = 0
+    peak_in_use: int = 0
+    checkouts: int = 0
+    rejected: int = 0
+    timeouts: int = 0
+    wait_seconds: float = 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of pooled agents currently checked out."""
+        return self.in_use / self.size if self.size else 0.0
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        """Average time a checkout spent waiting for a free agent."""
+        return self.wait_seconds / self.checkouts if self.checkouts else 0.0
+
+
+class AgentPool:
+    """Fixed-size pool of agents with checkout/checkin and bounded waiting."""
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        size: int = 8,
+        max_waiters: int = 32,
+        acquire_timeout: float = 30.0,
+    ) -> None:
+        if size < 1:
+            error_msg = "Agent pool size must be at least 1"
+            raise ValueError(error_msg)
+        self.max_waiters = max_waiters
+        self.acquire_timeout = acquire_timeout
+        self.agents = [factory() for _ in range(size)]
+        self.stats = PoolStats(size=size)
+        self._idle: asyncio.Queue = asyncio.Queue()
+        for agent in self.agents:
+            self._idle.put_nowait(agent)
+
+    def __len__(self) -> int:
+        return len(self.agents)
+
+    async def acquire(self) -> Any:
+        """Check out an agent, waiting up to acquire_timeout when all are busy."""
+        if self._idle.empty() and self.stats.waiting >= self.max_waiters:
+            self.stats.rejected += 1
+            error_msg = f"All {len(self)} agents are busy and {self.stats.waiting} requests are queued"
+            raise PoolExhaustedError(error_msg, retry_after=self.acquire_timeout)
+
+        start = time.perf_counter()
+        self.stats.waiting += 1
+        try:
+            agent = await asyncio.wait_for(self._idle.get(), timeout=self.acquire_timeout)
+        except TimeoutError:
+            self.stats.timeouts += 1
+            error_msg = f"No agent became available within {self.acquire_timeout:g}s"
+            raise PoolExhaustedError(error_msg, retry_after=self.acquire_timeout) from None
+        finally:
+            self.stats.waiting -= 1
+
+        self.stats.wait_seconds += time.perf_counter() - start
+        self.stats.checkouts += 1
+        self.stats.in_use += 1
+        self.stats.peak_in_use = max(self.stats.peak_in_use, self.stats.in_use)
+        return agent
+
+    def release(self, agent: Any) -> None:
+        """Return a checked-out agent to the pool."""
+        self.stats.in_use -= 1
+        self._idle.put_nowait(agent)
+
+    @asynccontextmanager
+    async def checkout(self) -> AsyncIterator[Any]:
+        """Context manager pairing acquire() with release()."""
+        agent = await self.acquire()
+        try:
+            yield agent
+        finally:
+            self.release(agent)
@@ -0,0 +1,193 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Structured recommendations and their local markdown / JSON rendering.
+
+In structured output mode the LLM only fills in a compact RecommendationSet; the
+table, headings, emojis and footer of the report are produced here, so none of that
+boilerplate costs output tokens (or generation time) on every request.
+"""
+
+from datetime import date
+
+from pydantic import BaseModel, Field
+
+# Emoji shown in front of each genre, as in the markdown report template
+_GENRE_EMOJI = {
+    "action": "💥",
+    "adventure": "🗺️",
+    "animation": "✏️",
+    "biography": "📜",
+    "comedy": "🤣",
+    "crime": "🕵️",
+    "documentary": "🎥",
+    "drama": "🎭",
+    "family": "👨‍👩‍👧",
+    "fantasy": "🧙",
+    "history": "🏛️",
+    "horror": "👻",
+    "music": "🎵",
+    "musical": "🎵",
+    "mystery": "🔍",
+    "romance": "❤️",
+    "sci-fi": "🚀",
+    "science fiction": "🚀",
+    "sport": "🏅",
+    "thriller": "🎬",
+    "war": "⚔️",
+    "western": "🤠",
+}
+
+
+class MovieRecommendation(BaseModel):
+    """One recommended movie."""
+
+    title: str
+    year: int | None = None
+    rating: str | None = Field(None, description='Critic score, e.g. "8.2/10 IMDb" or "92% RT"')
+    genres: list[str] = Field(default_factory=list)
+    runtime: int | None = Field(None, description="Runtime in minutes")
+    reason: str = Field(description="One sentence on why it matches the request")
+    director: str | None = None
+    cast: list[str] = Field(default_factory=list, description="Up to three lead actors")
+    synopsis: str | None = Field(None, description="Two spoiler-free sentences")
+    content_rating: str | None = Field(None, description="PG, R, ...")
+    language: str | None = Field(None, description='Language and country, e.g. "Korean, South Korea"')
+    streaming: list[str] = Field(default_factory=list, description="Streaming services carrying it")
+
+
+class BonusPick(BaseModel):
+    """An extra suggestion listed with a short reason."""
+
+    title: str
+    reason: str
+
+
+class UpcomingRelease(BaseModel):
+    """A movie not yet released that fits the request."""
+
+    title: str
+    release_date: str | None = None
+    reason: str
+
+
+class RecommendationSet(BaseModel):
+    """Everything the markdown report is rendered from."""
+
+    request: str = Field(description="The user's request in a few words")
+    preferences: str = Field(description="Key preferences the picks are based on")
+    recommendations: list[MovieRecommendation]
+    bonus: list[BonusPick] = Field(default_factory=list)
+    upcoming: list[UpcomingRelease] = Field(default_factory=list)
+    tips: list[str] = Field(default_factory=list, description="Short movie-night suggestions")
+
+
+def format_runtime(minutes: int | None) -> str:
+    """Runtime as shown in the report, e.g. 135 -> "2h 15m"."""
+    if not minutes:
+        return "—"
+    hours, rest = divmod(minutes, 60)
+    return f"{hours}h {rest:02d}m" if hours else f"{rest}m"
+
+
+def format_rating(rating: str | None) -> str:
+    """Rating with the Rotten Tomatoes or star emoji."""
+    if not rating:
+        return "—"
+    return f"🍅 {rating}" if "%" in rating else f"⭐ {rating}"
+
+
+def format_genres(genres: list[str]) -> str:
+    """Genres prefixed with their emoji."""
+    labels = [f"{_GENRE_EMOJI[g.lower()]} {g}" if g.lower() in _GENRE_EMOJI else g for g in genres]
+    return ", ".join(labels) or "—"
+
+
+def _cell(text: str) -> str:
+    return text.replace("|", "\\|").replace("\n", " ")
+
+
+def _title(movie: MovieRecommendation) -> str:
+    return f"**{movie.title}** ({movie.year})" if movie.year else f"**{movie.title}**"
+
+
+def _detail_lines(number: int, movie: MovieRecommendation) -> list[str]:
+    """Detailed section of one movie; fields the model left out are skipped."""
+    lines = [
+        f"### {number}. {_title(movie)}",
+        f"**⭐ Rating**: {movie.rating or '—'}",
+        f"**🎭 Genre**: {format_genres(movie.genres)}",
+        f"**⏱️ Runtime**: {format_runtime(movie.runtime)}",
+    ]
+    if movie.director:
+        lines.append(f"**🎞️ Director**: {movie.director}")
+    if movie.cast:
+        lines.append(f"**🌟 Starring**: {', '.join(movie.cast)}")
+    if movie.content_rating:
+        lines.append(f"**🎟️ Rating**: {movie.content_rating}")
+    if movie.language:
+        lines.append(f"**🌐 Language**: {movie.language}")
+    if movie.streaming:
+        lines.append(f"**📺 Streaming**: {', '.join(movie.streaming)}")
+    if movie.synopsis:
+        lines += ["", "**📖 Synopsis**:", movie.synopsis]
+    return [*lines, "", "**💡 Why this matches your request**:", movie.reason, ""]
+
+
+def render_markdown(recommendations: RecommendationSet, today: date | None = None) -> str:
+    """Render the PopcornPal markdown report for a RecommendationSet."""
+    today = today or date.today()
+    movies = recommendations.recommendations
+    lines = [
+        f"# 🎬 Movie Recommendations for {recommendations.request}",
+        "",
+        f"## 🎯 Based on your preferences for: {recommendations.preferences}",
+        "",
+        "### 🏆 Top Recommendations",
+        "",
+        "| Movie | Year | Rating | Genre | Runtime | Why You Might Like It |",
+        "|-------|------|--------|-------|---------|----------------------|",
+    ]
+    lines.extend(
+        f"| **{_cell(m.title)}** | {m.year or '—'} | {format_rating(m.rating)} | {format_genres(m.genres)} "
+        f"| {format_runtime(m.runtime)} | {_cell(m.reason)} |"
+        for m in movies
+    )
+
+    lines += ["", "## 🎞️ Detailed Recommendations", ""]
+    for number, movie in enumerate(movies, 1):
+        lines += _detail_lines(number, movie)
+
+    if recommendations.bonus:
+        lines.append("## 🎪 Bonus Recommendations")
+        lines.extend(f"- **{pick.title}** - {pick.reason}" for pick in recommendations.bonus)
+        lines.append("")
+    if recommendations.upcoming:
+        lines.append("## 🔮 Upcoming Releases to Watch For")
+        for release in recommendations.upcoming:
+            when = f" ({release.release_date})" if release.release_date else ""
+            lines.append(f"- **{release.title}**{when} - {release.reason}")
+        lines.append("")
+    if recommendations.tips:
+        lines.append("## 💡 Tips for Your Movie Night")
+        lines.extend(f"- {tip}" for tip in recommendations.tips)
+        lines.append("")
+
+    lines += [
+        "---",
+        "*Recommendations curated by PopcornPal 🎥*",
+        f"*Last updated: {today.isoformat()}*",
+        "*Note: Streaming availability may vary by region*",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def render_json(recommendations: RecommendationSet) -> str:
+    """Serialize a RecommendationSet for the application/json output mode."""
+    return recommendations.model_dump_json(exclude_none=True)
@@ -0,0 +1,220 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Semantic cache for complete agent responses.
+
+Near-duplicate requests ("Suggest thriller movies similar to Inception" / "Can you
+recommend thriller films similar to Inception?") are answered with the stored markdown
+instead of another LLM + Exa run.
+Requests are matched on the embedding of the last user message, within a scope made
+of the earlier conversation turns (and optionally the user), so a follow-up such as
+"more like that" is never answered from a different conversation.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+from movie_recommender_agent.cache import CacheStats, normalize_query
+from movie_recommender_agent.catalog import tokenize
+from movie_recommender_agent.semantic import HashingEmbedder
+
+_USER_FIELDS = ("user_id", "name")
+
+# Politeness and filler words that never change the answer; dropping them lets the
+# words that do (titles, genres, decades) dominate the similarity score
+FILLER_WORDS = frozenset({
+    "a", "an", "and", "any", "are", "best", "can", "could", "film", "films", "find", "give", "good", "great",
+    "i", "is", "list", "me", "movie", "movies", "my", "of", "please", "recommend", "recommendation",
+    "recommendations", "show", "some", "suggest", "tell", "the", "to", "us", "we", "what", "which", "would", "you",
+})  # fmt: skip
+
+
+def request_text(content: str) -> str:
+    """Canonical form of a user message used for matching: normalized, without filler words."""
+    tokens = [token for token in tokenize(content) if token not in FILLER_WORDS]
+    return " ".join(tokens) if tokens else normalize_query(content)
+
+
+def request_key(messages: list[dict[str, Any]], per_user: bool = False) -> tuple[str, str] | None:
+    """Split a chat request into (scope, last user message), or None when it should not be cached.
+
+    The scope hashes every turn before the last user message, plus the user identifier
+    (``user_id`` or the OpenAI-style ``name`` field) when ``per_user`` is set. Requests
+    without an identifier are not cached in per-user mode.
+    """
+    for position in range(len(messages) - 1, -1, -1):
+        message = messages[position]
+        if message.get("role") == "user" and isinstance(message.get("content"), str):
+            break
+    else:
+        return None
+
+    text = request_text(message["content"])
+    if not text:
+        return None
+    user = _message_user(message)
+    if per_user and user is None:
+        return None
+
+    context = [[m.get("role"), m.get("content")] for m in messages[:position]]
+    payload = json.dumps([user if per_user else None, context], default=str)
+    return hashlib.sha256(payload.encode()).hexdigest(), text
+
+
+def request_user(messages: list[dict[str, Any]]) -> str | None:
+    """Identifier of the user sending the request: ``user_id`` or ``name`` of the last user message."""
+    for message in reversed(messages):
+        if message.get("role") == "user":
+            return _message_user(message)
+    return None
+
+
+def _message_user(message: dict[str, Any]) -> str | None:
+    return next((str(message[field]) for field in _USER_FIELDS if message.get(field)), None)
+
+
+def response_text(result: Any) -> str | None:
+    """Markdown of a completed agent run, or None if the result is not cacheable."""
+    if isinstance(result, str):
+        return result or None
+    status = getattr(result, "status", None)
+    if status is not None and str(getattr(status, "value", status)).upper() != "COMPLETED":
+        return None
+    content = getattr(result, "content", None)
+    return content if isinstance(content, str) and content else None
+
+
+class SemanticResponseCache:
+    """Fixed-size LRU of responses matched by cosine similarity of the request embedding.
+
+    Embeddings live in one preallocated matrix, so a lookup is a single matrix-vector
+    product over at most ``max_entries`` rows followed by a scope/expiry mask.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl_seconds: float = 600.0,
+        threshold: float = 0.92,
+        per_user: bool = False,
+        embedder: HashingEmbedder | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_entries < 1:
+            error_msg = "max_entries must be at least 1"
+            raise ValueError(error_msg)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.threshold = threshold
+        self.per_user = per_user
+        self.embedder = embedder or HashingEmbedder()
+        self.stats = CacheStats()
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self._vectors = np.zeros((max_entries, self.embedder.dim), dtype=np.float32)
+        self._expires = np.full(max_entries, -np.inf)
+        self._scopes: list[str | None] = [None] * max_entries
+        self._responses: list[str | None] = [None] * max_entries
+        self._exact: dict[tuple[str, str], int] = {}
+        self._texts: list[str | None] = [None] * max_entries
+        self._lru: OrderedDict[int, None] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    def get(self, messages: list[dict[str, Any]]) -> str | None:
+        """Return a stored response for a matching earlier request, if any."""
+        key = request_key(messages, self.per_user)
+        if key is None:
+            return None
+        scope, text = key
+        now = self._clock()
+
+        with self._lock:
+            slot = self._exact.get(key)
+            if slot is None:
+                slot = self._nearest(scope, self.embedder.embed(text), now)
+            elif self._expires[slot] <= now:
+                self._release(slot)
+                self.stats.expirations += 1
+                slot = None
+            if slot is None:
+                self.stats.misses += 1
+                return None
+            self._lru.move_to_end(slot)
+            self.stats.hits += 1
+            return self._responses[slot]
+
+    def set(self, messages: list[dict[str, Any]], response: str) -> None:
+        """Store the response for a request, evicting the least recently used entry when full."""
+        key = request_key(messages, self.per_user)
+        if key is None or not response:
+            return
+        scope, text = key
+        vector = self.embedder.embed(text)
+
+        with self._lock:
+            slot = self._exact.get(key)
+            if slot is None:
+                slot = self._free_slot()
+            self._vectors[slot] = vector
+            self._expires[slot] = self._clock() + self.ttl_seconds
+            self._scopes[slot] = scope
+            self._texts[slot] = text
+            self._responses[slot] = response
+            self._exact[key] = slot
+            self._lru[slot] = None
+            self._lru.move_to_end(slot)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            for slot in list(self._lru):
+                self._release(slot)
+
+    def _nearest(self, scope: str, vector: np.ndarray, now: float) -> int | None:
+        """Most similar live entry in the same scope, if it clears the threshold."""
+        if not self._lru or not vector.any():
+            return None
+        scores = self._vectors @ vector
+        live = self._expires > now
+        in_scope = np.fromiter((s == scope for s in self._scopes), dtype=bool, count=self.max_entries)
+        scores[~(live & in_scope)] = -np.inf
+        slot = int(np.argmax(scores))
+        return slot if scores[slot] >= self.threshold else None
+
+    def _free_slot(self) -> int:
+        if len(self._lru) < self.max_entries:
+            return next(slot for slot in range(self.max_entries) if self._responses[slot] is None)
+        # Prefer reclaiming an expired entry over evicting a live one
+        expired = np.flatnonzero(self._expires <= self._clock())
+        if len(expired):
+            slot = int(expired[0])
+            self.stats.expirations += 1
+        else:
+            slot = next(iter(self._lru))
+            self.stats.evictions += 1
+        self._release(slot)
+        return slot
+
+    def _release(self, slot: int) -> None:
+        self._exact.pop((self._scopes[slot], self._texts[slot]), None)
+        self._lru.pop(slot, None)
+        self._expires[slot] = -np.inf
+        self._scopes[slot] = None
+        self._texts[slot] = None
+        self._responses[slot] = None
@@ -0,0 +1,192 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Route each request to a fast or a premium model by its complexity.
+
+"Top comedies 2024" does not need the same model as a group-watching request with an
+audience, exclusions, a runtime cap and a language constraint. A local heuristic
+classifier scores the last user message (constraint types, exclusions, reasoning
+requests, length, follow-up turns); clear-cut simple requests go to the fast model,
+everything else, including scores too close to the threshold to be sure, goes to the
+premium one.
+"""
+
+import math
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from movie_recommender_agent.catalog import tokenize
+
+FAST = "fast"
+PREMIUM = "premium"
+
+# Constraint types a request can carry, with how much each adds to its complexity
+_SIGNALS: dict[str, tuple[float, frozenset[str]]] = {
+    "genre": (0.25, frozenset({
+        "action", "adventure", "animated", "animation", "anime", "biopic", "comedy", "comedies", "crime",
+        "documentary", "documentaries", "drama", "dramas", "family", "fantasy", "heist", "horror", "musical",
+        "mystery", "noir", "romance", "romantic", "scifi", "sci", "superhero", "thriller", "thrillers", "war",
+        "western", "westerns",
+    })),
+    "language": (0.3, frozenset({
+        "bollywood", "chinese", "dubbed", "english", "foreign", "french", "german", "hindi", "international",
+        "italian", "japanese", "korean", "language", "spanish", "subtitled", "subtitles",
+    })),
+    "runtime": (0.3, frozenset({"hour", "hours", "length", "long", "min", "minutes", "runtime", "short"})),
+    "rating": (0.2, frozenset({
+        "acclaimed", "award", "awards", "imdb", "oscar", "rated", "rating", "ratings", "rt", "score", "tomatoes",
+    })),
+    "audience": (0.5, frozenset({
+        "boyfriend", "children", "date", "everyone", "friends", "girlfriend", "group", "husband", "kid", "kids",
+        "parents", "partner", "teen", "teens", "wife",
+    })),
+    "exclusion": (0.6, frozenset({
+        "avoid", "but", "dislike", "except", "hate", "hates", "never", "no", "nothing", "not", "without",
+    })),
+    "mood": (0.35, frozenset({
+        "atmospheric", "cozy", "emotional", "feel", "melancholic", "mood", "slow", "themes", "tone", "uplifting",
+        "vibe", "vibes",
+    })),
+    "reasoning": (0.8, frozenset({
+        "analysis", "analyze", "compare", "deep", "difference", "explain", "nuanced", "rank", "ranking", "versus",
+        "vs", "why",
+    })),
+}  # fmt: skip
+_ERA = re.compile(r"\b(?:(?:19|20)\d\d(?: s)?|\d0s|recent|classic|latest|decade|new|old)\b")
+_LONG_REQUEST_WORDS = 12
+
+
+@dataclass
+class RoutingConfig:
+    """The "routing" section of agent_config.json."""
+
+    enabled: bool = False
+    fast_model: str = "openai/gpt-4o-mini"
+    premium_model: str | None = None  # None: MODEL_NAME
+    complexity_threshold: float = 0.55
+    min_confidence: float = 0.15
+    escalate_on_error: bool = True
+
+    @classmethod
+    def from_dict(cls, values: dict[str, Any]) -> "RoutingConfig":
+        """Build from the config section, ignoring unknown keys."""
+        return cls(**{key: value for key, value in values.items() if key in cls.__dataclass_fields__})
+
+
+@dataclass
+class RouteDecision:
+    """Where a request goes, and why."""
+
+    route: str
+    score: float
+    confidence: float
+    signals: tuple[str, ...] = ()
+    escalated: bool = False
+
+
+@dataclass
+class RouteStats:
+    """Latency and token counters for one route."""
+
+    requests: int = 0
+    errors: int = 0
+    escalations: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost: float = 0.0
+    latencies: deque = field(default_factory=lambda: deque(maxlen=2048))
+
+    def percentile(self, q: float) -> float:
+        """Latency percentile in seconds over the most recent requests."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+    @property
+    def p50(self) -> float:
+        return self.percentile(0.5)
+
+    @property
+    def p95(self) -> float:
+        return self.percentile(0.95)
+
+    @property
+    def mean_output_tokens(self) -> float:
+        return self.output_tokens / self.requests if self.requests else 0.0
+
+
+def complexity(messages: list[dict[str, Any]]) -> tuple[float, tuple[str, ...]]:
+    """Complexity score in [0, 1) of a chat request and the signals that contributed to it."""
+    user_turns = [m["content"] for m in messages if m.get("role") == "user" and isinstance(m.get("content"), str)]
+    if not user_turns:
+        return 0.0, ()
+    tokens = tokenize(user_turns[-1])
+    words = set(tokens)
+
+    raw = 0.0
+    signals = []
+    for name, (weight, vocabulary) in _SIGNALS.items():
+        if words & vocabulary:
+            raw += weight
+            signals.append(name)
+    if _ERA.search(" ".join(tokens)):
+        raw += 0.25
+        signals.append("era")
+    if len(tokens) > _LONG_REQUEST_WORDS:
+        raw += 0.03 * (len(tokens) - _LONG_REQUEST_WORDS)
+        signals.append("long")
+    if len(user_turns) > 1:
+        # Follow-ups ("more like the second one") depend on the conversation so far
+        raw += min(0.25 * (len(user_turns) - 1), 1.0)
+        signals.append("follow-up")
+    return 1.0 - math.exp(-raw), tuple(signals)
+
+
+class ModelRouter:
+    """Pick a route per request and keep per-route metrics."""
+
+    def __init__(self, threshold: float = 0.55, min_confidence: float = 0.15, escalate_on_error: bool = True) -> None:
+        if not 0.0 < threshold < 1.0:
+            error_msg = "complexity_threshold must be between 0 and 1"
+            raise ValueError(error_msg)
+        self.threshold = threshold
+        self.min_confidence = min_confidence
+        self.escalate_on_error = escalate_on_error
+        self.stats = {FAST: RouteStats(), PREMIUM: RouteStats()}
+
+    @classmethod
+    def from_config(cls, config: RoutingConfig) -> "ModelRouter":
+        return cls(config.complexity_threshold, config.min_confidence, config.escalate_on_error)
+
+    def route(self, messages: list[dict[str, Any]]) -> RouteDecision:
+        """Send clearly simple requests to the fast model; escalate complex or uncertain ones."""
+        score, signals = complexity(messages)
+        # Distance from the threshold, relative to the room on that side of it
+        side = self.threshold if score < self.threshold else 1.0 - self.threshold
+        confidence = abs(score - self.threshold) / side
+        if score >= self.threshold:
+            return RouteDecision(PREMIUM, score, confidence, signals)
+        if confidence < self.min_confidence:
+            self.stats[PREMIUM].escalations += 1
+            return RouteDecision(PREMIUM, score, confidence, signals, escalated=True)
+        return RouteDecision(FAST, score, confidence, signals)
+
+    def record(self, route: str, seconds: float, metrics: Any = None, failed: bool = False) -> None:
+        """Account one finished run on a route (metrics is the agno run's Metrics, if any)."""
+        stats = self.stats[route]
+        stats.requests += 1
+        stats.errors += failed
+        stats.latencies.append(seconds)
+        if metrics is not None:
+            stats.input_tokens += getattr(metrics, "input_tokens", 0) or 0
+            stats.output_tokens += getattr(metrics, "output_tokens", 0) or 0
+            stats.cost += getattr(metrics, "cost", 0.0) or 0.0
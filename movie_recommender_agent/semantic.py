@@ -0,0 +1,316 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Semantic movie retrieval ("slow-burn melancholic sci-fi") without an LLM round trip.
+
+Plot synopses are embedded with a deterministic local hashing embedder and searched
+through an IVF (inverted file) approximate nearest-neighbour index. The index lives on
+disk as plain ``.npy`` files that are memory-mapped on load, so opening it is O(1) and
+every worker process shares one copy of the pages through the OS page cache.
+
+Build an index from a catalog with:
+
+    python -m movie_recommender_agent.semantic catalog.npz semantic_index/
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import math
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from agno.tools import Toolkit
+
+from movie_recommender_agent.catalog import MovieCatalog, tokenize
+
+_INDEX_FILES = ("centroids", "list_offsets", "vectors", "ids")
+
+
+@lru_cache(maxsize=65536)
+def _feature_slot(feature: str, dim: int) -> tuple[int, float]:
+    digest = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little")
+    return digest % dim, 1.0 if (digest >> 63) & 1 else -1.0
+
+
+class HashingEmbedder:
+    """Deterministic bag-of-words embedder using signed feature hashing.
+
+    Unigrams and bigrams are hashed into a fixed number of dimensions, weighted
+    sublinearly by term frequency and L2-normalised, so cosine similarity reduces
+    to a dot product. The same text always maps to the same vector in every process.
+    """
+
+    def __init__(self, dim: int = 256) -> None:
+        self.dim = dim
+
+    def features(self, text: str) -> list[str]:
+        """Unigram and bigram features for text."""
+        tokens = tokenize(text)
+        return tokens + [f"{a} {b}" for a, b in itertools.pairwise(tokens)]
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed one text as a float32 unit vector."""
+        values = [0.0] * self.dim
+        for feature, count in Counter(self.features(text)).items():
+            slot, sign = _feature_slot(feature, self.dim)
+            values[slot] += sign * (1.0 + math.log(count))
+        vector = np.asarray(values, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def embed_batch(self, texts: list[str]) -> np.ndarray:
+        """Embed several texts into an (n, dim) float32 matrix."""
+        matrix = np.empty((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            matrix[i] = self.embed(text)
+        return matrix
+
+
+def _kmeans(vectors: np.ndarray, n_lists: int, iterations: int, seed: int) -> np.ndarray:
+    """Spherical k-means on unit vectors; returns unit-norm centroids."""
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), n_lists, replace=False)].copy()
+    for _ in range(iterations):
+        assignments = _assign(vectors, centroids)
+        counts = np.bincount(assignments, minlength=n_lists)
+        starts = np.cumsum(counts) - counts
+        empty = counts == 0
+        sums = np.zeros_like(centroids)
+        ordered = vectors[np.argsort(assignments, kind="stable")]
+        sums[~empty] = np.add.reduceat(ordered, starts[~empty], axis=0)
+        # Re-seed empty lists so every centroid keeps covering part of the space
+        sums[empty] = vectors[rng.choice(len(vectors), int(empty.sum()), replace=False)]
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        centroids = sums / np.maximum(norms, 1e-12)
+    return centroids.astype(np.float32)
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray, chunk: int = 65536) -> np.ndarray:
+    """Nearest centroid (by inner product) for every vector, computed in chunks."""
+    assignments = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), chunk):
+        assignments[start : start + chunk] = np.argmax(vectors[start : start + chunk] @ centroids.T, axis=1)
+    return assignments
+
+
+class IVFIndex:
+    """Inverted-file ANN index over unit-norm float32 vectors (inner-product metric).
+
+    Vectors are stored grouped by their nearest centroid, so probing a list reads one
+    contiguous slice of the (memory-mapped) vector matrix.
+    """
+
+    def __init__(
+        self,
+        centroids: np.ndarray,
+        list_offsets: np.ndarray,
+        vectors: np.ndarray,
+        ids: np.ndarray,
+        nprobe: int = 8,
+        catalog_id: str | None = None,
+    ) -> None:
+        self.centroids = centroids
+        self.list_offsets = list_offsets
+        self.vectors = vectors
+        self.ids = ids
+        self.nprobe = nprobe
+        self.catalog_id = catalog_id
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def dim(self) -> int:
+        return self.centroids.shape[1]
+
+    @classmethod
+    def build(
+        cls,
+        vectors: np.ndarray,
+        ids: np.ndarray | None = None,
+        n_lists: int | None = None,
+        iterations: int = 10,
+        sample_size: int = 100_000,
+        seed: int = 0,
+    ) -> "IVFIndex":
+        """Train centroids on a sample and bucket every vector into its nearest list."""
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        ids = np.arange(len(vectors), dtype=np.int64) if ids is None else np.asarray(ids, dtype=np.int64)
+        n_lists = n_lists or max(1, int(np.sqrt(len(vectors))))
+        n_lists = min(n_lists, len(vectors))
+
+        rng = np.random.default_rng(seed)
+        sample = vectors[rng.choice(len(vectors), min(sample_size, len(vectors)), replace=False)]
+        centroids = _kmeans(sample, n_lists, iterations, seed)
+
+        assignments = _assign(vectors, centroids)
+        order = np.argsort(assignments, kind="stable")
+        list_offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignments, minlength=n_lists), out=list_offsets[1:])
+        return cls(centroids, list_offsets, vectors[order], ids[order])
+
+    def save(self, directory: str | Path) -> None:
+        """Write the index as raw ``.npy`` files suitable for memory-mapping."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in _INDEX_FILES:
+            np.save(directory / f"{name}.npy", np.ascontiguousarray(getattr(self, name)))
+        meta = {
+            "dim": self.dim,
+            "n_lists": len(self.centroids),
+            "size": len(self),
+            "metric": "ip",
+            "catalog": self.catalog_id,
+        }
+        (directory / "meta.json").write_text(json.dumps(meta))
+
+    @classmethod
+    def load(cls, directory: str | Path, nprobe: int = 8, catalog: MovieCatalog | None = None) -> "IVFIndex":
+        """Memory-map a saved index; pages are read lazily and shared between processes.
+
+        Given a catalog, the index must have been built from exactly that catalog.
+        """
+        directory = Path(directory)
+        catalog_id = json.loads((directory / "meta.json").read_text()).get("catalog")
+        if catalog is not None and catalog_id != catalog_fingerprint(catalog):
+            error_msg = (
+                f"Semantic index in {directory} was not built from this catalog; "
+                "rebuild it with python -m movie_recommender_agent.semantic"
+            )
+            raise ValueError(error_msg)
+        arrays = {name: np.load(directory / f"{name}.npy", mmap_mode="r") for name in _INDEX_FILES}
+        return cls(nprobe=nprobe, catalog_id=catalog_id, **arrays)
+
+    def search(self, query: np.ndarray, k: int = 10, nprobe: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """Approximate top-k ids and inner-product scores for one query vector."""
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        nprobe = min(nprobe or self.nprobe, len(self.centroids))
+        query = np.asarray(query, dtype=np.float32)
+        centroid_scores = self.centroids @ query
+        probe = np.argpartition(centroid_scores, -nprobe)[-nprobe:]
+
+        id_parts, score_parts = [], []
+        for list_id in probe:
+            start, end = self.list_offsets[list_id], self.list_offsets[list_id + 1]
+            if start == end:
+                continue
+            score_parts.append(self.vectors[start:end] @ query)
+            id_parts.append(self.ids[start:end])
+        if not score_parts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        scores = np.concatenate(score_parts)
+        ids = np.concatenate(id_parts)
+        k = min(k, len(scores))
+        top = np.argpartition(scores, -k)[-k:]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return ids[top], scores[top]
+
+    def search_exact(self, query: np.ndarray, k: int = 10) -> tuple[np.ndarray, np.ndarray]:
+        """Brute-force top-k, used as ground truth for recall measurements."""
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        scores = self.vectors @ np.asarray(query, dtype=np.float32)
+        k = min(k, len(scores))
+        top = np.argpartition(scores, -k)[-k:]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return self.ids[top], scores[top]
+
+
+def movie_text(catalog: MovieCatalog, row: int) -> str:
+    """Text embedded for one catalog movie: title, genres, keywords and synopsis."""
+    parts = [
+        catalog.text["title"][row],
+        " ".join(catalog.lists["genres"].values(row)),
+        " ".join(catalog.lists["keywords"].values(row)),
+        catalog.text["synopsis"][row],
+    ]
+    return " ".join(parts)
+
+
+def catalog_fingerprint(catalog: MovieCatalog) -> str:
+    """Digest of the catalog's ids and titles in row order, identifying the rows an index refers to."""
+    digest = hashlib.sha256()
+    for name in ("id", "title"):
+        column = catalog.text[name]
+        digest.update(np.ascontiguousarray(column.offsets, dtype=np.int64).tobytes())
+        digest.update(np.ascontiguousarray(column.blob).tobytes())
+    return digest.hexdigest()
+
+
+def build_catalog_index(catalog: MovieCatalog, embedder: HashingEmbedder | None = None, **kwargs: Any) -> IVFIndex:
+    """Embed every catalog movie and build an IVF index keyed by catalog row."""
+    embedder = embedder or HashingEmbedder()
+    vectors = embedder.embed_batch([movie_text(catalog, row) for row in range(len(catalog))])
+    index = IVFIndex.build(vectors, **kwargs)
+    index.catalog_id = catalog_fingerprint(catalog)
+    return index
+
+
+class SemanticSearchTools(Toolkit):
+    """Agent toolkit for free-text, mood or theme based movie retrieval."""
+
+    def __init__(
+        self,
+        catalog: MovieCatalog,
+        index: IVFIndex,
+        embedder: HashingEmbedder | None = None,
+        **kwargs: Any,
+    ) -> None:
+        # Index ids are catalog rows; an index built for another catalog would return the wrong movies
+        if len(index) != len(catalog):
+            error_msg = f"Semantic index has {len(index):,} vectors but the catalog has {len(catalog):,} titles"
+            raise ValueError(error_msg)
+        self.catalog = catalog
+        self.index = index
+        self.embedder = embedder or HashingEmbedder(dim=index.dim)
+        super().__init__(name="semantic_movie_search", tools=[self.semantic_movie_search], **kwargs)
+
+    def semantic_movie_search(self, description: str, limit: int = 10) -> str:
+        """Find catalog movies whose plot and themes match a free-text description or mood.
+
+        Args:
+            description (str): What the user is in the mood for, e.g. "slow-burn melancholic sci-fi".
+            limit (int): Maximum number of movies to return. Defaults to 10.
+
+        Returns:
+            str: Matching movies in JSON format, most relevant first.
+        """
+        ids, scores = self.index.search(self.embedder.embed(description), k=limit)
+        results = []
+        for movie_id, score in zip(ids, scores, strict=True):
+            record = self.catalog.record(int(movie_id))
+            record["relevance"] = round(float(score), 3)
+            results.append(record)
+        return json.dumps(results, ensure_ascii=False)
+
+
+def main() -> None:
+    """Build a memory-mappable semantic index for a catalog."""
+    parser = argparse.ArgumentParser(description="Build the semantic (IVF) index for the offline movie catalog")
+    parser.add_argument("catalog", type=Path, help="Catalog store or dump")
+    parser.add_argument("output", type=Path, help="Destination directory for the index files")
+    parser.add_argument("--dim", type=int, default=256, help="Embedding dimensions")
+    parser.add_argument("--lists", type=int, default=None, help="Number of IVF lists (default: sqrt(n))")
+    args = parser.parse_args()
+
+    catalog = MovieCatalog.load(args.catalog)
+    index = build_catalog_index(catalog, HashingEmbedder(dim=args.dim), n_lists=args.lists)
+    index.save(args.output)
+    print(f"🧭 Semantic index with {len(index):,} movies in {len(index.centroids)} lists written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
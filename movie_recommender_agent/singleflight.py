@@ -0,0 +1,83 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Request coalescing ("single-flight") for identical in-flight agent runs.
+
+When a burst of identical requests arrives, only the first starts an agent run; the
+others await the same task and receive its result (or exception). The shared task is
+shielded from individual callers being cancelled and is only cancelled once every
+caller waiting on it has gone away.
+"""
+
+import asyncio
+from collections.abc import Callable, Coroutine, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters for a SingleFlight group."""
+
+    calls: int = 0
+    coalesced: int = 0
+    abandoned: int = 0
+
+    @property
+    def coalesced_ratio(self) -> float:
+        """Fraction of requests that joined an existing in-flight call."""
+        total = self.calls + self.coalesced
+        return self.coalesced / total if total else 0.0
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Deduplicate concurrent calls that share a key."""
+
+    def __init__(self) -> None:
+        self.stats = SingleFlightStats()
+        self._flights: dict[Hashable, _Flight] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def do(self, key: Hashable, func: Callable[[], Coroutine[Any, Any, Any]]) -> Any:
+        """Run func() once for all concurrent callers with the same key and return its result."""
+        flight = self._flights.get(key)
+        if flight is None or flight.task.cancelling():
+            flight = _Flight(asyncio.create_task(func()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _task, key=key, flight=flight: self._forget(key, flight))
+            self.stats.calls += 1
+        else:
+            self.stats.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every caller was cancelled: nobody wants the result any more
+                flight.task.cancel()
+                self.stats.abandoned += 1
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.task.cancelled():
+            # Mark the exception as retrieved when every waiter was cancelled before it was raised
+            flight.task.exception()
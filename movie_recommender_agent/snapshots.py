@@ -0,0 +1,325 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Precomputed answers for canonical queries whose results change only daily.
+
+"Top-rated comedy movies from last 2 years" gets the same answer all day, so a set of
+canonical queries (the "snapshots" section of agent_config.json) is answered ahead of
+time: SnapshotRefresher re-runs each one in the background once its snapshot is older
+than the refresh interval, and only while the process is idle. Single-turn requests
+that are the canonical query, one of its aliases, or an equivalent phrasing with the
+same intent (same genres, quality and recency cues, and no other content words) are
+answered from the stored snapshot without an agent run.
+
+Each refresh bumps the snapshot's version. With a path, snapshots are kept in a JSON
+file shared by pre-forked workers and restarts; a file lock lets only one process
+refresh at a time while the others pick up its results.
+"""
+
+import asyncio
+import contextlib
+import fcntl
+import json
+import os
+import re
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from movie_recommender_agent.catalog import tokenize
+from movie_recommender_agent.response_cache import FILLER_WORDS, request_text
+
+# Words that map to one intent label, so "funny films" and "comedies" mean the same
+_INTENT_LABELS: dict[str, frozenset[str]] = {
+    "action": frozenset({"action"}),
+    "adventure": frozenset({"adventure", "adventures"}),
+    "animation": frozenset({"animated", "animation", "anime", "cartoon", "cartoons"}),
+    "comedy": frozenset({"comedies", "comedy", "funny", "hilarious"}),
+    "documentary": frozenset({"documentaries", "documentary", "docs"}),
+    "drama": frozenset({"drama", "dramas"}),
+    "family": frozenset({"child", "children", "families", "family", "friendly", "kid", "kids"}),
+    "horror": frozenset({"horror", "scary"}),
+    "romance": frozenset({"romance", "romantic", "romcom", "romcoms"}),
+    "scifi": frozenset({"sci", "scifi", "fi"}),
+    "thriller": frozenset({"thriller", "thrillers", "suspense"}),
+    "top": frozenset({
+        "acclaimed", "best", "greatest", "high", "highest", "highly", "rated", "rating", "ratings", "top",
+    }),
+    "recent": frozenset({"latest", "new", "newest", "recent", "recently"}),
+}  # fmt: skip
+_LABEL_OF = {word: label for label, words in _INTENT_LABELS.items() for word in words}
+_RECENT_SPAN = re.compile(r"\b(?:last|past|previous)\s+((?:\w+\s+){0,2})(years?)\b|\bthis year\b")
+_SPAN_NUMBERS = {
+    "a": 1, "one": 1, "two": 2, "couple": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7,
+    "eight": 8, "nine": 9, "ten": 10, "fifteen": 15, "twenty": 20, "thirty": 30, "fifty": 50,
+}  # fmt: skip
+# Connecting words that carry no intent once filler words are gone
+_NEUTRAL = frozenset({
+    "about", "all", "at", "based", "brief", "for", "from", "in", "include", "on", "outing", "plot", "release",
+    "released", "summary", "that", "time", "title", "watch", "with", "year",
+})  # fmt: skip
+
+
+def _span_label(match: re.Match[str]) -> str:
+    """Recency label that keeps the span length: "last 2 years" and "past couple of years" are recent:2y."""
+    if match.group(2) is None:
+        return "recent:this-year"
+    words = [word for word in match.group(1).split() if word not in ("of", "the")]
+    if not words:
+        return "recent:1y" if match.group(2) == "year" else "recent:years"
+    if len(words) == 1 and words[0].isdigit():
+        return f"recent:{int(words[0])}y"
+    if len(words) == 1 and words[0] in _SPAN_NUMBERS:
+        return f"recent:{_SPAN_NUMBERS[words[0]]}y"
+    return "recent:" + "-".join(words)
+
+
+def intent_key(text: str) -> frozenset[str]:
+    """Intent of a request: its genre/quality/recency labels plus any other content words.
+
+    A time span stays a label of its own length, so only identical spans match.
+    """
+    normalized = " ".join(tokenize(text))
+    labels = {_span_label(match) for match in _RECENT_SPAN.finditer(normalized)}
+    for token in _RECENT_SPAN.sub(" ", normalized).split():
+        if token in _LABEL_OF:
+            labels.add(_LABEL_OF[token])
+        elif token not in FILLER_WORDS and token not in _NEUTRAL:
+            labels.add(token)
+    return frozenset(labels)
+
+
+@dataclass
+class SnapshotConfig:
+    """The "snapshots" section of agent_config.json."""
+
+    enabled: bool = False
+    queries: list[Any] = field(default_factory=list)  # a query, or {"query": ..., "aliases": [...]}
+    refresh_interval: float = 86_400.0  # seconds before a snapshot is recomputed
+    max_age: float = 172_800.0  # older snapshots are not served (a refresh kept failing)
+    idle_seconds: float = 10.0  # quiet time before a background refresh may start
+    check_interval: float = 30.0
+    path: str | None = None  # JSON file shared by workers and restarts
+
+    @classmethod
+    def from_dict(cls, values: dict[str, Any]) -> "SnapshotConfig":
+        """Build from the config section, ignoring unknown keys."""
+        return cls(**{key: value for key, value in values.items() if key in cls.__dataclass_fields__})
+
+
+@dataclass
+class Snapshot:
+    """The rendered answer to one canonical query."""
+
+    query: str
+    content: str
+    version: int
+    refreshed_at: float
+
+
+@dataclass
+class SnapshotStats:
+    """Counters for a SnapshotStore."""
+
+    hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    failures: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of eligible requests answered from a snapshot."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SnapshotStore:
+    """Versioned snapshots of the canonical queries, matched by text or intent."""
+
+    def __init__(self, config: SnapshotConfig, clock: Callable[[], float] = time.time) -> None:
+        self.config = config
+        self.stats = SnapshotStats()
+        self.queries: list[str] = []
+        self._clock = clock
+        self._snapshots: dict[str, Snapshot] = {}
+        self._exact: dict[str, str] = {}
+        self._intents: dict[frozenset[str], str] = {}
+        self._loaded_mtime = 0.0
+        for entry in config.queries:
+            query, aliases = (entry, []) if isinstance(entry, str) else (entry["query"], entry.get("aliases", []))
+            self.queries.append(query)
+            for text in (query, *aliases):
+                self._exact[request_text(text)] = query
+                intent = intent_key(text)
+                if intent:
+                    self._intents.setdefault(intent, query)
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def match(self, messages: list[dict[str, Any]]) -> Snapshot | None:
+        """Snapshot answering a single-turn request for a canonical query, if one is fresh enough."""
+        turns = [message for message in messages if message.get("role") != "system"]
+        if len(turns) != 1 or turns[0].get("role") != "user" or not isinstance(turns[0].get("content"), str):
+            return None
+        content = turns[0]["content"]
+        query = self._exact.get(request_text(content)) or self._intents.get(intent_key(content))
+        snapshot = self._snapshots.get(query) if query is not None else None
+        if snapshot is None or self._clock() - snapshot.refreshed_at > self.config.max_age:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return snapshot
+
+    def get(self, query: str) -> Snapshot | None:
+        """Current snapshot of a canonical query."""
+        return self._snapshots.get(query)
+
+    def due(self) -> list[str]:
+        """Canonical queries without a snapshot or with one older than the refresh interval, oldest first."""
+        now = self._clock()
+        stale = [q for q in self.queries if now - self._refreshed_at(q) >= self.config.refresh_interval]
+        return sorted(stale, key=self._refreshed_at)
+
+    def put(self, query: str, content: str) -> Snapshot:
+        """Store a new version of a query's snapshot (persisted when the store has a path)."""
+        previous = self._snapshots.get(query)
+        snapshot = Snapshot(query, content, previous.version + 1 if previous else 1, self._clock())
+        self._snapshots[query] = snapshot
+        self.stats.refreshes += 1
+        self.save()
+        return snapshot
+
+    def load(self) -> bool:
+        """Pick up snapshots another process wrote since the last load; returns whether any changed."""
+        path = self._path()
+        if path is None or not path.exists() or path.stat().st_mtime <= self._loaded_mtime:
+            return False
+        try:
+            entries = json.loads(path.read_text())
+            self._loaded_mtime = path.stat().st_mtime
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Snapshots unreadable ({path}): {e}")
+            return False
+        for entry in entries:
+            snapshot = Snapshot(**entry)
+            current = self._snapshots.get(snapshot.query)
+            if snapshot.query in self.queries and (current is None or snapshot.version > current.version):
+                self._snapshots[snapshot.query] = snapshot
+        return True
+
+    def save(self) -> None:
+        """Write every snapshot to the path atomically, so readers never see a partial file."""
+        path = self._path()
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_text(json.dumps([asdict(s) for s in self._snapshots.values()], ensure_ascii=False))
+        os.replace(temporary, path)
+        self._loaded_mtime = path.stat().st_mtime
+
+    @contextlib.contextmanager
+    def refresh_lock(self) -> Any:
+        """Yield whether this process may refresh: true unless another process holds the file lock."""
+        path = self._path()
+        if path is None:
+            yield True
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path.with_suffix(".lock"), "a") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _refreshed_at(self, query: str) -> float:
+        snapshot = self._snapshots.get(query)
+        return snapshot.refreshed_at if snapshot else float("-inf")
+
+    def _path(self) -> Path | None:
+        return Path(self.config.path) if self.config.path else None
+
+
+class SnapshotRefresher:
+    """Background task refreshing due snapshots while no request is being served."""
+
+    def __init__(
+        self,
+        store: SnapshotStore,
+        run: Callable[[str], Awaitable[str | None]],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.store = store
+        self.run = run
+        self.in_flight = 0
+        self._clock = clock
+        self._last_request = clock()
+        self._task: asyncio.Task | None = None
+
+    def request_started(self) -> None:
+        self.in_flight += 1
+        self._last_request = self._clock()
+
+    def request_finished(self) -> None:
+        self.in_flight -= 1
+        self._last_request = self._clock()
+
+    @property
+    def idle(self) -> bool:
+        """No request in flight, and none for the configured idle time."""
+        return self.in_flight == 0 and self._clock() - self._last_request >= self.store.config.idle_seconds
+
+    def start(self) -> None:
+        """Start the background task on the running event loop, unless it already runs there."""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._task = loop.create_task(self._run_forever(), name="snapshot-refresher")
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def refresh_due(self) -> int:
+        """Refresh due snapshots one at a time while idle; returns how many were refreshed."""
+        self.store.load()
+        refreshed = 0
+        with self.store.refresh_lock() as owner:
+            if not owner:
+                return 0
+            for query in self.store.due():
+                if not self.idle:
+                    break
+                try:
+                    content = await self.run(query)
+                except Exception as e:
+                    content = None
+                    print(f"⚠️  Snapshot refresh failed for {query!r}: {e}")
+                if not content:
+                    self.store.stats.failures += 1
+                    continue
+                snapshot = self.store.put(query, content)
+                refreshed += 1
+                print(f"📸 Snapshot v{snapshot.version} of {query!r} refreshed")
+        return refreshed
+
+    async def _run_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.store.config.check_interval)
+            if self.idle:
+                await self.refresh_due()
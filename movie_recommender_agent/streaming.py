@@ -0,0 +1,104 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Incremental delivery of the agent's markdown report.
+
+bindu consumes the handler's async iterator in two ways: ``message/stream`` forwards
+every truthy chunk to the client as an appended artifact, while ``message/send``
+keeps only the last chunk. A stream therefore yields markdown deltas followed by a
+falsy StreamedResponse carrying the complete text: streaming clients skip it (they
+already have every delta) and buffered clients read the full report from it.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable
+from typing import Any
+
+from agno.run.agent import RunEvent
+
+
+class StreamedResponse:
+    """Final chunk of a stream: the complete content, invisible to streaming clients."""
+
+    __slots__ = ("content",)
+
+    def __init__(self, content: str) -> None:
+        self.content = content
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __str__(self) -> str:
+        return self.content
+
+
+async def agent_deltas(agent: Any, messages: list[dict[str, str]], user_id: str | None = None) -> AsyncIterator[str]:
+    """Text deltas of one streamed agent run."""
+    async for event in agent.arun(messages, stream=True, user_id=user_id):
+        kind = getattr(event, "event", None)
+        content = getattr(event, "content", None)
+        if kind == RunEvent.run_error.value:
+            error_msg = f"Agent run failed: {content}"
+            raise RuntimeError(error_msg)
+        if kind == RunEvent.run_content.value and isinstance(content, str) and content:
+            yield content
+
+
+async def line_chunks(deltas: AsyncIterator[str], max_chars: int = 256) -> AsyncIterator[str]:
+    """Regroup token deltas into whole lines, so each table row is sent the moment it is complete.
+
+    Long lines are flushed every max_chars so prose paragraphs still stream smoothly.
+    """
+    pending = ""
+    async for delta in deltas:
+        pending += delta
+        cut = pending.rfind("\n") + 1
+        if cut:
+            yield pending[:cut]
+            pending = pending[cut:]
+        elif len(pending) >= max_chars:
+            yield pending
+            pending = ""
+    if pending:
+        yield pending
+
+
+async def relay(deltas: asyncio.Queue, result: Awaitable[str]) -> AsyncIterator[str | StreamedResponse]:
+    """Yield deltas from a queue fed by a producer, then the producer's complete text.
+
+    The producer puts ``None`` after its last delta. When the result completes without
+    any delta (e.g. it was coalesced with a run that another request is streaming), the
+    whole text is yielded as a single chunk instead.
+    """
+    result = asyncio.ensure_future(result)
+    streamed = False
+    try:
+        while True:
+            getter = asyncio.ensure_future(deltas.get())
+            await asyncio.wait({getter, result}, return_when=asyncio.FIRST_COMPLETED)
+            if not getter.done():
+                # The result finished first: pass on whatever the producer queued before it
+                getter.cancel()
+                while not deltas.empty() and (delta := deltas.get_nowait()) is not None:
+                    streamed = True
+                    yield delta
+                break
+            delta = getter.result()
+            if delta is None:
+                break
+            streamed = True
+            yield delta
+        content = await result
+    finally:
+        if not result.done():
+            result.cancel()
+
+    if not streamed:
+        yield content
+    yield StreamedResponse(content)
@@ -0,0 +1,341 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Request tracing and Prometheus metrics for the hot path.
+
+Telemetry.span() times a step of a request (the handler, the init lock, cache lookups,
+the agent run, each tool call) and nests through a context variable, so tool calls made
+inside an agent run become its children. Every span feeds Prometheus-style histograms
+and counters; only a sampled fraction of requests (decided once per request) is also
+exported, as OpenTelemetry OTLP/JSON lines to stdout or a file.
+
+Span attributes ending in _tokens or _bytes are added to token and payload counters,
+and those ending in _seconds to a per-phase histogram (model time, pool wait, ...).
+"""
+
+import bisect
+import contextlib
+import contextvars
+import inspect
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, TextIO
+
+# Latency buckets in seconds, from cache lookups to full recommendations
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 40.0, 80.0)
+
+_current: contextvars.ContextVar["Span | None"] = contextvars.ContextVar("span", default=None)
+
+
+class Span:
+    """One timed step of a request."""
+
+    __slots__ = ("attributes", "end_ns", "error", "name", "parent", "sampled", "span_id", "start_ns", "trace")
+
+    def __init__(self, name: str, parent: "Span | None", sampled: bool, attributes: dict[str, Any]) -> None:
+        self.name = name
+        self.parent = parent
+        self.sampled = sampled
+        self.attributes = attributes
+        self.error: str | None = None
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.span_id = f"{random.getrandbits(64):016x}" if sampled else ""
+        # Finished spans of a sampled trace, shared by all its spans and exported with the root
+        self.trace: _Trace | None = (parent.trace if parent else _Trace()) if sampled else None
+
+    @property
+    def seconds(self) -> float:
+        end = self.end_ns or time.time_ns()
+        return (end - self.start_ns) / 1e9
+
+    def set(self, **attributes: Any) -> None:
+        """Add or replace attributes."""
+        self.attributes.update(attributes)
+
+    def add(self, key: str, value: float) -> None:
+        """Accumulate a numeric attribute, e.g. the time spent in child tool calls."""
+        self.attributes[key] = self.attributes.get(key, 0) + value
+
+
+class _Trace:
+    __slots__ = ("exported", "spans", "trace_id")
+
+    def __init__(self) -> None:
+        self.trace_id = f"{random.getrandbits(128):032x}"
+        self.spans: list[Span] = []
+        self.exported = False
+
+
+class Histogram:
+    """Cumulative Prometheus histogram."""
+
+    def __init__(self, buckets: tuple[float, ...] = BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Metrics:
+    """Span histograms and token / payload counters, rendered in the Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.spans: dict[str, Histogram] = {}
+            self.phases: dict[tuple[str, str], Histogram] = {}
+            self.errors: dict[str, int] = {}
+            self.tokens: dict[tuple[str, str], int] = {}
+            self.payload: dict[tuple[str, str], int] = {}
+
+    def record(self, span: Span) -> None:
+        with self._lock:
+            self.spans.setdefault(span.name, Histogram()).observe(span.seconds)
+            if span.error is not None:
+                self.errors[span.name] = self.errors.get(span.name, 0) + 1
+            for key, value in span.attributes.items():
+                if not isinstance(value, int | float) or isinstance(value, bool):
+                    continue
+                if key.endswith("_tokens"):
+                    label = (span.name, key.removesuffix("_tokens"))
+                    self.tokens[label] = self.tokens.get(label, 0) + int(value)
+                elif key.endswith("_bytes"):
+                    label = (span.name, key.removesuffix("_bytes"))
+                    self.payload[label] = self.payload.get(label, 0) + int(value)
+                elif key.endswith("_seconds"):
+                    self.phases.setdefault((span.name, key.removesuffix("_seconds")), Histogram()).observe(value)
+
+    def render(self, labels: dict[str, str] | None = None) -> str:
+        """The metrics in the Prometheus text exposition format."""
+        extra = "".join(f',{key}="{value}"' for key, value in (labels or {}).items())
+        lines = []
+        with self._lock:
+            lines += _histogram_lines("agent_span_seconds", "Duration of request steps", self.spans, "span", extra)
+            phases = {f'{span}",phase="{phase}': h for (span, phase), h in self.phases.items()}
+            lines += _histogram_lines("agent_phase_seconds", "Time spent in a phase of a step", phases, "span", extra)
+            lines += _counter_lines("agent_span_errors_total", "Failed request steps", self.errors, extra)
+            tokens = {f'{span}",kind="{kind}': n for (span, kind), n in self.tokens.items()}
+            lines += _counter_lines("agent_tokens_total", "LLM tokens", tokens, extra)
+            payload = {f'{span}",kind="{kind}': n for (span, kind), n in self.payload.items()}
+            lines += _counter_lines("agent_payload_bytes_total", "Request, response and tool payloads", payload, extra)
+        return "\n".join(lines) + "\n"
+
+
+def _histogram_lines(name: str, doc: str, histograms: dict[str, Histogram], label: str, extra: str) -> list[str]:
+    lines = [f"# HELP {name} {doc}.", f"# TYPE {name} histogram"]
+    for key, histogram in sorted(histograms.items()):
+        cumulative = 0
+        for bound, count in zip((*histogram.buckets, "+Inf"), histogram.counts, strict=True):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{label}="{key}"{extra},le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_sum{{{label}="{key}"{extra}}} {histogram.sum:.6f}')
+        lines.append(f'{name}_count{{{label}="{key}"{extra}}} {histogram.count}')
+    return lines
+
+
+def _counter_lines(name: str, doc: str, counters: dict[str, int], extra: str) -> list[str]:
+    lines = [f"# HELP {name} {doc}.", f"# TYPE {name} counter"]
+    lines.extend(f'{name}{{span="{key}"{extra}}} {value}' for key, value in sorted(counters.items()))
+    return lines
+
+
+class SpanExporter:
+    """Write sampled traces as OTLP/JSON lines (one ExportTraceServiceRequest per trace).
+
+    target is "stdout" or a file path; files are opened in append mode, once per process.
+    """
+
+    def __init__(self, target: str, service_name: str = "movie-recommender-agent") -> None:
+        self.target = target
+        self.resource = {"attributes": [_attribute("service.name", service_name)]}
+        self._lock = threading.Lock()
+        self._file: TextIO | None = None
+        self._pid: int | None = None
+
+    def export(self, spans: list[Span]) -> None:
+        line = json.dumps({
+            "resourceSpans": [{
+                "resource": self.resource,
+                "scopeSpans": [{"scope": {"name": "movie_recommender_agent"}, "spans": [_otlp(s) for s in spans]}],
+            }]
+        }, separators=(",", ":"), default=str)  # fmt: skip
+        with self._lock:
+            self._stream().write(line + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None and self._file is not sys.stdout and self._pid == os.getpid():
+                self._file.close()
+            self._file = None
+
+    def _stream(self) -> TextIO:
+        if self._pid != os.getpid():
+            # Line buffered, so lines from pre-forked workers never interleave mid-line
+            self._file = sys.stdout if self.target in ("stdout", "-") else open(self.target, "a", buffering=1)  # noqa: SIM115
+            self._pid = os.getpid()
+        return self._file  # type: ignore[return-value]
+
+
+def _attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _otlp(span: Span) -> dict[str, Any]:
+    """A span in the OTLP/JSON encoding."""
+    encoded = {
+        "traceId": span.trace.trace_id,  # type: ignore[union-attr]
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 1,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": [_attribute(key, value) for key, value in span.attributes.items()],
+        "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+    }
+    if span.parent is not None:
+        encoded["parentSpanId"] = span.parent.span_id
+    return encoded
+
+
+class Telemetry:
+    """Spans and metrics of the request path; a no-op until configured."""
+
+    def __init__(self) -> None:
+        self.metrics = Metrics()
+        self.exporter: SpanExporter | None = None
+        self.sample_rate = 0.0
+        self.enabled = False
+        self.labels: dict[str, str] = {}
+
+    def configure(self, export: str | None = None, sample_rate: float = 0.05, metrics: bool = False) -> None:
+        """Enable telemetry: export a sample_rate fraction of traces to export (stdout or a file)."""
+        if not 0.0 <= sample_rate <= 1.0:
+            error_msg = "TELEMETRY_SAMPLE_RATE must be between 0 and 1"
+            raise ValueError(error_msg)
+        self.exporter = SpanExporter(export) if export else None
+        self.sample_rate = sample_rate if export else 0.0
+        self.enabled = bool(export) or metrics
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """Time a step of the current request; nested spans become its children."""
+        parent = _current.get()
+        sampled = parent.sampled if parent is not None else self.sample_rate > random.random()  # noqa: S311
+        span = Span(name, parent, sampled, attributes)
+        if not self.enabled:
+            yield span
+            return
+        token = _current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            # A span finished in another context (e.g. a streaming generator closed elsewhere)
+            with contextlib.suppress(ValueError):
+                _current.reset(token)
+            self._finish(span)
+
+    def current(self) -> Span | None:
+        """The innermost span of the running request, if any."""
+        return _current.get()
+
+    async def tool_hook(self, function_name: str, function_call: Callable, arguments: dict[str, Any]) -> Any:
+        """agno tool hook: one span per tool call, its time added to the enclosing agent run."""
+        if not self.enabled:
+            result = function_call(**arguments)
+            return await result if inspect.isawaitable(result) else result
+        args_bytes = len(json.dumps(arguments, default=str))
+        with self.span(f"tool.{function_name}", args_bytes=args_bytes) as span:
+            result = function_call(**arguments)
+            if inspect.isawaitable(result):
+                result = await result
+            span.set(result_bytes=len(str(result)))
+        if span.parent is not None:
+            span.parent.add("tool_seconds", span.seconds)
+        return result
+
+    def after_fork(self) -> None:
+        """Start a forked worker with empty metrics (the parent's are not this worker's traffic)."""
+        self.metrics.reset()
+
+    def close(self) -> None:
+        if self.exporter is not None:
+            self.exporter.close()
+
+    def _finish(self, span: Span) -> None:
+        self.metrics.record(span)
+        trace = span.trace
+        if trace is None or self.exporter is None:
+            return
+        if span.parent is None:
+            trace.spans.append(span)
+            trace.exported = True
+            self.exporter.export(trace.spans)
+        elif trace.exported:
+            # Finished after its request (e.g. a stream drained late): export it on its own
+            self.exporter.export([span])
+        else:
+            trace.spans.append(span)
+
+
+class MetricsServer:
+    """Serve GET /metrics in the Prometheus text format from a background thread."""
+
+    def __init__(self, telemetry: Telemetry, host: str = "127.0.0.1", port: int = 9464) -> None:
+        render = telemetry.metrics.render
+        labels = telemetry.labels
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = render(labels).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_port
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
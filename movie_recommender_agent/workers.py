@@ -0,0 +1,209 @@
+# |---------------------------------------------------------|
+# |                                                         |
+# |                 Give Feedback / Get Help                |
+# | https://github.com/getbindu/Bindu/issues/new/choose    |
+# |                                                         |
+# |---------------------------------------------------------|
+#
+#  Thank you users! We ❤️ you! - 🌻
+
+"""Pre-fork multi-process serving for the bindufy server.
+
+The parent binds the deployment address once, warms up the agent and its read-only
+assets (catalog arrays, memory-mapped indexes), then forks N workers that all accept
+on the inherited listening socket. Everything loaded before the fork is shared
+copy-on-write. The parent only supervises: crashed workers are restarted with an
+exponential backoff, and SIGINT/SIGTERM are forwarded for a graceful shutdown.
+"""
+
+import contextlib
+import gc
+import importlib
+import os
+import signal
+import socket
+import sys
+import time
+import traceback
+from collections.abc import Callable
+from typing import Any
+from urllib.parse import urlparse
+
+import uvicorn
+
+_SHUTDOWN_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+
+def bind_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """Create the listening socket shared by every worker."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def deployment_address(config: dict) -> tuple[str, int]:
+    """Host and port of the configured deployment URL."""
+    url = urlparse(config.get("deployment", {}).get("url", "http://127.0.0.1:3773"))
+    return url.hostname or "127.0.0.1", url.port or 3773
+
+
+class WorkerSupervisor:
+    """Fork, watch and restart a fixed number of worker processes."""
+
+    def __init__(
+        self,
+        target: Callable[[], Any],
+        workers: int,
+        restart_delay: float = 1.0,
+        max_restart_delay: float = 30.0,
+        min_uptime: float = 5.0,
+    ) -> None:
+        self.target = target
+        self.workers = workers
+        self.restart_delay = restart_delay
+        self.max_restart_delay = max_restart_delay
+        self.min_uptime = min_uptime
+        self.restarts = 0
+        self.pids: dict[int, int] = {}  # pid -> worker slot
+        self._started: dict[int, float] = {}  # slot -> start time
+        self._delays: dict[int, float] = {}  # slot -> next restart delay
+        self._stopping = False
+
+    def start(self) -> None:
+        """Fork every worker."""
+        # Keep the GC from touching (and so un-sharing) pages of objects created before the fork
+        gc.freeze()
+        for slot in range(self.workers):
+            self._spawn(slot)
+
+    def reap(self) -> bool:
+        """Collect exited workers and restart them; returns whether any worker exited."""
+        exited = False
+        while self.pids:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                break
+            exited = True
+            slot = self.pids.pop(pid)
+            if self._stopping:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            print(f"⚠️  Worker {slot} (pid {pid}) exited with code {code}, restarting")
+            # Back off when a worker keeps dying right after start
+            if time.monotonic() - self._started[slot] < self.min_uptime:
+                delay = self._delays.get(slot, self.restart_delay)
+                self._delays[slot] = min(delay * 2, self.max_restart_delay)
+                time.sleep(delay)
+            else:
+                self._delays.pop(slot, None)
+            self.restarts += 1
+            self._spawn(slot)
+        return exited
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """Ask every worker to shut down gracefully, killing stragglers after timeout."""
+        self._stopping = True
+        for pid in list(self.pids):
+            _signal(pid, signal.SIGTERM)
+        deadline = time.monotonic() + timeout
+        while self.pids and time.monotonic() < deadline:
+            if not self.reap():
+                time.sleep(0.05)
+        for pid in list(self.pids):
+            _signal(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            self.pids.pop(pid)
+
+    def run(self, poll_interval: float = 0.2) -> None:
+        """Start the workers and supervise them until SIGINT or SIGTERM."""
+        previous = {sig: signal.signal(sig, self._request_stop) for sig in _SHUTDOWN_SIGNALS}
+        try:
+            self.start()
+            while not self._stopping:
+                if not self.reap():
+                    time.sleep(poll_interval)
+        finally:
+            self.stop()
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+
+    def _request_stop(self, signum: int, frame: Any) -> None:
+        self._stopping = True
+
+    def _spawn(self, slot: int) -> None:
+        pid = os.fork()
+        if pid:
+            self.pids[pid] = slot
+            self._started[slot] = time.monotonic()
+            return
+
+        # Child: the slot lets per-worker side services (e.g. the metrics port) tell workers apart
+        os.environ["AGENT_WORKER_SLOT"] = str(slot)
+        # Child: uvicorn re-raises the shutdown signal after a graceful stop; turn it into SystemExit
+        for sig in _SHUTDOWN_SIGNALS:
+            signal.signal(sig, _exit_on_signal)
+        code = 0
+        try:
+            self.target()
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else 0
+        except BaseException:
+            traceback.print_exc()
+            code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(code)
+
+
+def _exit_on_signal(signum: int, frame: Any) -> None:
+    raise SystemExit(0)
+
+
+def _signal(pid: int, sig: int) -> None:
+    with contextlib.suppress(ProcessLookupError):
+        os.kill(pid, sig)
+
+
+def serve_workers(
+    config: dict,
+    handler: Callable,
+    workers: int,
+    after_fork: Callable[[], None] | None = None,
+    on_exit: Callable[[], None] | None = None,
+) -> None:
+    """Serve bindufy(config, handler) from `workers` pre-forked processes on one listening socket."""
+    # The module, not the bindufy function re-exported by bindu.penguin
+    bindufy_module = importlib.import_module("bindu.penguin.bindufy")
+
+    host, port = deployment_address(config)
+    sock = bind_socket(host, port)
+
+    # Create DID keys and validate the config once, before workers race to do it
+    bindufy_module.bindufy(config, handler, run_server=False)
+
+    def serve_on_shared_socket(app: Any, host: str, port: int, display_info: bool = True) -> None:
+        uvicorn.Server(uvicorn.Config(app, host=host, port=port)).run(sockets=[sock])
+
+    def worker() -> None:
+        if after_fork is not None:
+            after_fork()
+        # bindufy builds the app and hands it to its server runner; serve it on the inherited socket
+        bindufy_module.start_uvicorn_server = serve_on_shared_socket
+        try:
+            bindufy_module.bindufy(config, handler)
+        finally:
+            if on_exit is not None:
+                on_exit()
+
+    print(f"🧵 Serving on {host}:{port} with {workers} worker processes (pid {os.getpid()} supervising)")
+    supervisor = WorkerSupervisor(worker, workers)
+    try:
+        supervisor.run()
+    finally:
+        sock.close()
+        print(f"🧵 All workers stopped ({supervisor.restarts} restarts)")
@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+from movie_recommender_agent.catalog import MovieCatalog
+
+MOVIES = [
+    {
+        "tconst": "tt1375666",
+        "primaryTitle": "Inception",
+        "startYear": "2010",
+        "runtimeMinutes": "148",
+        "genres": "Action,Adventure,Sci-Fi",
+        "averageRating": "8.8",
+        "numVotes": "2500000",
+        "directors": "Christopher Nolan",
+        "cast": "Leonardo DiCaprio|Joseph Gordon-Levitt|Elliot Page",
+        "keywords": "dream|heist|subconscious",
+    },
+    {
+        "tconst": "tt6751668",
+        "primaryTitle": "Parasite",
+        "startYear": "2019",
+        "runtimeMinutes": "132",
+        "genres": "Drama,Thriller",
+        "averageRating": "8.5",
+        "numVotes": "950000",
+        "directors": "Bong Joon Ho",
+        "cast": "Song Kang-ho|Lee Sun-kyun",
+        "keywords": "class differences|con artist|basement",
+        "language": "Korean",
+    },
+    {
+        "tconst": "tt0364569",
+        "primaryTitle": "Oldboy",
+        "startYear": "2003",
+        "runtimeMinutes": "120",
+        "genres": "Action,Drama,Mystery",
+        "averageRating": "8.3",
+        "numVotes": "620000",
+        "directors": "Park Chan-wook",
+        "cast": "Choi Min-sik|Yoo Ji-tae",
+        "keywords": "revenge|imprisonment|twist ending",
+        "language": "Korean",
+    },
+    {
+        "tconst": "tt1321511",
+        "primaryTitle": "Oldboy",
+        "startYear": "2013",
+        "runtimeMinutes": "104",
+        "genres": "Action,Drama,Mystery",
+        "averageRating": "5.7",
+        "numVotes": "90000",
+        "directors": "Spike Lee",
+        "cast": "Josh Brolin|Elizabeth Olsen",
+        "keywords": "revenge|imprisonment|remake",
+    },
+    {
+        "tconst": "tt6723592",
+        "primaryTitle": "Tenet",
+        "startYear": "2020",
+        "runtimeMinutes": "150",
+        "genres": "Action,Sci-Fi,Thriller",
+        "averageRating": "7.3",
+        "numVotes": "600000",
+        "directors": "Christopher Nolan",
+        "cast": "John David Washington|Robert Pattinson",
+        "keywords": "time inversion|espionage|heist",
+    },
+]
+
+
+@pytest.fixture
+def catalog(tmp_path) -> MovieCatalog:
+    """Small IMDb-style catalog ingested from a JSONL dump."""
+    dump = tmp_path / "movies.jsonl"
+    dump.write_text("\n".join(json.dumps(movie) for movie in MOVIES))
+    return MovieCatalog.from_dump(dump)
@@ -0,0 +1,91 @@
+import asyncio
+import json
+
+from movie_recommender_agent.batch import OutputWriter, build_messages, completed_ids, read_records, run_batch
+
+
+def _write_input(path, records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records) + "not json\n")
+
+
+def _answers(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def _run(records, run, output, **kwargs):
+    with open(output, "a") as file:
+        return asyncio.run(run_batch(records, run, OutputWriter(file), **kwargs))
+
+
+def test_profile_and_user_reach_the_agent():
+    """The profile is an "About me" turn before the query; user turns carry the user id."""
+    record = {"user_id": 42, "query": "Slow-burn thrillers", "profile": {"likes": ["Heat", "Prisoners"]}}
+
+    assert build_messages(record) == [
+        {"role": "user", "content": "About me: likes: Heat, Prisoners", "user_id": "42"},
+        {"role": "user", "content": "Slow-burn thrillers", "user_id": "42"},
+    ]
+    assert build_messages({"messages": [{"role": "user", "content": "Heist films"}]}) == [
+        {"role": "user", "content": "Heist films"}
+    ]
+
+
+def test_answers_are_streamed_with_bounded_concurrency(tmp_path):
+    """At most concurrency runs are in flight; failures and invalid lines are written as errors."""
+    source = tmp_path / "requests.jsonl"
+    _write_input(source, [{"id": f"r{i}", "user_id": f"u{i}", "query": f"query {i}"} for i in range(20)])
+    active, peak = 0, 0
+
+    async def run(messages):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if messages[-1]["content"] == "query 7":
+            error_msg = "rate limited"
+            raise RuntimeError(error_msg)
+        return f"# Picks for {messages[-1]['user_id']}"
+
+    stats = _run(read_records(source), run, tmp_path / "answers.jsonl", concurrency=4)
+
+    answers = {entry["id"]: entry for entry in _answers(tmp_path / "answers.jsonl")}
+    assert peak == 4
+    assert (stats.answered, stats.failed) == (19, 2)
+    assert answers["r3"]["response"] == "# Picks for u3"
+    assert answers["r7"]["error"] == "RuntimeError: rate limited"
+    assert answers["21"]["error"].startswith("Invalid JSON")
+
+
+def test_rerun_resumes_after_a_crash(tmp_path):
+    """A rerun skips answered ids, drops a partially written line and retries failures."""
+    source = tmp_path / "requests.jsonl"
+    _write_input(source, [{"id": f"r{i}", "query": f"query {i}"} for i in range(5)])
+    output = tmp_path / "answers.jsonl"
+    output.write_text(
+        '{"id": "r0", "response": "# r0"}\n{"id": "r1", "error": "RuntimeError: boom"}\n{"id": "r2", "resp'
+    )
+    calls = []
+
+    async def run(messages):
+        calls.append(messages[-1]["content"])
+        return "# ok"
+
+    done = completed_ids(output)
+    stats = _run(read_records(source), run, output, done=done)
+
+    assert done == {"r0"}
+    assert sorted(calls) == ["query 1", "query 2", "query 3", "query 4"]
+    assert stats.skipped == 1
+    assert completed_ids(output) == {"r0", "r1", "r2", "r3", "r4"}
+    assert all(entry for entry in _answers(output))
+
+
+def test_long_partial_line_is_cut_off(tmp_path):
+    """A crash in the middle of a long answer leaves only the complete lines before it."""
+    output = tmp_path / "answers.jsonl"
+    complete = '{"id": "r0", "response": "# r0"}\n'
+    output.write_text(complete + '{"id": "r1", "response": "' + "x" * 200_000)
+
+    assert completed_ids(output) == {"r0"}
+    assert output.read_text() == complete
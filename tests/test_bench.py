@@ -0,0 +1,65 @@
+import asyncio
+import json
+import random
+
+import httpx
+import pytest
+
+from movie_recommender_agent.bench import FakeExa, FakeOpenRouter, Latency, compare, percentiles
+from movie_recommender_agent.clients import ClientManager, PooledExa
+
+
+def test_latency_specs():
+    """Latency distributions parse from the command line and sample deterministically."""
+    assert Latency.parse("0.5") == Latency("fixed", 0.5)
+    assert Latency.parse("uniform:0.1,0.3") == Latency("uniform", 0.1, 0.3)
+    lognormal = Latency.parse("lognormal:0.6,0.3")
+    assert lognormal.sample(random.Random(1)) == lognormal.sample(random.Random(1))
+    with pytest.raises(ValueError, match="Latency must be"):
+        Latency.parse("normal:1,2")
+
+
+def test_fake_model_calls_exa_then_streams_a_report():
+    """The fake model asks for one search_movies call, then streams the report with usage."""
+    llm = FakeOpenRouter(Latency("fixed", 0.0), tokens_per_second=1e6, output_tokens=50)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(llm))
+    tools = [{"type": "function", "function": {"name": "search_movies"}}]
+    request = {"model": "fake", "messages": [{"role": "user", "content": "Korean thrillers"}], "tools": tools}
+
+    async def run():
+        first = (await client.post("https://openrouter.ai/api/v1/chat/completions", json=request)).json()
+        request["messages"].append({"role": "tool", "content": "{}"})
+        streamed = await client.post("https://openrouter.ai/api/v1/chat/completions", json={**request, "stream": True})
+        return first, streamed.text
+
+    first, events = asyncio.run(run())
+    call = first["choices"][0]["message"]["tool_calls"][0]["function"]
+    assert call["name"] == "search_movies"
+    assert len(json.loads(call["arguments"])["titles"]) == 3
+    assert "Movie Recommendations for Korean thrillers" in events
+    assert '"usage"' in events
+    assert events.endswith("data: [DONE]\n\n")
+    assert llm.calls == 2
+
+
+def test_fake_exa_serves_exa_py():
+    """exa_py parses the fake Exa responses served through the pooled client."""
+    exa_backend = FakeExa(Latency("fixed", 0.0))
+    http = ClientManager(transport=httpx.MockTransport(exa_backend))
+    exa = PooledExa("bench", client=http.client)
+
+    response = exa.search_and_contents("Oldboy movie rating", num_results=2)
+
+    assert len(response.results) == 2
+    assert exa_backend.calls == 1
+
+
+def test_regressions_against_a_baseline():
+    """p95 latency and throughput are gated against a baseline within the allowed regression."""
+    baseline = {"latency_ms": percentiles([1.0, 1.0, 1.2]), "throughput_rps": 10.0}
+    same = {"latency_ms": percentiles([1.0, 1.05, 1.25]), "throughput_rps": 9.5}
+    worse = {"latency_ms": percentiles([1.0, 1.5, 2.0]), "throughput_rps": 7.0}
+
+    assert baseline["latency_ms"]["p95"] == 1200.0
+    assert compare(same, baseline, max_regression=0.1) == []
+    assert len(compare(worse, baseline, max_regression=0.1)) == 2
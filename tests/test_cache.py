@@ -0,0 +1,74 @@
+from movie_recommender_agent.cache import ResultCache, make_cache_key
+
+
+class FakeClock:
+    """Manually advanced clock for TTL tests."""
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_key_normalizes_query():
+    """Test that whitespace and case differences map to the same key."""
+    assert make_cache_key("search_exa", "Thrillers  like Inception ", num_results=5) == make_cache_key(
+        "search_exa", "thrillers like inception", num_results=5
+    )
+    assert make_cache_key("search_exa", "inception", num_results=5) != make_cache_key(
+        "search_exa", "inception", num_results=10
+    )
+
+
+def test_lru_eviction():
+    """Test that the least recently used entry is evicted first."""
+    cache = ResultCache(max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+    assert cache.stats.evictions == 1
+
+
+def test_entries_expire_after_ttl():
+    """Test that per-entry TTLs are honoured."""
+    clock = FakeClock()
+    cache = ResultCache(ttl_seconds=60, clock=clock)
+    cache.set("short", "x", ttl_seconds=5)
+    cache.set("long", "y")
+
+    clock.now += 10
+    assert cache.get("short") is None
+    assert cache.get("long") == "y"
+
+    clock.now += 60
+    assert cache.get("long") is None
+    assert cache.stats.expirations == 2
+
+
+def test_disk_tier_survives_new_instance(tmp_path):
+    """Test that the SQLite tier serves entries to a fresh cache instance."""
+    db_path = str(tmp_path / "exa.sqlite")
+    first = ResultCache(db_path=db_path)
+    first.set("key", "value")
+    first.close()
+
+    second = ResultCache(db_path=db_path)
+    assert second.get("key") == "value"
+    assert second.stats.disk_hits == 1
+    second.close()
+
+
+def test_disk_tier_creates_its_directory(tmp_path):
+    """Test that a database path in a directory that does not exist yet is created."""
+    db_path = tmp_path / ".cache" / "exa" / "exa_cache.sqlite"
+    cache = ResultCache(db_path=str(db_path))
+    cache.set("key", "value")
+    cache.close()
+
+    assert db_path.exists()
@@ -0,0 +1,69 @@
+import json
+
+from movie_recommender_agent.catalog import CatalogTools, MovieCatalog
+
+
+def test_ingest_imdb_style_dump(catalog):
+    """Test that IMDb-style field names are mapped onto catalog columns."""
+    assert len(catalog) == 5
+    inception = catalog.lookup("inception")[0]
+    assert inception["year"] == 2010
+    assert inception["rating"] == 8.8
+    assert inception["runtime_minutes"] == 148
+    assert inception["genres"] == ["Action", "Adventure", "Sci-Fi"]
+    assert inception["directors"] == ["Christopher Nolan"]
+    assert "Leonardo DiCaprio" in inception["cast"]
+
+
+def test_lookup_disambiguates_by_year(catalog):
+    """Test that remakes are separated by release year."""
+    results = catalog.lookup("Oldboy")
+    assert [movie["year"] for movie in results] == [2003, 2013]
+    assert catalog.lookup("oldboy", year=2013)[0]["directors"] == ["Spike Lee"]
+    assert catalog.lookup("Not In Catalog") == []
+
+
+def test_search_intersects_indexes(catalog):
+    """Test compound genre/director/year searches."""
+    nolan = catalog.search(director="christopher nolan")
+    assert [movie["title"] for movie in nolan] == ["Inception", "Tenet"]
+
+    thrillers = catalog.search(genres=["Thriller"], year_from=2015)
+    assert [movie["title"] for movie in thrillers] == ["Parasite", "Tenet"]
+
+    assert catalog.search(actor="Choi Min-sik")[0]["title"] == "Oldboy"
+    assert catalog.search(genres=["Drama"], min_rating=8.0, limit=1)[0]["title"] == "Parasite"
+
+
+def test_save_and_load_roundtrip(catalog, tmp_path):
+    """Test that the columnar store reloads with identical content."""
+    store = tmp_path / "catalog.npz"
+    catalog.save(store)
+    reloaded = MovieCatalog.load(store)
+
+    assert len(reloaded) == len(catalog)
+    assert reloaded.lookup("Parasite") == catalog.lookup("Parasite")
+    assert reloaded.search(genres=["Action"]) == catalog.search(genres=["Action"])
+
+
+def test_csv_dump(tmp_path):
+    """Test ingesting a CSV dump with IMDb null markers."""
+    dump = tmp_path / "movies.csv"
+    dump.write_text('title,year,genres,rating\n"Amélie",2001,"Comedy,Romance",8.3\nUntitled,\\N,,\n')
+    catalog = MovieCatalog.from_dump(dump)
+
+    assert catalog.lookup("amelie")[0]["genres"] == ["Comedy", "Romance"]
+    untitled = catalog.lookup("Untitled")[0]
+    assert untitled["year"] is None
+    assert untitled["rating"] is None
+
+
+def test_catalog_tools_return_json(catalog):
+    """Test that the toolkit exposes catalog lookups to the agent."""
+    tools = CatalogTools(catalog)
+    assert {"lookup_movie", "search_catalog"} <= set(tools.functions)
+
+    result = json.loads(tools.lookup_movie("Tenet"))
+    assert result[0]["year"] == 2020
+    older_dramas = json.loads(tools.search_catalog(genres=["Drama"], year_to=2010))
+    assert [movie["title"] for movie in older_dramas] == ["Oldboy"]
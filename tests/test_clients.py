@@ -0,0 +1,163 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from movie_recommender_agent.clients import ClientConfig, ClientManager, DNSCache, PooledExa, RateLimiter
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Keep-alive JSON endpoint that fails the first `failures` requests with a 503."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        self.server.connections += 1
+        super().setup()
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["content-length"] or 0))
+        if self.server.failures:
+            self.server.failures -= 1
+            self._send(503, b"busy", {"retry-after": "0"})
+        elif self.path == "/bad":
+            self._send(400, b'{"error": "bad request"}')
+        else:
+            self._send(200, json.dumps({"echo": json.loads(body or b"null")}).encode())
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in {"content-type": "application/json", **(headers or {})}.items():
+            self.send_header(name, value)
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    httpd.connections = 0
+    httpd.failures = 0
+    threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_exa_requests_reuse_one_connection(server):
+    """Every Exa call goes over the same pooled keep-alive connection."""
+    http = ClientManager()
+    exa = PooledExa("test-key", client=http.client, base_url=f"http://localhost:{server.server_port}")
+
+    for i in range(10):
+        assert exa.request("/search", {"query": f"movie {i}"}) == {"echo": {"query": f"movie {i}"}}
+
+    assert server.connections == 1
+    assert http.stats.requests == 10
+    assert http.stats.reuse_ratio == 0.9
+    http.close()
+
+
+def test_retryable_status_is_retried(server):
+    """A 503 is retried (after its Retry-After) on the same connection; client errors are not."""
+    server.failures = 2
+    http = ClientManager(ClientConfig(retries=2, backoff=0.01))
+    url = f"http://localhost:{server.server_port}"
+    exa = PooledExa("test-key", client=http.client, base_url=url)
+
+    assert exa.request("/search", {"query": "heist"}) == {"echo": {"query": "heist"}}
+    assert http.stats.retries == 2
+    with pytest.raises(ValueError, match="status code 400"):
+        exa.request("/bad", {"query": "heist"})
+    assert http.stats.retries == 2
+    assert server.connections == 1
+    http.close()
+
+
+def test_post_is_retried_only_when_it_was_not_acted_on():
+    """A POST is retried after a connect error or a 429, but not after a 500 or a lost response."""
+    outcomes = [
+        httpx.ConnectError("refused"),
+        httpx.Response(200),
+        httpx.Response(429, headers={"retry-after": "0"}),
+        httpx.Response(200),
+        httpx.Response(500),
+        httpx.ReadError("reset"),
+    ]
+
+    def send(request):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    http = ClientManager(ClientConfig(retries=2, backoff=0.0), transport=httpx.MockTransport(send))
+    assert http.client.post("http://api.test/chat").status_code == 200
+    assert http.client.post("http://api.test/chat").status_code == 200
+    assert http.client.post("http://api.test/chat").status_code == 500
+    with pytest.raises(httpx.ReadError):
+        http.client.post("http://api.test/chat")
+    assert http.stats.retries == 2
+    http.close()
+
+
+def test_async_client_pools_connections(server):
+    """The async client shared by the models keeps its connection alive across requests."""
+    http = ClientManager()
+    url = f"http://localhost:{server.server_port}/chat"
+
+    async def run():
+        statuses = [(await http.async_client.post(url, json={"n": i})).status_code for i in range(5)]
+        await http.aclose()
+        return statuses
+
+    assert asyncio.run(run()) == [200] * 5
+    assert server.connections == 1
+
+
+def test_dns_cache_expires_and_forgets():
+    """Lookups are cached for the TTL; an address that failed to connect is dropped."""
+    now = [0.0]
+    dns = DNSCache(ttl=60, clock=lambda: now[0])
+    infos = [(None, None, None, "", ("10.0.0.1", 443))]
+
+    assert dns.lookup("api.exa.ai", 443) is None
+    assert dns.store("api.exa.ai", 443, infos) == "10.0.0.1"
+    assert dns.lookup("api.exa.ai", 443) == "10.0.0.1"
+    assert dns.lookup("127.0.0.1", 443) == "127.0.0.1"
+
+    now[0] = 61.0
+    assert dns.lookup("api.exa.ai", 443) is None
+    dns.store("api.exa.ai", 443, infos)
+    dns.forget("api.exa.ai", 443)
+    assert dns.lookup("api.exa.ai", 443) is None
+    assert (dns.stats.dns_hits, dns.stats.dns_misses) == (1, 2)
+
+
+def test_rate_limit_spaces_requests_across_callers(server):
+    """Requests beyond the burst wait for a token; the wait is shared by every caller of the host."""
+    now = [0.0]
+    limiter = RateLimiter(rate=2, clock=lambda: now[0])
+    assert [limiter.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    now[0] = 10.0
+    assert limiter.reserve() == 0.0
+
+    http = ClientManager(ClientConfig(rate_limits={"localhost": 10}))
+    exa = PooledExa("test-key", client=http.client, base_url=f"http://localhost:{server.server_port}")
+    start = time.perf_counter()
+    for i in range(13):
+        exa.request("/search", {"query": str(i)})
+
+    # 10 requests fit the burst; the other 3 need a token each at 10 per second
+    assert time.perf_counter() - start >= 0.29
+    assert 1 <= http.stats.throttled <= 3
+    http.close()
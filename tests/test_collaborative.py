@@ -0,0 +1,95 @@
+import json
+import random
+
+import numpy as np
+from agno.run import RunContext
+
+from movie_recommender_agent.catalog import MovieCatalog
+from movie_recommender_agent.collaborative import CollaborativeModel, CollaborativeTools, ratings_log_path
+
+THRILLERS = [f"tt{i:07d}" for i in range(10)]
+COMEDIES = [f"tt{i:07d}" for i in range(10, 20)]
+
+
+def _ratings() -> list[tuple[str, str, float]]:
+    """Thriller fans and comedy fans, each loving a sample of their genre and panning one of the other."""
+    rng = random.Random(3)
+    ratings = []
+    for user in range(60):
+        liked, other = (THRILLERS, COMEDIES) if user % 2 else (COMEDIES, THRILLERS)
+        ratings += [(f"u{user}", movie, 5.0) for movie in rng.sample(liked, 5)]
+        ratings.append((f"u{user}", rng.choice(other), 1.0))
+    return ratings
+
+
+def _model() -> CollaborativeModel:
+    return CollaborativeModel.fit(_ratings(), factors=4, iterations=30, regularization=1.0)
+
+
+def _catalog() -> MovieCatalog:
+    genres = {**dict.fromkeys(THRILLERS, "Thriller"), **dict.fromkeys(COMEDIES, "Comedy")}
+    return MovieCatalog.from_records(
+        {"tconst": movie, "title": f"{genre} {i}", "genres": [genre], "numVotes": 100}
+        for i, (movie, genre) in enumerate(genres.items())
+    )
+
+
+def test_recommends_unrated_movies_liked_by_similar_users():
+    """A thriller fan gets the thrillers they have not rated; batched scoring matches per-user scoring."""
+    model = _model()
+    rated = {movie for user, movie, _ in _ratings() if user == "u1"}
+
+    movies, scores = model.recommend("u1", k=3)
+    picks = [model.movie_ids[movie] for movie in movies]
+
+    assert set(picks) <= set(THRILLERS) - rated
+    assert list(scores) == sorted(scores, reverse=True)
+    rows, batch_scores = model.recommend_batch([model.user_index["u1"], model.user_index["u2"]], k=3)
+    assert rows[0].tolist() == movies.tolist()
+    assert {model.movie_ids[movie] for movie in rows[1]} <= set(COMEDIES)
+    assert np.allclose(batch_scores[0], scores)
+    assert len(model.recommend("stranger")[0]) == 0
+
+
+def test_new_ratings_are_folded_in_without_retraining(tmp_path):
+    """A new user's ratings take effect at once, replace earlier ones and survive save and load."""
+    model = _model()
+    factors = model.movie_factors.copy()
+
+    comedies = dict.fromkeys(COMEDIES[:4], 5.0)
+    assert model.add_ratings("newcomer", {**comedies, "tt9999999": 5}) == ["tt9999999"]
+    assert {model.movie_ids[movie] for movie in model.recommend("newcomer", k=3)[0]} <= set(COMEDIES[4:])
+    model.add_ratings("newcomer", {**dict.fromkeys(COMEDIES[:4], 1.0), **dict.fromkeys(THRILLERS[:4], 5.0)})
+    assert {model.movie_ids[movie] for movie in model.recommend("newcomer", k=3)[0]} <= set(THRILLERS[4:])
+    assert np.array_equal(model.movie_factors, factors)
+
+    model.save(tmp_path / "cf.npz")
+    loaded = CollaborativeModel.load(tmp_path / "cf.npz")
+    assert len(loaded.history(loaded.user_index["newcomer"])[0]) == 8
+    assert np.allclose(loaded.recommend("newcomer", k=3)[1], model.recommend("newcomer", k=3)[1])
+
+
+def test_tools_record_ratings_and_recommend_for_the_current_user(tmp_path):
+    """Ratings given in conversation are logged and folded in; picks explain which rating they follow."""
+    catalog = _catalog()
+    log_path = ratings_log_path(tmp_path / "cf.npz")
+    tools = CollaborativeTools(catalog, _model(), log_path=log_path)
+    run_context = RunContext(run_id="run", session_id="session", user_id="alice")
+
+    empty = json.loads(tools.recommend_from_history(run_context))
+    assert empty["recommendations"] == []
+    ratings = {"Thriller 0": 5, "Thriller 1": 5, "Thriller 2": 4.5, "Thriller 3": 5, "Dune": 4}
+    recorded = json.loads(tools.rate_movies(run_context, ratings))
+    assert recorded["recorded"] == ["Thriller 0", "Thriller 1", "Thriller 2", "Thriller 3"]
+    assert recorded["not_found"] == ["Dune"]
+
+    picks = json.loads(tools.recommend_from_history(run_context, limit=3))["recommendations"]
+    assert [pick["genres"] for pick in picks] == [["Thriller"]] * 3
+    assert picks[0]["because_you_rated"] in {"Thriller 0", "Thriller 1", "Thriller 2", "Thriller 3"}
+    for limit in (0, -1):
+        assert json.loads(tools.recommend_from_history(run_context, limit=limit))["recommendations"] == []
+
+    # Replaying the log after a restart restores alice's ratings
+    restarted = _model()
+    assert restarted.replay(log_path) == 4
+    assert "alice" in restarted.user_index
@@ -0,0 +1,78 @@
+import json
+import random
+
+import numpy as np
+
+from movie_recommender_agent.catalog import MovieCatalog
+from movie_recommender_agent.constraints import ConstraintIndex, ConstraintTools, count, to_rows
+
+
+def _titles(catalog, container):
+    return sorted(catalog.text["title"][row] for row in to_rows(container))
+
+
+def test_compound_constraints(catalog):
+    """Test that genre, language, year, runtime and rating constraints combine with AND."""
+    index = ConstraintIndex(catalog)
+
+    korean, unknown = index.filter(languages=["korean"], year_from=2000, year_to=2019)
+    assert _titles(catalog, korean) == ["Oldboy", "Parasite"]
+    assert unknown == []
+    assert _titles(catalog, index.filter(languages=["Korean"], exclude_genres=["Thriller"])[0]) == ["Oldboy"]
+    assert _titles(catalog, index.filter(genres=["Action"], runtime_max=120)[0]) == ["Oldboy", "Oldboy"]
+    assert _titles(catalog, index.filter(min_rating=8.5)[0]) == ["Inception", "Parasite"]
+
+    nothing, unknown = index.filter(languages=["Klingon"], genres=["Drama"])
+    assert count(nothing) == 0
+    assert unknown == ["Klingon"]
+
+
+def test_bitmaps_match_a_column_scan():
+    """Test that dense and sparse containers give exactly the rows and ranking of a plain scan."""
+    rng = random.Random(5)
+    catalog = MovieCatalog.from_records(
+        {
+            "title": f"Movie {i}",
+            "year": rng.choice([rng.randint(1930, 2024), None]),
+            "runtime": rng.randint(60, 200),
+            "rating": round(rng.uniform(2.0, 9.8), 1),
+            "votes": rng.randint(0, 10_000),
+            "genres": rng.sample(["Drama", "Comedy", "Horror", "Western", "Noir"], 2),
+            "language": rng.choices(["English", "French", "Tamil"], weights=[90, 9, 1])[0],
+            "content_rating": rng.choice(["G", "PG", "PG-13", "R"]),
+        }
+        for i in range(5_000)
+    )
+    index = ConstraintIndex(catalog)
+    genres = catalog.lists["genres"]
+    drama = np.array(["Drama" in genres.values(row) for row in range(len(catalog))])
+    language = np.array(list(catalog.text["language"]))
+    content = np.array(list(catalog.text["content_rating"]))
+
+    queries = [
+        ({"year_from": 1990, "year_to": 1999}, (catalog.year >= 1990) & (catalog.year <= 1999)),
+        ({"year_from": 1994, "year_to": 1994}, catalog.year == 1994),
+        ({"runtime_max": 97, "exclude_genres": ["Drama"]}, (catalog.runtime <= 97) & ~drama),
+        ({"languages": ["Tamil", "French"], "min_rating": 7.1}, (language != "English") & (catalog.rating >= 7.1)),
+        ({"genres": ["Drama"], "content_ratings": ["G", "PG"]}, drama & np.isin(content, ["G", "PG"])),
+        ({}, np.ones(len(catalog), dtype=bool)),
+    ]
+    for query, mask in queries:
+        rows, _ = index.filter(**query)
+        expected = np.flatnonzero(mask)
+        assert to_rows(rows).tolist() == expected.tolist(), query
+        assert index.best(rows, 10).tolist() == catalog.rank(expected, 10).tolist(), query
+
+
+def test_constraint_tools_return_ranked_candidates(catalog):
+    """Test that the toolkit reports the match count and the best-rated candidates."""
+    tools = ConstraintTools(catalog)
+    assert "filter_movies" in tools.functions
+
+    result = json.loads(tools.filter_movies(genres=["Action"], year_from=2010, limit=1))
+    assert result["matches"] == 3
+    assert [movie["title"] for movie in result["candidates"]] == ["Inception"]
+    assert result["candidates"][0]["runtime_minutes"] == 148
+
+    missing = json.loads(tools.filter_movies(content_ratings=["PG-13"]))
+    assert missing == {"matches": 0, "unknown_values": ["PG-13"], "candidates": []}
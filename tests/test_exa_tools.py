@@ -0,0 +1,134 @@
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+from movie_recommender_agent.cache import ResultCache
+from movie_recommender_agent.exa_tools import CachedExaTools
+
+
+class FakeExa:
+    """Stand-in for the exa_py client that counts network calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def search_and_contents(self, query, **kwargs):
+        self.calls += 1
+        result = SimpleNamespace(
+            url=f"https://example.com/{self.calls}", title=query, author=None, published_date=None, text=""
+        )
+        return SimpleNamespace(results=[result])
+
+
+class SlowExa:
+    """exa_py stand-in with a fixed latency per call, plus titles that hang or fail."""
+
+    def __init__(self, latency: float, hang: str = "", fail: str = "") -> None:
+        self.latency = latency
+        self.hang = hang
+        self.fail = fail
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def search_and_contents(self, query, **kwargs):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.latency * (20 if self.hang and self.hang in query else 1))
+            if self.fail and self.fail in query:
+                error_msg = "quota exceeded"
+                raise RuntimeError(error_msg)
+            result = SimpleNamespace(url="https://example.com", title=query, author=None, published_date=None, text="")
+            return SimpleNamespace(results=[result])
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _make_tools(cache: ResultCache) -> tuple[CachedExaTools, FakeExa]:
+    tools = CachedExaTools(cache=cache, api_key="test-key")
+    fake = FakeExa()
+    tools.exa = fake
+    return tools, fake
+
+
+def test_repeated_searches_hit_cache():
+    """Test that repeated Exa searches are answered from memory."""
+    cache = ResultCache(max_entries=16)
+    tools, fake = _make_tools(cache)
+
+    for _ in range(5):
+        tools.search_exa("Thrillers like Inception")
+    tools.search_exa("top comedies last 2 years")
+
+    assert fake.calls == 2
+    # The cache handed in (empty, hence falsy) is the one used, so its stats are reported
+    assert tools.cache is cache
+    assert tools.cache.stats.hits == 4
+    assert tools.cache.stats.misses == 2
+    assert tools.cache.stats.hit_ratio == 4 / 6
+
+
+def test_errors_are_not_cached():
+    """Test that failed Exa calls are retried rather than cached."""
+    tools, fake = _make_tools(ResultCache())
+
+    def failing_search(query, **kwargs):
+        fake.calls += 1
+        raise ConnectionError("boom")
+
+    fake.search_and_contents = failing_search
+    assert tools.search_exa("inception").startswith("Error:")
+    assert tools.search_exa("inception").startswith("Error:")
+    assert fake.calls == 2
+    assert len(tools.cache) == 0
+
+
+def test_batch_lookup_runs_concurrently():
+    """Test that a batch of lookups takes about one round trip, bounded by max_concurrency."""
+    tools = CachedExaTools(cache=ResultCache(), api_key="test-key", max_concurrency=4)
+    tools.exa = SlowExa(latency=0.1)
+    titles = [f"Movie {i}" for i in range(8)]
+
+    start = time.perf_counter()
+    payload = json.loads(tools.search_movies(titles))
+    elapsed = time.perf_counter() - start
+    tools.close()
+
+    assert sorted(payload["results"]) == sorted(titles)
+    assert payload["errors"] == {}
+    assert tools.exa.peak == 4
+    assert elapsed < 0.1 * 8 / 2
+
+
+def test_batch_lookup_tolerates_failures_and_timeouts():
+    """Test that failed and slow titles are reported while the rest still return."""
+    tools = CachedExaTools(cache=ResultCache(), api_key="test-key", batch_timeout=0.5)
+    tools.exa = SlowExa(latency=0.05, hang="Slow", fail="Broken")
+
+    payload = json.loads(tools.search_movies(["Tenet", "Slow Movie", "Broken Movie", "Tenet"]))
+    tools.close()
+
+    assert list(payload["results"]) == ["Tenet"]
+    assert payload["results"]["Tenet"][0]["url"] == "https://example.com"
+    assert "Timed out" in payload["errors"]["Slow Movie"]
+    assert "quota exceeded" in payload["errors"]["Broken Movie"]
+
+
+def test_concurrent_identical_lookups_share_one_call():
+    """Users researching the same film at the same time wait for one Exa call instead of each making one."""
+    tools = CachedExaTools(cache=ResultCache(), api_key="test-key")
+    tools.exa = SlowExa(latency=0.1)
+
+    threads = [threading.Thread(target=tools.search_exa, args=("Oldboy movie rating",)) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert tools.exa.peak == 1
+    assert tools.coalesced == 5
+    assert tools.cache.stats.misses == 6
@@ -0,0 +1,79 @@
+from movie_recommender_agent.history import HistoryWindow, PreferenceSummary, count_tokens
+
+CONVERSATION = [
+    {"role": "system", "content": "Be brief."},
+    {"role": "user", "content": "Suggest Korean thrillers similar to Oldboy, but no horror please"},
+    {"role": "assistant", "content": "| **Memories of Murder** | 2003 |\n| **The Chaser** | 2008 |"},
+    {"role": "user", "content": "I don't like slow movies. Something like Parasite?"},
+    {"role": "assistant", "content": "Try **Burning** and **Mother**."},
+    {"role": "user", "content": "More please"},
+]
+
+
+def test_short_conversations_pass_through():
+    """Requests within the turn and token limits are sent unchanged."""
+    window = HistoryWindow(max_turns=8, token_budget=2_000)
+
+    assert window.window(CONVERSATION) is CONVERSATION
+
+
+def test_older_turns_are_folded_into_a_summary():
+    """Only the last turns stay verbatim; earlier preferences survive in the summary."""
+    window = HistoryWindow(max_turns=2)
+
+    trimmed = window.window(CONVERSATION)
+
+    assert trimmed[0] == CONVERSATION[0]
+    assert trimmed[-2:] == CONVERSATION[-2:]
+    summary = trimmed[1]["content"]
+    assert trimmed[1]["role"] == "system"
+    assert "likes: Korean, thriller" in summary
+    assert "dislikes: horror, slow-paced" in summary
+    assert "Oldboy" in summary
+    assert "Parasite" in summary
+    assert "Memories of Murder, The Chaser" in summary
+
+
+def test_token_budget_limits_the_window():
+    """Turns that would exceed the token budget are summarized even under max_turns."""
+    long_reply = {"role": "assistant", "content": "word " * 500}
+    messages = [{"role": "user", "content": "heist movies"}, long_reply, {"role": "user", "content": "more"}]
+
+    trimmed = HistoryWindow(max_turns=8, token_budget=100).window(messages)
+
+    assert trimmed[-1] == messages[-1]
+    assert long_reply not in trimmed
+
+
+def test_summary_is_updated_incrementally():
+    """A growing conversation only folds the turns that left the window since the last request."""
+    window = HistoryWindow(max_turns=1)
+
+    window.window(CONVERSATION[:4])
+    assert window.folded_turns == 2
+    window.window(CONVERSATION[:6])
+    assert window.folded_turns == 4
+
+
+def test_later_turns_override_earlier_preferences():
+    """When the user changes their mind, the latest statement wins."""
+    summary = PreferenceSummary()
+    summary.fold({"role": "user", "content": "No horror please"})
+    summary.fold({"role": "user", "content": "Actually horror is fine now"})
+
+    assert "horror" in summary.likes
+    assert "horror" not in summary.dislikes
+
+
+def test_count_tokens_is_close_to_bpe():
+    """The local estimate lands near a BPE tokenizer's count for ordinary English."""
+    assert count_tokens("Suggest thriller movies similar to Inception") in range(7, 12)
+    assert count_tokens("") == 0
+
+
+def test_from_config():
+    """The agent_config.json section enables and sizes the window."""
+    assert HistoryWindow.from_config({}) is None
+    window = HistoryWindow.from_config({"enabled": True, "max_turns": 4, "token_budget": 500})
+    assert window.max_turns == 4
+    assert window.token_budget == 500
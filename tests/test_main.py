@@ -1,8 +1,16 @@
+import asyncio
+import json
+import os
+import subprocess
+import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from movie_recommender_agent.main import APIKeyError, handler
+from movie_recommender_agent.main import APIKeyError, ensure_initialized, handler, is_ready, present, run_agent
+from movie_recommender_agent.pool import AgentPool
+from movie_recommender_agent.rendering import MovieRecommendation, RecommendationSet
+from movie_recommender_agent.routing import FAST, PREMIUM, ModelRouter
 
 
 @pytest.mark.asyncio
@@ -214,3 +222,171 @@ async def test_handler_with_family_movie_query():
     assert result is not None
     assert result.run_id == "family-movie-run-id"
     assert result.content == "Family movie recommendations generated."
+
+
+@pytest.mark.asyncio
+async def test_handler_skips_lock_once_initialized():
+    """Test that initialized handlers never touch the init lock."""
+    messages = [{"role": "user", "content": "Test"}]
+    mock_lock = MagicMock()
+
+    with (
+        patch("movie_recommender_agent.main._initialized", True),
+        patch("movie_recommender_agent.main._init_lock", mock_lock),
+        patch("movie_recommender_agent.main.run_agent", new_callable=AsyncMock, return_value="ok"),
+    ):
+        assert await handler(messages) == "ok"
+
+    mock_lock.__aenter__.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_signals_readiness(tmp_path, monkeypatch):
+    """Test that eager initialization marks the agent ready and touches the ready file."""
+    ready_file = tmp_path / "agent.ready"
+    monkeypatch.setenv("AGENT_READY_FILE", str(ready_file))
+
+    with (
+        patch("movie_recommender_agent.main._initialized", False),
+        patch("movie_recommender_agent.main.initialize_agent", new_callable=AsyncMock) as mock_init,
+    ):
+        assert not is_ready()
+        await ensure_initialized()
+        await ensure_initialized()
+        assert is_ready()
+
+    mock_init.assert_called_once()
+    assert ready_file.exists()
+
+
+def test_structured_result_is_rendered_locally(monkeypatch):
+    """In structured and json output modes the RecommendationSet is rendered without the LLM."""
+    recommendations = RecommendationSet(
+        request="Heist Movies",
+        preferences="clever plans",
+        recommendations=[MovieRecommendation(title="Heat", year=1995, reason="The definitive heist drama.")],
+    )
+    result = MagicMock(content=recommendations)
+
+    monkeypatch.setenv("AGENT_OUTPUT_MODE", "structured")
+    assert present(result).startswith("# 🎬 Movie Recommendations for Heist Movies")
+
+    monkeypatch.setenv("AGENT_OUTPUT_MODE", "json")
+    assert json.loads(present(result))["recommendations"][0]["title"] == "Heat"
+
+    # Free-form markdown runs pass through untouched
+    markdown_result = MagicMock(content="# Report")
+    assert present(markdown_result) is markdown_result
+
+
+@pytest.mark.asyncio
+async def test_failed_fast_run_is_escalated():
+    """A simple request whose fast-model run errors is retried on the premium model."""
+    fast_agent = MagicMock()
+    fast_agent.arun = AsyncMock(return_value=MagicMock(status="ERROR", content="rate limited"))
+    premium_agent = MagicMock()
+    premium_agent.arun = AsyncMock(return_value=MagicMock(status="COMPLETED", content="# Report"))
+    router = ModelRouter()
+
+    with (
+        patch("movie_recommender_agent.main.agent", premium_agent),
+        patch("movie_recommender_agent.main.agent_pool", AgentPool(lambda: premium_agent, size=1)),
+        patch("movie_recommender_agent.main._fast_pool", AgentPool(lambda: fast_agent, size=1)),
+        patch("movie_recommender_agent.main._router", router),
+    ):
+        result = await run_agent([{"role": "user", "content": "top comedies 2024"}])
+
+    assert result.content == "# Report"
+    fast_agent.arun.assert_awaited_once()
+    assert router.stats[FAST].errors == 1
+    assert router.stats[PREMIUM].requests == 1
+    assert router.stats[PREMIUM].escalations == 1
+
+
+# Modules that must only load once the agent is built or served (seconds of import time)
+DEFERRED_IMPORTS = ("agno.agent", "agno.models.openrouter", "bindu", "exa_py", "mem0", "openai", "uvicorn")
+
+
+def _import_times(module):
+    """Cumulative import time in seconds per module, from a fresh `python -X importtime`."""
+    process = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+def test_import_stays_within_startup_budget():
+    """Importing the agent module defers the heavy stacks and fits the startup budget."""
+    times = _import_times("movie_recommender_agent.main")
+
+    loaded = [name for name in DEFERRED_IMPORTS if name in times]
+    assert loaded == [], f"imported at startup: {loaded}"
+    budget = float(os.getenv("IMPORT_TIME_BUDGET", "2.5"))
+    assert times["movie_recommender_agent.main"] < budget
+
+    # The package itself only loads its entry points on first use
+    assert "movie_recommender_agent.main" not in _import_times("movie_recommender_agent")
+
+
+@pytest.mark.parametrize("per_user_tools", ["collaborative", "memory"])
+async def test_per_user_tools_keep_responses_apart(per_user_tools, tmp_path, monkeypatch):
+    """With memory or collaborative filtering loaded, two users sending the same message each get their own run."""
+    from movie_recommender_agent import main
+
+    monkeypatch.setenv("MEMORY_BACKEND", "local")
+    monkeypatch.setenv("MEMORY_DB_PATH", str(tmp_path / "memory.sqlite"))
+    monkeypatch.delenv("MOVIE_CATALOG_PATH", raising=False)
+    monkeypatch.delenv("EXA_CACHE_PATH", raising=False)
+
+    async def run(messages):
+        await asyncio.sleep(0.01)
+        return MagicMock(status="COMPLETED", content=f"# Picks for {messages[-1]['user_id']}")
+
+    with (
+        patch("movie_recommender_agent.main._initialized", True),
+        patch("movie_recommender_agent.main._per_user_tools", per_user_tools == "collaborative"),
+        patch("movie_recommender_agent.main._memory_store", None),
+        patch("movie_recommender_agent.main._exa_cache", None),
+        patch("movie_recommender_agent.main._exa_tools", None),
+        patch("movie_recommender_agent.main._snapshots", None),
+        patch("movie_recommender_agent.main._response_cache", None),
+        patch("movie_recommender_agent.main.run_agent", new_callable=AsyncMock, side_effect=run) as mock_run,
+    ):
+        if per_user_tools == "memory":
+            main._setup_tools(None, "test-exa-key")
+            main._memory_store.close()
+        main._response_cache = main._create_response_cache()
+        query = "Recommend something from my ratings"
+        alice, bob = await asyncio.gather(
+            handler([{"role": "user", "content": query, "user_id": "alice"}]),
+            handler([{"role": "user", "content": query, "user_id": "bob"}]),
+        )
+        later = await handler([{"role": "user", "content": query, "user_id": "bob"}])
+
+    assert (alice.content, bob.content) == ("# Picks for alice", "# Picks for bob")
+    assert later == "# Picks for bob"
+    assert mock_run.await_count == 2
+
+
+def test_catalog_tools_survive_a_failed_constraint_index(catalog, tmp_path, monkeypatch):
+    """Test that a failure building the constraint bitmaps only drops that toolkit."""
+    from movie_recommender_agent import main
+
+    catalog.save(tmp_path / "catalog.npz")
+    monkeypatch.setenv("MOVIE_CATALOG_PATH", str(tmp_path / "catalog.npz"))
+    monkeypatch.delenv("MOVIE_CF_MODEL_PATH", raising=False)
+    monkeypatch.delenv("MOVIE_SEMANTIC_INDEX_PATH", raising=False)
+
+    with (
+        patch("movie_recommender_agent.main.catalog", None),
+        patch("movie_recommender_agent.constraints.ConstraintTools", side_effect=MemoryError("bitmaps")),
+    ):
+        tools = main._setup_catalog_tools()
+
+    assert [tool.name for tool in tools] == ["movie_catalog", "movie_similarity"]
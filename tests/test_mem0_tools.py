@@ -0,0 +1,76 @@
+import json
+
+import agno.tools.mem0
+from agno.run import RunContext
+
+from movie_recommender_agent.mem0_tools import QueuedMem0Tools
+
+
+class FakeMemoryClient:
+    """Records the calls the Mem0 tools make instead of reaching the Mem0 platform."""
+
+    def __init__(self, **kwargs):
+        self.added = []
+        self.deleted = []
+
+    def add(self, messages, user_id, infer):
+        self.added.append((user_id, [m["content"] for m in messages]))
+
+    def delete_all(self, user_id):
+        self.deleted.append(user_id)
+
+
+def test_mem0_writes_are_queued_and_batched_per_user(monkeypatch):
+    """add_memory returns before Mem0 is called; queued facts go out in one call per user."""
+    monkeypatch.setattr(agno.tools.mem0, "MemoryClient", FakeMemoryClient)
+    tools = QueuedMem0Tools(api_key="test", flush_interval=60)
+    alice = RunContext(run_id="run", session_id="session", user_id="alice")
+    bob = RunContext(run_id="run", session_id="session", user_id="bob")
+
+    assert json.loads(tools.add_memory(alice, "Loves heist movies"))["status"] == "queued"
+    tools.add_memory(alice, "loves  heist movies")
+    tools.add_memory(bob, "Dislikes horror")
+    tools.add_memory(alice, "Prefers subtitles")
+    assert tools.client.added == []
+
+    tools.flush()
+    assert tools.client.added == [("alice", ["Loves heist movies", "Prefers subtitles"]), ("bob", ["Dislikes horror"])]
+    assert json.loads(tools.add_memory(alice, "Loves heist movies"))["status"] == "already saved"
+
+    tools.add_memory(bob, "Likes westerns")
+    tools.delete_all_memories(bob)
+    tools.close()
+    assert tools.client.deleted == ["bob"]
+    assert len(tools.client.added) == 2
+
+
+def test_failed_or_dropped_mem0_writes_are_not_marked_saved(monkeypatch):
+    """A user whose write fails does not block the others, and facts never written can be queued again."""
+
+    class FlakyMemoryClient(FakeMemoryClient):
+        def add(self, messages, user_id, infer):
+            if user_id == "bob":
+                error_msg = "Mem0 unavailable"
+                raise RuntimeError(error_msg)
+            super().add(messages, user_id, infer)
+
+    monkeypatch.setattr(agno.tools.mem0, "MemoryClient", FlakyMemoryClient)
+    tools = QueuedMem0Tools(api_key="test", flush_interval=60, max_queue=2)
+    alice = RunContext(run_id="run", session_id="session", user_id="alice")
+    bob = RunContext(run_id="run", session_id="session", user_id="bob")
+
+    tools.add_memory(bob, "Dislikes horror")
+    tools.add_memory(alice, "Loves heist movies")
+    tools.flush()
+    assert tools.client.added == [("alice", ["Loves heist movies"])]
+    assert tools.writes.stats.failed == 1
+    assert json.loads(tools.add_memory(bob, "Dislikes horror"))["status"] == "queued"
+
+    # A full queue drops its oldest fact (bob's), which is then not remembered as saved
+    tools.add_memory(alice, "Prefers subtitles")
+    tools.add_memory(alice, "Hates musicals")
+    tools.close()
+    assert tools.writes.stats.dropped == 1
+    assert tools.client.added[-1] == ("alice", ["Prefers subtitles", "Hates musicals"])
+    assert json.loads(tools.add_memory(alice, "Hates musicals"))["status"] == "already saved"
+    assert json.loads(tools.add_memory(bob, "Dislikes horror"))["status"] == "queued"
@@ -0,0 +1,117 @@
+import json
+
+from agno.run import RunContext
+
+from movie_recommender_agent.memory import LocalMemoryStore, LocalMemoryTools, WriteBehindQueue
+
+
+def test_search_ranks_related_memories_first(tmp_path):
+    """Searches are answered from the in-process profile, most similar memory first."""
+    store = LocalMemoryStore(str(tmp_path / "memory.sqlite"))
+    store.add("alice", "Loves Korean thrillers like Oldboy")
+    store.add("alice", "Dislikes horror movies")
+    store.add("bob", "Watches Korean thrillers every weekend")
+
+    results = store.search("alice", "korean thrillers")
+
+    assert results[0]["memory"] == "Loves Korean thrillers like Oldboy"
+    assert all(r["memory"] != "Watches Korean thrillers every weekend" for r in results)
+    assert store.stats.profile_hits >= 1
+    store.close()
+
+
+def test_memories_persist_across_instances(tmp_path):
+    """Queued writes are flushed on close and reloaded by a new store."""
+    db_path = str(tmp_path / "memory.sqlite")
+    store = LocalMemoryStore(db_path, flush_interval=60)
+    store.add("alice", "Prefers movies under two hours")
+    store.add("alice", "Enjoys heist movies")
+    store.close()
+
+    reopened = LocalMemoryStore(db_path)
+    memories = [m["memory"] for m in reopened.get_all("alice")]
+
+    assert sorted(memories) == ["Enjoys heist movies", "Prefers movies under two hours"]
+    assert reopened.preference_vector("alice") is not None
+    assert reopened.stats.profile_loads == 1
+    reopened.close()
+
+
+def test_delete_all_forgets_a_user(tmp_path):
+    """Deleting a user's memories clears the hot profile and the database rows."""
+    db_path = str(tmp_path / "memory.sqlite")
+    store = LocalMemoryStore(db_path)
+    store.add("alice", "Loves anime")
+    store.add("bob", "Loves westerns")
+    store.delete_all("alice")
+    store.close()
+
+    reopened = LocalMemoryStore(db_path)
+    assert reopened.get_all("alice") == []
+    assert reopened.preference_vector("alice") is None
+    assert [m["memory"] for m in reopened.get_all("bob")] == ["Loves westerns"]
+    reopened.close()
+
+
+def test_profile_reload_merges_pending_writes_without_flushing(tmp_path):
+    """A profile evicted before its writes land is rebuilt from the table plus that user's queued writes."""
+    store = LocalMemoryStore(str(tmp_path / "memory.sqlite"), max_profiles=1, flush_interval=60, clock=lambda: 100.0)
+    store.add("alice", "Loves anime")
+    store.flush()
+    store.add("alice", "Enjoys heist movies")
+    store.add("bob", "Loves westerns")  # evicts alice
+    store.delete_all("bob")
+    store.add("bob", "Loves musicals")
+
+    assert sorted(m["memory"] for m in store.get_all("alice")) == ["Enjoys heist movies", "Loves anime"]
+    assert [m["memory"] for m in store.get_all("bob")] == ["Loves musicals"]
+    assert store.writes.stats.flushes == 1
+    assert len(store.writes) == 4
+
+    # A write still reported in flight after it committed is not counted twice
+    store.flush()
+    store.writes._in_flight = [("add", "alice", "Enjoys heist movies", 100.0)]
+    store.add("carol", "Loves noir")  # evicts alice
+    assert len(store.get_all("alice")) == 2
+    store.close()
+
+
+def test_write_behind_queue_batches_writes():
+    """A burst of writes reaches the writer in batches of at most batch_size."""
+    batches = []
+    queue = WriteBehindQueue(batches.append, batch_size=4, flush_interval=60)
+    for i in range(10):
+        queue.put(i)
+    queue.close()
+
+    assert [item for batch in batches for item in batch] == list(range(10))
+    assert all(len(batch) <= 4 for batch in batches)
+    assert queue.stats.written == 10
+
+
+def test_write_behind_queue_dedups_and_drops_oldest():
+    """Repeated items are queued once; a full queue makes room by dropping its oldest item."""
+    batches = []
+    queue = WriteBehindQueue(batches.append, flush_interval=60, max_size=3, key=str.lower)
+    for item in ("a", "A", "b", "c", "d"):
+        queue.put(item)
+    queue.close()
+
+    assert batches == [["b", "c", "d"]]
+    assert (queue.stats.deduplicated, queue.stats.dropped, queue.stats.max_depth) == (1, 1, 3)
+    assert queue.stats.flushes == 1
+
+
+def test_tools_need_a_user_id(tmp_path):
+    """Without a run user id or a default user, the tools answer with Mem0's error message."""
+    store = LocalMemoryStore(str(tmp_path / "memory.sqlite"))
+    anonymous = RunContext(run_id="run", session_id="session")
+
+    assert LocalMemoryTools(store).add_memory(anonymous, "Loves anime").startswith("Error in add_memory")
+
+    tools = LocalMemoryTools(store, user_id="default")
+    tools.add_memory(anonymous, "Loves anime")
+    assert json.loads(tools.get_all_memories(anonymous))[0]["memory"] == "Loves anime"
+    alice = RunContext(run_id="run", session_id="session", user_id="alice")
+    assert json.loads(tools.search_memory(alice, "anime")) == []
+    store.close()
@@ -0,0 +1,72 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from movie_recommender_agent.main import run_agent
+from movie_recommender_agent.pool import AgentPool, PoolExhaustedError
+
+
+class FakeAgent:
+    def __init__(self) -> None:
+        self.active = 0
+        self.runs = 0
+
+    async def arun(self, messages, user_id=None):
+        self.active += 1
+        assert self.active == 1, "agent instance shared between concurrent runs"
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        self.runs += 1
+        return messages[-1]["content"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_use_separate_agents():
+    """Test that concurrent requests each run on their own pooled agent."""
+    pool = AgentPool(FakeAgent, size=4, max_waiters=100)
+    with (
+        patch("movie_recommender_agent.main.agent", pool.agents[0]),
+        patch("movie_recommender_agent.main.agent_pool", pool),
+    ):
+        results = await asyncio.gather(*(run_agent([{"role": "user", "content": str(i)}]) for i in range(20)))
+
+    assert results == [str(i) for i in range(20)]
+    assert sum(agent.runs for agent in pool.agents) == 20
+    assert pool.stats.peak_in_use == 4
+    assert pool.stats.in_use == 0
+    assert pool.stats.checkouts == 20
+
+
+@pytest.mark.asyncio
+async def test_full_wait_queue_rejects_immediately():
+    """Test the fast 429-style rejection once the bounded wait queue is full."""
+    pool = AgentPool(FakeAgent, size=1, max_waiters=1, acquire_timeout=5)
+    held = await pool.acquire()
+    waiter = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0)
+
+    with pytest.raises(PoolExhaustedError) as excinfo:
+        await pool.acquire()
+    assert excinfo.value.status_code == 429
+    assert pool.stats.rejected == 1
+
+    pool.release(held)
+    assert await waiter is held
+    assert pool.stats.utilization == 1.0
+
+
+@pytest.mark.asyncio
+async def test_checkout_times_out_and_returns_agents():
+    """Test the acquire timeout and that agents are returned after errors."""
+    pool = AgentPool(FakeAgent, size=1, acquire_timeout=0.01)
+
+    with pytest.raises(ValueError, match="boom"):
+        async with pool.checkout():
+            raise ValueError("boom")
+    assert pool.stats.in_use == 0
+
+    async with pool.checkout():
+        with pytest.raises(PoolExhaustedError, match="within"):
+            await pool.acquire()
+    assert pool.stats.timeouts == 1
@@ -0,0 +1,77 @@
+import re
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from movie_recommender_agent.prompt import PromptStats, SystemPrompt
+
+
+def test_only_the_date_changes_between_days():
+    """Everything up to the trailing date block is byte-identical from one request to the next."""
+    day = [date(2026, 3, 1)]
+    prompt = SystemPrompt(today=lambda: day[0])
+
+    first = prompt()
+    day[0] = date(2026, 3, 2)
+    second = prompt()
+
+    assert first != second
+    assert first.startswith(prompt.prefix)
+    assert second.startswith(prompt.prefix)
+    assert second.endswith("<context>\nToday is Monday, March 2, 2026.\n</context>")
+    assert "2026" not in prompt.prefix
+
+
+def test_tool_instructions_join_the_static_prefix():
+    """Toolkit instructions are part of the cached prefix, in registration order."""
+    tools = [
+        SimpleNamespace(add_instructions=True, instructions="Use the catalog first."),
+        SimpleNamespace(add_instructions=False, instructions="Not shown."),
+        SimpleNamespace(add_instructions=True, instructions="Use similarity for 'like X'."),
+    ]
+    prefix = SystemPrompt(tools).prefix
+
+    assert prefix.index("Use the catalog first.") < prefix.index("Use similarity for 'like X'.")
+    assert "Not shown." not in prefix
+    assert prefix.index("</instructions>") < prefix.index("Use the catalog first.") < prefix.index("<expected_output>")
+
+
+def test_compact_profile_is_shorter():
+    """The compact profile keeps the report template but costs far fewer prompt tokens."""
+    full = SystemPrompt(profile="full").prefix
+    compact = SystemPrompt(profile="compact").prefix
+
+    assert len(compact) < len(full) / 2
+    assert "<expected_output>" in compact
+    with pytest.raises(ValueError, match="Unknown prompt profile"):
+        SystemPrompt(profile="tiny")
+
+
+@pytest.mark.parametrize("profile", ["full", "compact"])
+def test_prompt_has_no_unfilled_placeholders(profile):
+    """The date lives in the context block, so no template placeholder is left for the model to echo."""
+    prefix = SystemPrompt(profile=profile).prefix
+
+    assert re.search(r"\{[a-z_]+\}", prefix) is None
+    assert "*Last updated: [today]*" in prefix
+
+
+def test_structured_prompt_has_no_markdown_template():
+    """In structured mode the output template is replaced by the schema note."""
+    prefix = SystemPrompt(structured=True).prefix
+
+    assert "<expected_output>" not in prefix
+    assert "RecommendationSet" in prefix
+
+
+def test_prompt_stats_cache_hit_ratio():
+    """Cached prompt tokens and time to first token are aggregated over runs."""
+    stats = PromptStats()
+    stats.record(SimpleNamespace(input_tokens=2000, cache_read_tokens=0, time_to_first_token=1.5))
+    stats.record(SimpleNamespace(input_tokens=2000, cache_read_tokens=1536, time_to_first_token=0.5))
+    stats.record(SimpleNamespace(input_tokens=0, cache_read_tokens=None, time_to_first_token=None))
+
+    assert stats.runs == 3
+    assert stats.cache_hit_ratio == pytest.approx(0.384)
+    assert stats.mean_first_token_seconds == pytest.approx(1.0)
@@ -0,0 +1,75 @@
+import json
+from datetime import date
+
+from movie_recommender_agent.rendering import (
+    BonusPick,
+    MovieRecommendation,
+    RecommendationSet,
+    format_runtime,
+    render_json,
+    render_markdown,
+)
+
+
+def _recommendations() -> RecommendationSet:
+    return RecommendationSet(
+        request="Thrillers Similar to Inception",
+        preferences="mind-bending sci-fi",
+        recommendations=[
+            MovieRecommendation(
+                title="Shutter Island",
+                year=2010,
+                rating="8.2/10 IMDb",
+                genres=["Mystery", "Thriller"],
+                runtime=138,
+                reason="Same lead, same doubt about what is real.",
+                director="Martin Scorsese",
+                cast=["Leonardo DiCaprio", "Mark Ruffalo"],
+            ),
+            MovieRecommendation(
+                title="Coherence", rating="88% RT", genres=["Drama"], reason="Overlapping | realities."
+            ),
+        ],
+        bonus=[BonusPick(title="Primer", reason="Intricate time travel.")],
+    )
+
+
+def test_render_markdown_follows_report_layout():
+    """The local renderer produces the table, detailed sections and footer of the report template."""
+    markdown = render_markdown(_recommendations(), today=date(2026, 1, 2))
+
+    assert markdown.startswith("# 🎬 Movie Recommendations for Thrillers Similar to Inception\n")
+    assert (
+        "| **Shutter Island** | 2010 | ⭐ 8.2/10 IMDb | 🔍 Mystery, 🎬 Thriller | 2h 18m "
+        "| Same lead, same doubt about what is real. |"
+    ) in markdown
+    assert "| **Coherence** | — | 🍅 88% RT | 🎭 Drama | — | Overlapping \\| realities. |" in markdown
+    assert "### 1. **Shutter Island** (2010)\n" in markdown
+    assert "**🌟 Starring**: Leonardo DiCaprio, Mark Ruffalo" in markdown
+    assert "- **Primer** - Intricate time travel." in markdown
+    assert "*Last updated: 2026-01-02*" in markdown
+
+
+def test_render_markdown_skips_empty_sections():
+    """Sections and detail lines without data are left out rather than rendered empty."""
+    markdown = render_markdown(_recommendations())
+
+    assert "Upcoming Releases" not in markdown
+    assert "Tips for Your Movie Night" not in markdown
+    assert markdown.count("**🎞️ Director**") == 1
+
+
+def test_render_json_round_trips():
+    """The JSON output mode serializes the schema without null fields."""
+    payload = render_json(_recommendations())
+
+    assert "null" not in payload
+    assert RecommendationSet.model_validate(json.loads(payload)) == _recommendations()
+
+
+def test_format_runtime():
+    """Runtimes are shown in hours and minutes."""
+    assert format_runtime(135) == "2h 15m"
+    assert format_runtime(62) == "1h 02m"
+    assert format_runtime(45) == "45m"
+    assert format_runtime(None) == "—"
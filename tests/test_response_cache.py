@@ -0,0 +1,86 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from movie_recommender_agent.main import handler
+from movie_recommender_agent.response_cache import SemanticResponseCache, request_key, request_user, response_text
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _ask(content: str, **fields: str) -> list[dict[str, str]]:
+    return [{"role": "user", "content": content, **fields}]
+
+
+def test_near_duplicate_request_hits():
+    """Test that rephrasings differing only in filler words reuse the response."""
+    cache = SemanticResponseCache()
+    cache.set(_ask("Suggest thriller movies similar to Inception"), "# Thrillers")
+
+    assert cache.get(_ask("Can you recommend some thriller films similar to Inception?")) == "# Thrillers"
+    assert cache.get(_ask("Suggest thriller movies similar to Interstellar")) is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_entries_expire_and_evict_lru():
+    """Test TTL expiry and least-recently-used eviction at the size cap."""
+    clock = FakeClock()
+    cache = SemanticResponseCache(max_entries=2, ttl_seconds=60, clock=clock)
+    cache.set(_ask("korean revenge thrillers"), "korean")
+    cache.set(_ask("french new wave classics"), "french")
+    cache.get(_ask("korean revenge thrillers"))
+    cache.set(_ask("japanese anime for kids"), "anime")
+
+    assert cache.get(_ask("french new wave classics")) is None
+    assert cache.stats.evictions == 1
+    assert len(cache) == 2
+
+    clock.now += 61
+    assert cache.get(_ask("korean revenge thrillers")) is None
+
+
+def test_scope_separates_conversations_and_users():
+    """Test that follow-ups and per-user entries never leak across scopes."""
+    first = [{"role": "user", "content": "Movies like Alien"}, {"role": "assistant", "content": "..."}]
+    second = [{"role": "user", "content": "Movies like Amelie"}, {"role": "assistant", "content": "..."}]
+    follow_up = {"role": "user", "content": "More like that"}
+    assert request_key([*first, follow_up])[0] != request_key([*second, follow_up])[0]
+
+    cache = SemanticResponseCache(per_user=True)
+    cache.set(_ask("cozy mysteries", user_id="alice"), "for alice")
+    assert cache.get(_ask("cozy mysteries", user_id="alice")) == "for alice"
+    assert cache.get(_ask("cozy mysteries", user_id="bob")) is None
+    assert request_key(_ask("cozy mysteries"), per_user=True) is None
+    # The same identifier is passed to the agent run, so per-user tools know who is asking
+    assert request_user(_ask("cozy mysteries", user_id="alice")) == "alice"
+    assert request_user(_ask("cozy mysteries")) is None
+
+
+def test_only_completed_runs_are_cacheable():
+    """Test that failed runs and non-text results are never stored."""
+    assert response_text(SimpleNamespace(status="COMPLETED", content="# Picks")) == "# Picks"
+    assert response_text(SimpleNamespace(status="ERROR", content="rate limited")) is None
+    assert response_text(SimpleNamespace(status="COMPLETED", content=None)) is None
+
+
+@pytest.mark.asyncio
+async def test_handler_serves_repeat_requests_from_cache():
+    """Test that the handler skips the agent run on a cache hit."""
+    result = SimpleNamespace(status="COMPLETED", content="# Family picks")
+    with (
+        patch("movie_recommender_agent.main._initialized", True),
+        patch("movie_recommender_agent.main._response_cache", SemanticResponseCache()),
+        patch("movie_recommender_agent.main.run_agent", new_callable=AsyncMock, return_value=result) as mock_run,
+    ):
+        assert await handler(_ask("Family adventure movies for kids")) is result
+        assert await handler(_ask("family adventure films for kids please")) == "# Family picks"
+
+    mock_run.assert_called_once()
@@ -0,0 +1,81 @@
+from types import SimpleNamespace
+
+import pytest
+
+from movie_recommender_agent.routing import FAST, PREMIUM, ModelRouter, RoutingConfig, complexity
+
+
+def _ask(text: str) -> list[dict[str, str]]:
+    return [{"role": "user", "content": text}]
+
+
+def test_simple_lookups_use_the_fast_model():
+    """Single-constraint lookups are routed to the fast model."""
+    router = ModelRouter()
+
+    for query in ("top comedies 2024", "Suggest thriller movies similar to Inception", "Hello"):
+        assert router.route(_ask(query)).route == FAST
+
+
+def test_complex_requests_use_the_premium_model():
+    """Multi-constraint, exclusion-heavy and reasoning requests go to the premium model."""
+    router = ModelRouter()
+    group_watch = (
+        "We are 4 friends, one hates horror, we want something under 2 hours from the 2010s, "
+        "not in English, with good ratings"
+    )
+
+    decision = router.route(_ask(group_watch))
+    assert decision.route == PREMIUM
+    assert {"audience", "exclusion", "runtime", "language"} <= set(decision.signals)
+    assert router.route(_ask("Compare Tenet and Inception and explain why one works better")).route == PREMIUM
+
+
+def test_low_confidence_requests_are_escalated():
+    """Scores just under the threshold are too close to call and go to the premium model."""
+    router = ModelRouter(threshold=0.55, min_confidence=0.15)
+    score, _ = complexity(_ask("korean thrillers with high ratings"))
+    assert score < 0.55
+
+    decision = router.route(_ask("korean thrillers with high ratings"))
+    assert decision.route == PREMIUM
+    assert decision.escalated
+    assert router.stats[PREMIUM].escalations == 1
+
+
+def test_follow_ups_add_complexity():
+    """Later turns of a conversation score higher than the same words as a first message."""
+    first, _ = complexity(_ask("more like that"))
+    follow_up, signals = complexity([
+        *_ask("heist movies"),
+        {"role": "assistant", "content": "..."},
+        *_ask("more like that"),
+    ])
+
+    assert follow_up > first
+    assert "follow-up" in signals
+
+
+def test_record_tracks_latency_and_tokens():
+    """Per-route stats keep latency percentiles and token totals."""
+    router = ModelRouter()
+    for seconds in (1.0, 2.0, 3.0, 10.0):
+        router.record(FAST, seconds, SimpleNamespace(input_tokens=100, output_tokens=50, cost=0.001))
+    router.record(FAST, 0.5, failed=True)
+
+    stats = router.stats[FAST]
+    assert stats.requests == 5
+    assert stats.errors == 1
+    assert stats.p50 == 2.0
+    assert stats.p95 == 10.0
+    assert stats.output_tokens == 200
+    assert stats.cost == pytest.approx(0.004)
+
+
+def test_routing_config_ignores_unknown_keys():
+    """The agent_config.json section may carry keys this version does not know."""
+    config = RoutingConfig.from_dict({"enabled": True, "fast_model": "x/fast", "comment": "ignored"})
+
+    assert config.enabled
+    assert config.fast_model == "x/fast"
+    assert ModelRouter.from_config(config).threshold == config.complexity_threshold
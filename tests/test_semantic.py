@@ -0,0 +1,96 @@
+import json
+
+import numpy as np
+import pytest
+
+from movie_recommender_agent.catalog import MovieCatalog
+from movie_recommender_agent.semantic import HashingEmbedder, IVFIndex, SemanticSearchTools, build_catalog_index
+
+
+def _clustered_vectors(count: int, dim: int = 32, clusters: int = 20) -> np.ndarray:
+    rng = np.random.default_rng(1)
+    centers = rng.normal(size=(clusters, dim))
+    vectors = centers[rng.integers(0, clusters, count)] + 0.3 * rng.normal(size=(count, dim))
+    return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+
+def test_embedding_is_deterministic_unit_vector():
+    """Test that the same text always embeds to the same unit vector."""
+    embedder = HashingEmbedder(dim=64)
+    first = embedder.embed("A slow-burn melancholic sci-fi drama")
+    second = HashingEmbedder(dim=64).embed("a slow burn melancholic sci fi drama")
+
+    np.testing.assert_array_equal(first, second)
+    assert first.dtype == np.float32
+    assert np.isclose(np.linalg.norm(first), 1.0)
+    assert not HashingEmbedder(dim=64).embed("").any()
+
+
+def test_saved_index_is_memory_mapped(tmp_path):
+    """Test that a saved index reloads as memory-mapped arrays with identical results."""
+    vectors = _clustered_vectors(2_000)
+    index = IVFIndex.build(vectors, n_lists=16)
+    index.save(tmp_path)
+
+    loaded = IVFIndex.load(tmp_path)
+    assert isinstance(loaded.vectors, np.memmap)
+    assert len(loaded) == 2_000
+    assert json.loads((tmp_path / "meta.json").read_text())["n_lists"] == 16
+
+    ids, scores = index.search(vectors[7], k=5)
+    loaded_ids, loaded_scores = loaded.search(vectors[7], k=5)
+    np.testing.assert_array_equal(ids, loaded_ids)
+    np.testing.assert_allclose(scores, loaded_scores)
+    assert ids[0] == 7
+
+
+def test_search_recall_improves_with_nprobe():
+    """Test that probing every list is exact and a few lists already give high recall."""
+    vectors = _clustered_vectors(5_000)
+    index = IVFIndex.build(vectors, n_lists=32)
+    queries = vectors[::250]
+
+    def recall(nprobe: int) -> float:
+        hits = 0
+        for query in queries:
+            expected = set(index.search_exact(query, 10)[0].tolist())
+            hits += len(expected & set(index.search(query, 10, nprobe=nprobe)[0].tolist()))
+        return hits / (10 * len(queries))
+
+    assert recall(32) == 1.0
+    assert recall(4) >= 0.8
+
+
+def test_semantic_tool_returns_catalog_records(catalog):
+    """Test that the agent tool maps index hits back to catalog records."""
+    embedder = HashingEmbedder(dim=128)
+    index = build_catalog_index(catalog, embedder, n_lists=2)
+    tools = SemanticSearchTools(catalog, index, embedder=embedder)
+
+    results = json.loads(tools.semantic_movie_search("dream heist inside the subconscious", limit=2))
+    assert results[0]["title"] == "Inception"
+    assert len(results) == 2
+    assert results[0]["relevance"] >= results[1]["relevance"]
+
+
+def test_semantic_tool_refuses_an_index_of_another_catalog(catalog):
+    """Test that an index whose size differs from the catalog is rejected instead of mislabelling hits."""
+    index = IVFIndex.build(_clustered_vectors(len(catalog) + 1), n_lists=2)
+
+    with pytest.raises(ValueError, match="catalog has"):
+        SemanticSearchTools(catalog, index)
+
+
+def test_saved_index_only_loads_for_its_catalog(catalog, tmp_path):
+    """Test that a reordered catalog of the same size is refused, and that k <= 0 finds nothing."""
+    build_catalog_index(catalog, HashingEmbedder(dim=64), n_lists=2).save(tmp_path / "index")
+    reordered = MovieCatalog.from_records(catalog.record(row) for row in reversed(range(len(catalog))))
+
+    index = IVFIndex.load(tmp_path / "index", catalog=catalog)
+    with pytest.raises(ValueError, match="not built from this catalog"):
+        IVFIndex.load(tmp_path / "index", catalog=reordered)
+
+    query = HashingEmbedder(dim=64).embed("heist")
+    for k in (0, -1):
+        assert len(index.search(query, k=k)[0]) == 0
+        assert len(index.search_exact(query, k=k)[0]) == 0
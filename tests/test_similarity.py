@@ -0,0 +1,79 @@
+import json
+import random
+
+import numpy as np
+
+from movie_recommender_agent.catalog import MovieCatalog
+from movie_recommender_agent.similarity import SimilarityEngine, SimilarityTools
+
+
+def _row(catalog: MovieCatalog, title: str, year: int | None = None) -> int:
+    rows = catalog.exact_title_matches(title)
+    if year is not None:
+        rows = rows[catalog.year[rows] == year]
+    return int(rows[0])
+
+
+def _random_catalog(count: int) -> MovieCatalog:
+    rng = random.Random(5)
+    genres = ["Action", "Comedy", "Drama", "Horror", "Romance", "Sci-Fi", "Thriller"]
+    people = [f"Person {i}" for i in range(count // 3)]
+    return MovieCatalog.from_records(
+        {
+            "title": f"Movie {i}",
+            "genres": rng.sample(genres, 2),
+            "keywords": [f"kw{rng.randrange(200)}" for _ in range(3)],
+            "directors": [rng.choice(people)],
+            "cast": rng.sample(people, 3),
+        }
+        for i in range(count)
+    )
+
+
+def test_similar_to_single_seed(catalog):
+    """Test that the closest movie to Inception is the other Nolan heist film."""
+    engine = SimilarityEngine.from_catalog(catalog)
+    rows, scores = engine.similar([_row(catalog, "Inception")], k=2)
+
+    assert catalog.text["title"][rows[0]] == "Tenet"
+    assert _row(catalog, "Inception") not in rows
+    assert scores[0] >= scores[1]
+    assert 0 < scores[0] <= 1
+
+
+def test_multi_seed_query_blends_titles(catalog):
+    """Test that several seeds are averaged and excluded from results."""
+    engine = SimilarityEngine.from_catalog(catalog)
+    seeds = [_row(catalog, "Parasite"), _row(catalog, "Oldboy", 2003)]
+    rows, _ = engine.similar(seeds, k=3)
+
+    assert not set(seeds) & set(rows.tolist())
+    assert catalog.text["title"][rows[0]] == "Oldboy"
+
+
+def test_pruned_search_matches_full_scan():
+    """Test that candidate pruning returns the same top-k as an exhaustive scan."""
+    catalog = _random_catalog(3_000)
+    engine = SimilarityEngine.from_catalog(catalog, rare_posting_limit=50)
+    groups = [[seed] for seed in range(0, 3_000, 150)] + [[1, 2], [10, 20, 30]]
+
+    _, scores = engine.similar_batch(groups, k=10)
+    for group, seeds in enumerate(groups):
+        features, weights = engine.query_vector(np.unique(seeds))
+        expected = engine._score_all(features, weights)
+        expected[seeds] = -np.inf
+        np.testing.assert_allclose(scores[group], np.sort(expected)[::-1][:10], rtol=1e-5, atol=1e-6)
+
+
+def test_similarity_tool_reports_unknown_titles(catalog):
+    """Test the agent tool payload for resolved and unknown seed titles."""
+    tools = SimilarityTools(catalog)
+    payload = json.loads(tools.find_similar_movies(["Inception", "Some Unknown Film"], limit=2))
+
+    assert payload["seeds"] == ["Inception"]
+    assert payload["not_found"] == ["Some Unknown Film"]
+    assert payload["similar"][0]["title"] == "Tenet"
+    assert "similarity" in payload["similar"][0]
+
+    for limit in (0, -1):
+        assert json.loads(tools.find_similar_movies(["Inception"], limit=limit))["similar"] == []
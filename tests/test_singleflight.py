@@ -0,0 +1,75 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from movie_recommender_agent.main import handler
+from movie_recommender_agent.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_agent_run():
+    """Test that 100 concurrent identical requests trigger a single agent run."""
+    calls = 0
+
+    async def fake_run_agent(messages):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return f"result {calls}"
+
+    group = SingleFlight()
+    messages = [{"role": "user", "content": "Movies like the trending one"}]
+    with (
+        patch("movie_recommender_agent.main._initialized", True),
+        patch("movie_recommender_agent.main._single_flight", group),
+        patch("movie_recommender_agent.main.run_agent", side_effect=fake_run_agent),
+    ):
+        results = await asyncio.gather(*(handler(messages) for _ in range(100)))
+
+    assert calls == 1
+    assert set(results) == {"result 1"}
+    assert group.stats.calls == 1
+    assert group.stats.coalesced == 99
+    assert len(group) == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_every_waiter():
+    """Test that a failing call raises in all coalesced callers and is not remembered."""
+    group = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        error_msg = "upstream down"
+        raise RuntimeError(error_msg)
+
+    results = await asyncio.gather(*(group.do("key", fail) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(group) == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_waiter_keeps_shared_call_running():
+    """Test per-caller cancellation safety and cancellation once every caller is gone."""
+    group = SingleFlight()
+    started = asyncio.Event()
+
+    async def slow():
+        started.set()
+        await asyncio.sleep(0.05)
+        return "done"
+
+    first = asyncio.create_task(group.do("key", slow))
+    second = asyncio.create_task(group.do("key", slow))
+    await started.wait()
+    first.cancel()
+    assert await second == "done"
+    assert first.cancelled()
+
+    lonely = asyncio.create_task(group.do("other", slow))
+    await asyncio.sleep(0.01)
+    lonely.cancel()
+    await asyncio.sleep(0.01)
+    assert group.stats.abandoned == 1
+    assert len(group) == 0
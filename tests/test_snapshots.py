@@ -0,0 +1,141 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from movie_recommender_agent.main import handler
+from movie_recommender_agent.snapshots import SnapshotConfig, SnapshotRefresher, SnapshotStore
+
+COMEDIES = "Top-rated comedy movies from last 2 years"
+FAMILY = "Recommend family-friendly adventure films with high ratings for a family outing."
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _user(content):
+    return [{"role": "user", "content": content}]
+
+
+def _config(**overrides):
+    values = {"enabled": True, "queries": [COMEDIES, {"query": FAMILY, "aliases": ["Movies for family night"]}]}
+    return SnapshotConfig.from_dict({**values, **overrides})
+
+
+def test_equivalent_requests_are_served_from_the_snapshot():
+    """The canonical query, an alias, or a phrasing with the same intent match; others do not."""
+    clock = FakeClock()
+    store = SnapshotStore(_config(max_age=100), clock=clock)
+    store.put(COMEDIES, "# Comedies")
+    store.put(FAMILY, "# Family adventures")
+
+    assert store.match(_user("top rated comedy movies from the last 2 years")).content == "# Comedies"
+    assert store.match(_user("Best comedies of the past couple of years")).content == "# Comedies"
+    assert store.match(_user("Movies for family night")).content == "# Family adventures"
+    assert store.match(_user("Comedy movies similar to Superbad")) is None
+    assert store.match(_user("Top-rated horror movies from last 2 years")) is None
+    # A different time span is a different question
+    assert store.match(_user("Top-rated comedy movies from the last 20 years")) is None
+    assert store.match(_user("best comedy movies released this year")) is None
+    assert store.match(_user("Top-rated comedy movies from the past few years")) is None
+    assert store.match(_user("Newest top-rated comedy movies")) is None
+    follow_up = [*_user(COMEDIES), {"role": "assistant", "content": "..."}, *_user(COMEDIES)]
+    assert store.match(follow_up) is None
+
+    clock.now += 101
+    assert store.match(_user(COMEDIES)) is None
+    assert (store.stats.hits, store.stats.misses) == (3, 7)
+
+
+def test_refreshes_are_versioned_and_shared_through_the_file(tmp_path):
+    """Each refresh bumps the version; another process loads the newer snapshots from the path."""
+    clock = FakeClock()
+    config = _config(refresh_interval=60, path=str(tmp_path / "snapshots.json"))
+    store = SnapshotStore(config, clock=clock)
+    assert store.due() == [COMEDIES, FAMILY]
+
+    store.put(COMEDIES, "# v1")
+    clock.now += 30
+    store.put(FAMILY, "# family")
+    assert store.due() == []
+    clock.now += 31
+    assert store.due() == [COMEDIES]
+    assert store.put(COMEDIES, "# v2").version == 2
+
+    other = SnapshotStore(config, clock=clock)
+    assert other.get(COMEDIES).content == "# v2"
+    assert other.get(COMEDIES).version == 2
+
+
+def test_refresher_only_runs_while_idle(tmp_path):
+    """Due snapshots are refreshed once the process is idle; failed runs keep the previous snapshot."""
+    now = [0.0]
+    store = SnapshotStore(_config(idle_seconds=5, path=str(tmp_path / "snapshots.json")))
+    run = AsyncMock(side_effect=["# Comedies", RuntimeError("rate limited")])
+    refresher = SnapshotRefresher(store, run, clock=lambda: now[0])
+
+    refresher.request_started()
+    now[0] = 10.0
+    assert not refresher.idle
+    refresher.request_finished()
+    assert asyncio.run(refresher.refresh_due()) == 0
+
+    now[0] = 16.0
+    assert asyncio.run(refresher.refresh_due()) == 1
+    assert store.get(COMEDIES).content == "# Comedies"
+    assert store.get(FAMILY) is None
+    assert store.stats.failures == 1
+
+    # Another process holding the refresh lock does the work
+    run.reset_mock(side_effect=True)
+    with store.refresh_lock() as owner:
+        assert owner
+        assert asyncio.run(refresher.refresh_due()) == 0
+    run.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_handler_answers_canonical_queries_without_an_agent_run():
+    """A matching request returns the snapshot; the refresher starts on the serving loop."""
+    store = SnapshotStore(_config(check_interval=3600))
+    store.put(COMEDIES, "# Comedies")
+    refresher = SnapshotRefresher(store, AsyncMock())
+
+    with (
+        patch("movie_recommender_agent.main._initialized", True),
+        patch("movie_recommender_agent.main._snapshots", refresher),
+        patch("movie_recommender_agent.main.run_agent", new_callable=AsyncMock, return_value="# Live") as run,
+    ):
+        assert await handler(_user("Best comedies of the last 2 years")) == "# Comedies"
+        assert await handler(_user("Korean thrillers")) == "# Live"
+
+    run.assert_awaited_once()
+    assert refresher.in_flight == 0
+    refresher.stop()
+
+
+@pytest.mark.asyncio
+async def test_streamed_request_stays_in_flight_until_consumed():
+    """A streamed response holds off background refreshes until the client has read it."""
+    refresher = SnapshotRefresher(SnapshotStore(_config(check_interval=3600)), AsyncMock())
+
+    async def stream():
+        yield "# Live"
+
+    with (
+        patch("movie_recommender_agent.main._snapshots", refresher),
+        patch("movie_recommender_agent.main._handle", new_callable=AsyncMock, return_value=stream()),
+    ):
+        response = await handler(_user("Korean thrillers"))
+        assert refresher.in_flight == 1
+        assert [chunk async for chunk in response] == ["# Live"]
+
+    assert refresher.in_flight == 0
+    refresher.stop()
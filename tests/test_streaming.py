@@ -0,0 +1,111 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from movie_recommender_agent.main import handler
+from movie_recommender_agent.pool import AgentPool
+from movie_recommender_agent.singleflight import SingleFlight
+from movie_recommender_agent.streaming import StreamedResponse, agent_deltas, line_chunks
+from movie_recommender_agent.telemetry import Telemetry
+
+REPORT = "# 🎬 Picks\n\n| Movie | Year |\n|---|---|\n| **Tenet** | 2020 |\n| **Memento** | 2000 |\n"
+
+
+class StreamingAgent:
+    runs = 0
+
+    def arun(self, messages, stream=False, user_id=None):
+        assert stream
+        StreamingAgent.runs += 1
+        return self._events()
+
+    async def _events(self):
+        for i in range(0, len(REPORT), 3):
+            await asyncio.sleep(0.001)
+            yield SimpleNamespace(event="RunContent", content=REPORT[i : i + 3])
+        yield SimpleNamespace(event="RunCompleted", content=REPORT)
+
+
+async def _collect(stream) -> list:
+    return [chunk async for chunk in stream]
+
+
+@pytest.fixture
+def streaming_agent(monkeypatch):
+    monkeypatch.setenv("AGENT_STREAMING", "true")
+    StreamingAgent.runs = 0
+    pool = AgentPool(StreamingAgent, size=2)
+    with (
+        patch("movie_recommender_agent.main._initialized", True),
+        patch("movie_recommender_agent.main.agent", pool.agents[0]),
+        patch("movie_recommender_agent.main.agent_pool", pool),
+        patch("movie_recommender_agent.main._single_flight", SingleFlight()),
+    ):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_line_chunks_flush_each_complete_row():
+    """Test that token deltas are regrouped so every table row is sent once complete."""
+
+    async def tokens():
+        for i in range(0, len(REPORT), 3):
+            yield REPORT[i : i + 3]
+
+    chunks = await _collect(line_chunks(tokens()))
+    assert "".join(chunks) == REPORT
+    assert "| **Tenet** | 2020 |\n" in chunks
+
+
+@pytest.mark.asyncio
+async def test_stream_serves_streaming_and_buffered_clients(streaming_agent):
+    """Test that streaming clients get deltas and buffered clients get the full text last."""
+    chunks = await _collect(await handler([{"role": "user", "content": "Nolan films"}]))
+
+    # message/stream forwards truthy chunks; message/send keeps the last chunk
+    assert "".join(str(chunk) for chunk in chunks if chunk) == REPORT
+    assert len([chunk for chunk in chunks if chunk]) > 1
+    assert isinstance(chunks[-1], StreamedResponse)
+    assert chunks[-1].content == REPORT
+
+
+@pytest.mark.asyncio
+async def test_handler_span_ends_with_the_stream(streaming_agent):
+    """Test that the handler span stays open until the stream ends and records the streamed bytes."""
+    telemetry = Telemetry()
+    telemetry.configure(metrics=True)
+    with patch("movie_recommender_agent.main._telemetry", telemetry):
+        stream = await handler([{"role": "user", "content": "Nolan films"}])
+        assert 'span="handler"' not in telemetry.metrics.render()
+        await _collect(stream)
+
+    metrics = telemetry.metrics.render()
+    assert 'agent_span_seconds_count{span="handler"} 1' in metrics
+    assert f'agent_payload_bytes_total{{span="handler",kind="response"}} {len(REPORT)}' in metrics
+
+
+@pytest.mark.asyncio
+async def test_coalesced_stream_receives_whole_report(streaming_agent):
+    """Test that a request joining an in-flight stream gets the finished text without a second run."""
+    messages = [{"role": "user", "content": "Nolan films"}]
+    first, second = await asyncio.gather(handler(messages), handler(messages))
+    leader, follower = await asyncio.gather(_collect(first), _collect(second))
+
+    assert StreamingAgent.runs == 1
+    assert [chunk for chunk in follower if chunk] == [REPORT]
+    assert leader[-1].content == follower[-1].content == REPORT
+
+
+@pytest.mark.asyncio
+async def test_run_error_event_raises():
+    """Test that an error event from the model aborts the stream."""
+
+    class FailingAgent:
+        async def arun(self, messages, stream=False, user_id=None):
+            yield SimpleNamespace(event="RunContent", content="partial")
+            yield SimpleNamespace(event="RunError", content="rate limited")
+
+    with pytest.raises(RuntimeError, match="rate limited"):
+        await _collect(agent_deltas(FailingAgent(), []))
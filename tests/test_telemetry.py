@@ -0,0 +1,94 @@
+import asyncio
+import json
+import urllib.request
+
+import pytest
+
+from movie_recommender_agent.telemetry import MetricsServer, Telemetry
+
+
+def _traces(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def _spans(trace):
+    return trace["resourceSpans"][0]["scopeSpans"][0]["spans"]
+
+
+def test_sampled_trace_is_exported_as_otlp_json(tmp_path):
+    """Nested spans share the trace id, link to their parent and are written once the request ends."""
+    telemetry = Telemetry()
+    telemetry.configure(str(tmp_path / "spans.jsonl"), sample_rate=1.0)
+
+    with telemetry.span("handler", request_bytes=120), telemetry.span("agent.run", route="premium") as run:
+        run.set(input_tokens=900, output_tokens=300)
+    with pytest.raises(RuntimeError), telemetry.span("handler"):
+        raise RuntimeError("boom")
+    telemetry.close()
+
+    first, failed = _traces(tmp_path / "spans.jsonl")
+    run, handler = _spans(first)
+    assert (run["name"], handler["name"]) == ("agent.run", "handler")
+    assert run["traceId"] == handler["traceId"]
+    assert run["parentSpanId"] == handler["spanId"]
+    assert "parentSpanId" not in handler
+    assert {"key": "input_tokens", "value": {"intValue": "900"}} in run["attributes"]
+    assert _spans(failed)[0]["status"] == {"code": 2, "message": "RuntimeError: boom"}
+
+
+def test_unsampled_requests_still_feed_metrics(tmp_path):
+    """With sampling off nothing is exported, but durations, tokens and payloads are counted."""
+    telemetry = Telemetry()
+    telemetry.configure(str(tmp_path / "spans.jsonl"), sample_rate=0.0)
+
+    for _ in range(3):
+        with telemetry.span("agent.run", route="fast") as run:
+            run.set(input_tokens=100, response_bytes=2048, pool_wait_seconds=0.002)
+
+    metrics = telemetry.metrics.render({"worker": "0"})
+    assert not (tmp_path / "spans.jsonl").exists()
+    assert 'agent_span_seconds_count{span="agent.run",worker="0"} 3' in metrics
+    assert 'agent_tokens_total{span="agent.run",kind="input",worker="0"} 300' in metrics
+    assert 'agent_payload_bytes_total{span="agent.run",kind="response",worker="0"} 6144' in metrics
+    assert 'agent_phase_seconds_bucket{span="agent.run",phase="pool_wait",worker="0",le="0.005"} 3' in metrics
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        telemetry.configure("stdout", sample_rate=2.0)
+
+
+def test_tool_hook_spans_tool_calls_inside_the_run():
+    """Each tool call is a child span with payload sizes; its time is added to the enclosing run."""
+    telemetry = Telemetry()
+    telemetry.configure(metrics=True)
+
+    async def search_movies(query):
+        await asyncio.sleep(0.01)
+        return f"results for {query}"
+
+    async def run():
+        with telemetry.span("agent.run") as span:
+            result = await telemetry.tool_hook("search_movies", search_movies, {"query": "heist"})
+        return span, result
+
+    span, result = asyncio.run(run())
+    assert result == "results for heist"
+    assert span.attributes["tool_seconds"] >= 0.01
+    assert 'agent_payload_bytes_total{span="tool.search_movies",kind="result"} 17' in telemetry.metrics.render()
+
+
+def test_metrics_endpoint_serves_prometheus_text():
+    """GET /metrics returns the registry in the Prometheus text format; other paths are 404."""
+    telemetry = Telemetry()
+    telemetry.configure(metrics=True)
+    with telemetry.span("handler"):
+        pass
+    server = MetricsServer(telemetry, port=0)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics") as response:
+            body = response.read().decode()
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE agent_span_seconds histogram" in body
+        assert 'agent_span_seconds_count{span="handler"} 1' in body
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"http://127.0.0.1:{server.port}/")
+    finally:
+        server.close()
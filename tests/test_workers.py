@@ -0,0 +1,46 @@
+import os
+import signal
+import time
+
+from movie_recommender_agent.workers import WorkerSupervisor, bind_socket, deployment_address
+
+
+def _wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_deployment_address_from_config():
+    """Test that the worker socket binds to the configured deployment URL."""
+    assert deployment_address({"deployment": {"url": "http://10.0.0.5:8080"}}) == ("10.0.0.5", 8080)
+    assert deployment_address({}) == ("127.0.0.1", 3773)
+
+
+def test_workers_share_one_listening_socket():
+    """Test that the socket is inheritable so forked workers can accept on it."""
+    sock = bind_socket("127.0.0.1", 0)
+    try:
+        assert sock.get_inheritable()
+        assert sock.getsockname()[1] > 0
+    finally:
+        sock.close()
+
+
+def test_supervisor_restarts_crashed_workers():
+    """Test that a killed worker is replaced and all workers stop on shutdown."""
+    supervisor = WorkerSupervisor(lambda: time.sleep(30), workers=2, min_uptime=0)
+    supervisor.start()
+    try:
+        assert len(supervisor.pids) == 2
+        crashed = next(iter(supervisor.pids))
+        os.kill(crashed, signal.SIGKILL)
+
+        _wait_for(lambda: supervisor.reap() or supervisor.restarts)
+        assert supervisor.restarts == 1
+        assert crashed not in supervisor.pids
+        assert len(supervisor.pids) == 2
+    finally:
+        supervisor.stop(timeout=5)
+
+    assert not supervisor.pids